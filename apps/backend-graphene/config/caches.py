@@ -0,0 +1,11 @@
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+# 프로세스마다 따로 있는 backend. 다른 worker가 쓴 값이나 무효화를 볼 수 없다.
+PROCESS_LOCAL_BACKENDS = (LocMemCache, DummyCache)
+
+
+def is_shared_cache(alias=DEFAULT_CACHE_ALIAS):
+    """모든 worker가 같은 저장소를 보는 cache(Redis, Memcached 등)인지 확인한다."""
+    return not isinstance(caches[alias], PROCESS_LOCAL_BACKENDS)
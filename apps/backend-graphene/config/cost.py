@@ -0,0 +1,158 @@
+from django.conf import settings
+from graphene_django.settings import graphene_settings
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    InlineFragmentNode,
+    IntValueNode,
+    OperationType,
+    VariableNode,
+    get_named_type,
+    get_nullable_type,
+    is_composite_type,
+    is_list_type,
+)
+
+from config.pagination import is_connection_type
+
+DEFAULT_MAX_COST = 10000
+DEFAULT_LIST_MULTIPLIER = 10
+
+
+def get_cost_settings():
+    graphene = settings.GRAPHENE
+    return {
+        "max_cost": graphene.get("QUERY_COST_MAX", DEFAULT_MAX_COST),
+        "weights": graphene.get("QUERY_COST_WEIGHTS", {}),
+        "list_multipliers": graphene.get("QUERY_COST_LIST_MULTIPLIERS", {}),
+        "default_list_multiplier": graphene.get(
+            "QUERY_COST_DEFAULT_LIST_MULTIPLIER", DEFAULT_LIST_MULTIPLIER
+        ),
+        # first가 없거나 null인 connection은 최대 페이지 크기만큼 반환한다.
+        "max_first": graphene_settings.RELAY_CONNECTION_MAX_LIMIT,
+    }
+
+
+def calculate_cost(schema, document, operation, cost_settings=None, variables=None):
+    """operation이 실행될 때 resolve될 객체 수를 정적으로 추정한다.
+
+    필드 비용 = 배수 × (가중치 + 하위 selection 비용)
+    - 가중치: "Type.field" 또는 반환 타입 이름으로 설정, 기본은 객체 1 / 스칼라 0
+    - 배수: 목록 필드와 Relay connection 필드에 적용(connection의 edges는 1).
+      ``first`` 인자가 있으면 그 값(변수면 variables의 값)을 RELAY_CONNECTION_MAX_LIMIT
+      까지 쓰고, 값이 null이거나 정수가 아니면 그 최대값을 쓴다. ``first``가
+      없으면 "Type.field"별 설정값이나 기본 배수를 쓴다.
+    introspection 필드(``__schema`` 등)는 비용에 포함하지 않는다.
+    """
+    cost_settings = cost_settings or get_cost_settings()
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    root_type = {
+        OperationType.QUERY: schema.query_type,
+        OperationType.MUTATION: schema.mutation_type,
+        OperationType.SUBSCRIPTION: schema.subscription_type,
+    }[operation.operation]
+    if root_type is None:
+        return 0
+    config = {**cost_settings, "variables": variables or {}}
+    return _selection_set_cost(
+        schema, operation.selection_set, root_type, fragments, config, set()
+    )
+
+
+def _selection_set_cost(schema, selection_set, parent_type, fragments, config, seen):
+    cost = 0
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            cost += _field_cost(schema, selection, parent_type, fragments, config, seen)
+        elif isinstance(selection, InlineFragmentNode):
+            type_condition = selection.type_condition
+            fragment_type = (
+                schema.get_type(type_condition.name.value)
+                if type_condition
+                else parent_type
+            )
+            cost += _selection_set_cost(
+                schema, selection.selection_set, fragment_type, fragments, config, seen
+            )
+        elif isinstance(selection, FragmentSpreadNode):
+            name = selection.name.value
+            fragment = fragments.get(name)
+            if fragment is None or name in seen:
+                continue
+            cost += _selection_set_cost(
+                schema,
+                fragment.selection_set,
+                schema.get_type(fragment.type_condition.name.value),
+                fragments,
+                config,
+                seen | {name},
+            )
+    return cost
+
+
+def _field_cost(schema, node, parent_type, fragments, config, seen):
+    name = node.name.value
+    fields = getattr(parent_type, "fields", None)
+    if name.startswith("__") or not fields or name not in fields:
+        return 0
+
+    key = f"{parent_type.name}.{name}"
+    field_type = fields[name].type
+    named_type = get_named_type(field_type)
+    default_weight = 1 if is_composite_type(named_type) else 0
+    weight = config["weights"].get(
+        key, config["weights"].get(named_type.name, default_weight)
+    )
+
+    child_cost = 0
+    if node.selection_set is not None:
+        child_cost = _selection_set_cost(
+            schema, node.selection_set, named_type, fragments, config, seen
+        )
+
+    multiplier = 1
+    if is_connection_type(named_type):
+        multiplier = _list_multiplier(node, key, config)
+    elif is_list_type(get_nullable_type(field_type)) and not is_connection_type(
+        parent_type
+    ):
+        multiplier = _list_multiplier(node, key, config)
+    return multiplier * (weight + child_cost)
+
+
+def _list_multiplier(node, key, config):
+    for argument in node.arguments or ():
+        if argument.name.value != "first":
+            continue
+        value = argument.value
+        if isinstance(value, IntValueNode):
+            value = int(value.value)
+        elif isinstance(value, VariableNode):
+            value = config["variables"].get(value.name.value)
+        if not isinstance(value, int) or isinstance(value, bool):
+            return config["max_first"]
+        # 최대값을 넘는 first는 pagination에서 거부되므로 최대값까지만 센다.
+        return min(max(value, 0), config["max_first"])
+    return config["list_multipliers"].get(key, config["default_list_multiplier"])
+
+
+def cost_exceeded_error(cost, operation, cost_settings):
+    """cost가 QUERY_COST_MAX를 넘으면 QUERY_COST_EXCEEDED 오류를, 아니면 None."""
+    max_cost = cost_settings["max_cost"]
+    if cost <= max_cost:
+        return None
+    return GraphQLError(
+        f"쿼리 비용({cost})이 허용치({max_cost})를 초과합니다.",
+        operation,
+        extensions={
+            "code": "QUERY_COST_EXCEEDED",
+            "cost": cost,
+            "maxCost": max_cost,
+        },
+    )
@@ -0,0 +1,109 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from graphql import parse
+from graphql.validation import validate
+
+from config.cost import calculate_cost
+
+# 문서 하나에 보관할 (operation, 변수 값)별 비용의 최대 개수
+MAX_COSTS_PER_DOCUMENT = 64
+
+
+def document_hash(query):
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def cache_key(schema, query, validation_rules=None, max_errors=None):
+    rules = tuple(validation_rules) if validation_rules is not None else None
+    return (document_hash(query), schema, rules, max_errors)
+
+
+class DocumentCache:
+    """파싱된 AST와 검증 결과를 캐싱하는 LRU.
+
+    SPA가 보내는 문서 종류는 한정적이므로, 같은 문서를 매 요청마다
+    parse/validate하지 않도록 프로세스 단위로 결과를 재사용한다.
+    검증 결과는 schema, 검증 규칙, max_errors에 따라 달라지므로 쿼리 해시와
+    함께 모두 key에 넣는다. 파싱에 실패한 문서는 캐싱하지 않는다.
+    항목의 costs dict에는 operation별 쿼리 비용을 보관한다 (operation_cost).
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, schema, query, validation_rules=None, max_errors=None):
+        """(document, validation_errors, costs)를 반환한다.
+
+        파싱 실패 시 예외를 던진다.
+        """
+        key = cache_key(schema, query, validation_rules, max_errors)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        document = parse(query)
+        validation_errors = validate(schema, document, validation_rules, max_errors)
+        entry = (document, validation_errors, {})
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def info(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+document_cache = DocumentCache(
+    maxsize=settings.GRAPHENE.get("DOCUMENT_CACHE_SIZE", 128),
+)
+
+
+def operation_cost(costs, schema, document, operation_ast, cost_settings, variables):
+    """문서 캐시 항목의 costs에 operation 비용을 계산해 두고 재사용한다.
+
+    비용은 ``first``에 넘긴 변수 값에 따라 달라지므로 operation에 선언된 정수
+    변수의 값까지 key에 넣는다. operation_ast는 캐시된 document의 노드이므로
+    항목이 살아 있는 동안 id가 바뀌지 않는다.
+    """
+    variables = variables or {}
+    values = []
+    for definition in operation_ast.variable_definitions or ():
+        name = definition.variable.name.value
+        value = variables.get(name)
+        if isinstance(value, int):
+            values.append((name, value))
+    key = (id(operation_ast), tuple(values))
+    cost = costs.get(key)
+    if cost is None:
+        if len(costs) >= MAX_COSTS_PER_DOCUMENT:
+            costs.clear()
+        cost = costs[key] = calculate_cost(
+            schema, document, operation_ast, cost_settings, variables
+        )
+    return cost
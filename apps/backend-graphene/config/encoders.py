@@ -0,0 +1,149 @@
+import datetime
+import decimal
+import json
+import uuid
+from collections import deque
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.functional import Promise
+from django.utils.module_loading import import_string
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+DEFAULT_RESPONSE_ENCODER = "config.encoders.JSONResponseEncoder"
+DEFAULT_STREAM_MIN_ITEMS = 1000
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# 스트리밍할 때 한 번에 직렬화할 목록 원소 수
+LIST_BATCH_SIZE = 100
+
+
+def get_response_encoder():
+    """GRAPHENE["RESPONSE_ENCODER"]에 지정된 응답 encoder 인스턴스를 반환한다."""
+    path = settings.GRAPHENE.get("RESPONSE_ENCODER", DEFAULT_RESPONSE_ENCODER)
+    return import_string(path)()
+
+
+def encode_default(value):
+    """json 모듈이 모르는 타입의 fast path. GraphQL 스칼라가 반환하는 타입만 다룬다."""
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID, Promise)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JSONResponseEncoder:
+    """GraphQL 응답 dict를 JSON bytes로 직렬화한다 (표준 라이브러리 json).
+
+    - C 구현 encoder를 쓰고, 한글 메시지를 \\uXXXX로 늘리지 않도록
+      ensure_ascii=False로 UTF-8 bytes를 만든다.
+    - 원소가 RESPONSE_STREAM_MIN_ITEMS개 이상인 목록이 있으면 iter_encode로
+      RESPONSE_CHUNK_SIZE 단위 chunk를 만들어 큰 중간 문자열 없이 응답한다.
+    """
+
+    def __init__(self):
+        graphene = settings.GRAPHENE
+        self.stream_min_items = graphene.get(
+            "RESPONSE_STREAM_MIN_ITEMS", DEFAULT_STREAM_MIN_ITEMS
+        )
+        self.chunk_size = graphene.get("RESPONSE_CHUNK_SIZE", DEFAULT_CHUNK_SIZE)
+        self._encoder = json.JSONEncoder(
+            ensure_ascii=False, separators=(",", ":"), default=encode_default
+        )
+
+    def dumps(self, value):
+        return self._encoder.encode(value).encode()
+
+    def encode(self, data, pretty=False):
+        if pretty:
+            return json.dumps(
+                data,
+                sort_keys=True,
+                indent=2,
+                separators=(",", ": "),
+                ensure_ascii=False,
+                default=encode_default,
+            ).encode()
+        return self.dumps(data)
+
+    def should_stream(self, data):
+        """큰 목록이 있는지 얕은 곳부터 찾는다. 스칼라는 방문하지 않는다."""
+        if self.stream_min_items is None:
+            return False
+        queue = deque([data])
+        while queue:
+            value = queue.popleft()
+            if isinstance(value, dict):
+                values = value.values()
+            elif isinstance(value, list):
+                if len(value) >= self.stream_min_items:
+                    return True
+                values = value
+            else:
+                continue
+            queue.extend(v for v in values if isinstance(v, (dict, list)))
+        return False
+
+    def iter_encode(self, data):
+        buffer = []
+        size = 0
+        for piece in self._iter_pieces(data):
+            buffer.append(piece)
+            size += len(piece)
+            if size >= self.chunk_size:
+                yield b"".join(buffer)
+                buffer = []
+                size = 0
+        if buffer:
+            yield b"".join(buffer)
+
+    def _iter_pieces(self, value):
+        if isinstance(value, dict):
+            yield b"{"
+            for index, (key, item) in enumerate(value.items()):
+                yield (b"," if index else b"") + self.dumps(str(key)) + b":"
+                yield from self._iter_pieces(item)
+            yield b"}"
+        elif isinstance(value, list) and len(value) >= self.stream_min_items:
+            yield b"["
+            for start in range(0, len(value), LIST_BATCH_SIZE):
+                # 원소 묶음을 한 번에 직렬화하고 바깥 대괄호만 떼어 이어 붙인다.
+                batch = self.dumps(value[start : start + LIST_BATCH_SIZE])[1:-1]
+                yield (b"," if start else b"") + batch
+            yield b"]"
+        elif isinstance(value, list):
+            yield b"["
+            for index, item in enumerate(value):
+                if index:
+                    yield b","
+                yield from self._iter_pieces(item)
+            yield b"]"
+        else:
+            yield self.dumps(value)
+
+
+class OrjsonResponseEncoder(JSONResponseEncoder):
+    """orjson으로 직렬화하는 encoder. orjson이 설치되어 있어야 한다."""
+
+    def __init__(self):
+        if orjson is None:
+            raise ImproperlyConfigured(
+                "OrjsonResponseEncoder를 쓰려면 orjson을 설치해야 합니다."
+            )
+        super().__init__()
+
+    def dumps(self, value):
+        return orjson.dumps(value, default=encode_default)
+
+    def encode(self, data, pretty=False):
+        if pretty:
+            return orjson.dumps(
+                data,
+                default=encode_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
+            )
+        return self.dumps(data)
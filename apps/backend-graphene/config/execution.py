@@ -0,0 +1,47 @@
+import asyncio
+import inspect
+
+from django.db.models import QuerySet
+
+
+def is_async_execution():
+    """현재 스레드에서 이벤트 루프가 돌고 있는지 확인한다.
+
+    AsyncTaskFlowGraphQLView로 실행 중이면 True이며, 이때 resolver는 sync ORM을
+    쓸 수 없으므로(SynchronousOnlyOperation) async ORM과 awaitable을 써야 한다.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+async def maybe_await(value):
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+async def resolve_async(value):
+    """resolver 결과를 await하고, 평가되지 않은 QuerySet은 async로 평가한다."""
+    value = await maybe_await(value)
+    if isinstance(value, QuerySet):
+        if value._result_cache is not None:
+            return list(value)
+        return [obj async for obj in value]
+    return value
+
+
+class AsyncQuerySetMiddleware:
+    """async 실행에서 resolver가 반환한 QuerySet이 이벤트 루프를 막지 않게 한다.
+
+    graphql-core는 목록 결과를 sync로 순회하므로, QuerySet을 그대로 넘기면
+    이벤트 루프 안에서 sync 쿼리가 실행된다.
+    """
+
+    def resolve(self, next, root, info, **args):
+        result = next(root, info, **args)
+        if inspect.isawaitable(result) or isinstance(result, QuerySet):
+            return resolve_async(result)
+        return result
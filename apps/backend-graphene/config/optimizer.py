@@ -0,0 +1,137 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from graphene.utils.str_converters import to_snake_case
+from graphql import (
+    FieldNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    get_named_type,
+)
+
+from config.pagination import is_connection_type
+
+
+def optimize_queryset(queryset, info, fields=()):
+    """요청된 selection set에 맞춰 queryset에 only/select_related/prefetch를 적용한다.
+
+    - 일반 모델 필드는 only()로 요청된 컬럼만 조회한다.
+    - FK/1:1 필드는 select_related로 JOIN하고, 하위 selection도 only()로 좁힌다.
+    - DjangoObjectType의 ``optimizer_hints``({graphql 필드: reverse accessor})에
+      등록된 목록 필드는 최적화된 queryset을 가진 Prefetch로 미리 불러온다.
+    - 모델 필드가 아닌 graphql 필드는 ``optimizer_columns``({graphql 필드: 컬럼
+      목록})에 등록한 컬럼을 only()에 넣는다.
+    - Relay connection을 반환하는 필드는 ``edges { node }``의 selection을 쓴다.
+    ``fields``는 selection과 상관없이 항상 조회할 컬럼(예: cursor 정렬 키)이다.
+    """
+    graphql_type = get_named_type(info.return_type)
+    selections = _collect_fields(info, info.field_nodes)
+    if is_connection_type(graphql_type):
+        graphql_type, selections = _connection_node(info, graphql_type, selections)
+    select_related, only, prefetches = _plan(
+        info, graphql_type, queryset.model, selections
+    )
+    return _apply(queryset, select_related, [*only, *fields], prefetches)
+
+
+def is_prefetched(instance, accessor):
+    """prefetch_related로 이미 불러온 reverse 관계인지 확인한다."""
+    return accessor in getattr(instance, "_prefetched_objects_cache", {})
+
+
+def _connection_node(info, connection_type, selections):
+    edge_type = get_named_type(connection_type.fields["edges"].type)
+    node_type = get_named_type(edge_type.fields["node"].type)
+    edge_selections = _collect_fields(info, selections.get("edges", []))
+    return node_type, _collect_fields(info, edge_selections.get("node", []))
+
+
+def _apply(queryset, select_related, only, prefetches):
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetches:
+        queryset = queryset.prefetch_related(*prefetches)
+    return queryset.only(*only)
+
+
+def _collect_fields(info, field_nodes):
+    """field_nodes의 하위 selection을 필드 이름별로 모은다. fragment는 펼친다."""
+    fields = {}
+
+    def collect(selection_set):
+        if selection_set is None:
+            return
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                fields.setdefault(selection.name.value, []).append(selection)
+            elif isinstance(selection, FragmentSpreadNode):
+                collect(info.fragments[selection.name.value].selection_set)
+            elif isinstance(selection, InlineFragmentNode):
+                collect(selection.selection_set)
+
+    for field_node in field_nodes:
+        collect(field_node.selection_set)
+    return fields
+
+
+def _plan(info, graphql_type, model, selections, prefix=""):
+    graphene_type = getattr(graphql_type, "graphene_type", None)
+    hints = getattr(graphene_type, "optimizer_hints", {})
+    columns = getattr(graphene_type, "optimizer_columns", {})
+
+    select_related = []
+    only = [f"{prefix}{model._meta.pk.name}"]
+    prefetches = []
+
+    for name, field_nodes in selections.items():
+        if name.startswith("__") or name not in graphql_type.fields:
+            continue
+        field_name = to_snake_case(name)
+        sub_type = get_named_type(graphql_type.fields[name].type)
+        sub_selections = _collect_fields(info, field_nodes)
+
+        if field_name in hints:
+            accessor = hints[field_name]
+            relation = model._meta.get_field(accessor)
+            sub_select, sub_only, sub_prefetches = _plan(
+                info, sub_type, relation.related_model, sub_selections
+            )
+            # prefetch 결과를 부모 객체에 매칭하기 위해 역방향 FK 컬럼이 필요하다.
+            sub_only.append(relation.field.attname)
+            queryset = _apply(
+                relation.related_model.objects.all(),
+                sub_select,
+                sub_only,
+                sub_prefetches,
+            )
+            prefetches.append(Prefetch(f"{prefix}{accessor}", queryset=queryset))
+            continue
+
+        if field_name in columns:
+            only.extend(f"{prefix}{column}" for column in columns[field_name])
+            continue
+
+        try:
+            model_field = model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            continue
+
+        if model_field.many_to_one or model_field.one_to_one:
+            if not model_field.concrete:
+                continue
+            path = f"{prefix}{field_name}"
+            sub_select, sub_only, sub_prefetches = _plan(
+                info,
+                sub_type,
+                model_field.related_model,
+                sub_selections,
+                prefix=f"{path}__",
+            )
+            select_related.append(path)
+            select_related.extend(sub_select)
+            only.append(path)
+            only.extend(sub_only)
+            prefetches.extend(sub_prefetches)
+        elif model_field.concrete and not model_field.is_relation:
+            only.append(f"{prefix}{field_name}")
+
+    return select_related, only, prefetches
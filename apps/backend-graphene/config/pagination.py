@@ -0,0 +1,210 @@
+import base64
+import binascii
+import json
+from collections import defaultdict
+
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
+from graphene.relay import PageInfo
+from graphene.utils.dataloader import DataLoader as AsyncDataLoader
+from graphene_django.settings import graphene_settings
+from graphql import GraphQLError
+from promise import Promise
+from promise.dataloader import DataLoader
+
+from config.execution import is_async_execution
+
+
+def is_connection_type(graphql_type):
+    """Relay connection 타입(edges, pageInfo 필드를 가진 객체 타입)인지 확인한다."""
+    fields = getattr(graphql_type, "fields", None) or {}
+    return "edges" in fields and "pageInfo" in fields
+
+
+def get_page_size(first):
+    max_limit = graphene_settings.RELAY_CONNECTION_MAX_LIMIT
+    if first is None:
+        return max_limit
+    if first < 0:
+        raise GraphQLError("first는 0 이상이어야 합니다.")
+    if first > max_limit:
+        raise GraphQLError(f"first는 {max_limit} 이하여야 합니다.")
+    return first
+
+
+def encode_cursor(instance, ordering):
+    values = []
+    for field_name in ordering:
+        value = getattr(instance, field_name)
+        values.append(value.isoformat() if hasattr(value, "isoformat") else value)
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor, model, ordering):
+    """cursor를 정렬 필드 값의 tuple로 되돌린다. 형식이 잘못되면 GraphQLError."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(ordering):
+            raise ValueError
+        return tuple(
+            model._meta.get_field(field_name).to_python(value)
+            for field_name, value in zip(ordering, values)
+        )
+    except (ValueError, TypeError, ValidationError, binascii.Error):
+        raise GraphQLError("잘못된 cursor입니다.")
+
+
+def keyset_filter(ordering, values):
+    """정렬 키가 values보다 뒤인 행을 고르는 조건.
+
+    (a, b) > (x, y)  ==  a > x OR (a = x AND b > y)
+    OFFSET과 달리 (정렬 키) 인덱스에서 바로 시작 위치를 찾으므로 페이지가
+    깊어져도 비용이 페이지 크기에 비례한다.
+    """
+    condition = Q()
+    for index, field_name in enumerate(ordering):
+        condition |= Q(
+            **{ordering[i]: values[i] for i in range(index)},
+            **{f"{field_name}__gt": values[index]},
+        )
+    return condition
+
+
+def build_connection(connection_type, rows, page_size, ordering, has_previous_page):
+    """page_size + 1개까지 조회한 rows로 connection 객체를 만든다."""
+    rows = list(rows)
+    has_next_page = len(rows) > page_size
+    edges = [
+        connection_type.Edge(node=row, cursor=encode_cursor(row, ordering))
+        for row in rows[:page_size]
+    ]
+    return connection_type(
+        edges=edges,
+        page_info=PageInfo(
+            has_next_page=has_next_page,
+            has_previous_page=has_previous_page,
+            start_cursor=edges[0].cursor if edges else None,
+            end_cursor=edges[-1].cursor if edges else None,
+        ),
+    )
+
+
+def connection_from_queryset(
+    queryset, connection_type, ordering, first, after, sort_fields=None, where=None
+):
+    """queryset을 ordering 기준 keyset 페이지로 잘라 connection으로 반환한다.
+
+    ordering의 마지막 필드는 unique(보통 id)여야 순서가 결정적이다.
+    sort_fields를 주면 ORDER BY와 keyset 조건은 ordering 대신 이 경로로 만든다.
+    ordering과 같은 값을 가지는 다른 테이블의 컬럼(비정규화된 정렬 키)을
+    가리켜 그 테이블의 인덱스 순서로 읽을 때 쓴다. cursor는 ordering으로 만든다.
+    where는 keyset 조건과 같은 filter()로 적용할 조건이다. 역방향 관계의
+    조건을 두 filter()로 나누면 JOIN이 두 번 생기므로 sort_fields와 함께 쓴다.
+    """
+    page_size = get_page_size(first)
+    sort_fields = sort_fields or ordering
+    condition = where or Q()
+    if after:
+        values = decode_cursor(after, queryset.model, ordering)
+        condition &= keyset_filter(sort_fields, values)
+    queryset = queryset.filter(condition).order_by(*sort_fields)
+    queryset = queryset[: page_size + 1]
+
+    if is_async_execution():
+        return _aconnection_from_queryset(
+            queryset, connection_type, page_size, ordering, bool(after)
+        )
+    return build_connection(connection_type, queryset, page_size, ordering, bool(after))
+
+
+async def _aconnection_from_queryset(
+    queryset, connection_type, page_size, ordering, has_previous_page
+):
+    rows = [row async for row in queryset]
+    return build_connection(
+        connection_type, rows, page_size, ordering, has_previous_page
+    )
+
+
+def connection_from_loader(loader, parent_id, connection_type, first, after):
+    """KeysetPageLoader로 부모별 페이지를 배치 조회해 connection으로 반환한다."""
+    page_size = get_page_size(first)
+    values = decode_cursor(after, loader.model, loader.ordering) if after else None
+
+    def build(rows):
+        return build_connection(
+            connection_type, rows, page_size, loader.ordering, bool(after)
+        )
+
+    result = loader.load((parent_id, page_size, values))
+    if isinstance(result, Promise):
+        return result.then(build)
+    return _abuild(result, build)
+
+
+async def _abuild(rows, build):
+    return build(await rows)
+
+
+class KeysetPageMixin:
+    """(parent_id, page_size, after 값) -> 해당 부모의 page_size + 1개 행
+
+    같은 (page_size, after)를 쓰는 부모들은 ROW_NUMBER() 윈도 함수로 한 번에
+    조회하므로, 부모가 여러 개여도 쿼리 수는 늘지 않는다.
+    하위 클래스는 model, parent_field(FK attname), ordering을 지정한다.
+    """
+
+    model = None
+    parent_field = None
+    ordering = None
+
+    def get_queryset(self):
+        return self.model.objects.all()
+
+    def get_page_querysets(self, keys):
+        groups = defaultdict(list)
+        for parent_id, page_size, values in keys:
+            groups[(page_size, values)].append(parent_id)
+
+        for (page_size, values), parent_ids in groups.items():
+            queryset = self.get_queryset().filter(
+                **{f"{self.parent_field}__in": parent_ids}
+            )
+            if values is not None:
+                queryset = queryset.filter(keyset_filter(self.ordering, values))
+            queryset = (
+                queryset.annotate(
+                    page_row_number=Window(
+                        RowNumber(),
+                        partition_by=F(self.parent_field),
+                        order_by=[F(field_name).asc() for field_name in self.ordering],
+                    )
+                )
+                .filter(page_row_number__lte=page_size + 1)
+                .order_by(self.parent_field, *self.ordering)
+            )
+            yield (page_size, values), queryset
+
+    def group_pages(self, keys, results):
+        pages = defaultdict(list)
+        for group, rows in results:
+            for row in rows:
+                pages[(getattr(row, self.parent_field), *group)].append(row)
+        return [pages[key] for key in keys]
+
+
+class AsyncKeysetPageLoader(KeysetPageMixin, AsyncDataLoader):
+    async def batch_load_fn(self, keys):
+        results = []
+        for group, queryset in self.get_page_querysets(keys):
+            results.append((group, [row async for row in queryset]))
+        return self.group_pages(keys, results)
+
+
+class KeysetPageLoader(KeysetPageMixin, DataLoader):
+    def batch_load_fn(self, keys):
+        results = [
+            (group, list(queryset)) for group, queryset in self.get_page_querysets(keys)
+        ]
+        return Promise.resolve(self.group_pages(keys, results))
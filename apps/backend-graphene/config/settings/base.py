@@ -48,6 +48,9 @@ INSTALLED_APPS = [
     "users",
     "organizations",
     "projects",
+    "persisted_queries",
+    "monitoring",
+    "outbox",
 ]
 
 AUTH_USER_MODEL = "users.CustomUser"
@@ -56,13 +59,47 @@ AUTH_USER_MODEL = "users.CustomUser"
 GRAPHENE = {
     "SCHEMA": "config.schema.schema",
     "ATOMIC_MUTATIONS": True,
+    # parse/validate 결과를 재사용할 GraphQL 문서 수 (LRU)
+    "DOCUMENT_CACHE_SIZE": 128,
+    # Automatic Persisted Queries: "cache" 또는 "database"
+    # ("database"는 register_persisted_queries로 등록한 문서만 테이블에 쓴다)
+    "PERSISTED_QUERIES_STORE": "cache",
+    "PERSISTED_QUERIES_CACHE_TIMEOUT": None,
+    # True면 등록된 hash의 문서만 실행한다 (클라이언트 자동 등록 불가)
+    "PERSISTED_QUERIES_ALLOWLIST_ONLY": False,
+    # 정적 쿼리 비용 분석 (config.cost): 비용이 QUERY_COST_MAX를 넘으면 거부한다.
+    # 가중치/배수 키는 "Type.field" 형식이며, 가중치는 타입 이름으로도 지정할 수 있다.
+    "QUERY_COST_MAX": 10000,
+    "QUERY_COST_DEFAULT_LIST_MULTIPLIER": 10,
+    "QUERY_COST_WEIGHTS": {},
+    "QUERY_COST_LIST_MULTIPLIERS": {
+        "Query.myOrganizations": 20,
+        "Query.projects": 50,
+        "OrganizationType.members": 50,
+        "ProjectType.members": 50,
+        "Query.myOrganizationsConnection": 20,
+        "Query.projectsConnection": 50,
+        "OrganizationType.membersConnection": 50,
+        "ProjectType.membersConnection": 50,
+    },
+    # 한 번의 POST로 보낼 수 있는 operation 배열의 최대 길이
+    "BATCH_MAX_OPERATIONS": 10,
+    # 응답 JSON encoder. orjson 설치 시 "config.encoders.OrjsonResponseEncoder"
+    "RESPONSE_ENCODER": "config.encoders.JSONResponseEncoder",
+    # 원소가 이 수 이상인 목록이 있으면 RESPONSE_CHUNK_SIZE 단위로 스트리밍한다.
+    "RESPONSE_STREAM_MIN_ITEMS": 1000,
+    "RESPONSE_CHUNK_SIZE": 64 * 1024,
+    # resolver 시간 측정(monitoring): 측정할 operation 비율. 0이면 끈다.
+    "RESOLVER_TIMING_SAMPLE_RATE": env.float(
+        "RESOLVER_TIMING_SAMPLE_RATE", default=0.0
+    ),
+    # 프로세스별 통계를 캐시에 올리는 간격(초)
+    "RESOLVER_TIMING_PUBLISH_INTERVAL": 10,
 }
 
 # DRF
 REST_FRAMEWORK = {
-    "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
-    ),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("users.authentication.JWTAuthentication",),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
@@ -80,11 +117,34 @@ SPECTACULAR_SETTINGS = {
     ],
 }
 
+# Authorization cache: (user, organization) 멤버십/역할 (0이면 캐시하지 않음)
+# 무효화가 모든 worker에 닿아야 하므로 공유 cache(CACHE_URL)를 설정했을 때만 켠다.
+AUTHORIZATION_CACHE_TIMEOUT = env.int("AUTHORIZATION_CACHE_TIMEOUT", default=0)
+
+# Authenticated user cache: JWT 미들웨어가 불러오는 사용자
+# (0이면 캐시하지 않고 request.user를 token claim으로 만든다. 행은 id 외의 필드에
+# 처음 접근할 때, mutation은 실행 전에 불러와 is_active/token_generation을 확인한다)
+# 무효화가 모든 worker에 닿아야 하므로 공유 cache(CACHE_URL)를 설정했을 때만 켠다.
+USER_CACHE_TIMEOUT = env.int("USER_CACHE_TIMEOUT", default=0)
+# 프로세스 로컬 LRU. 다른 프로세스의 무효화를 받지 못하므로 짧게 둔다.
+USER_CACHE_LOCAL_TIMEOUT = env.int("USER_CACHE_LOCAL_TIMEOUT", default=5)
+USER_CACHE_LOCAL_SIZE = env.int("USER_CACHE_LOCAL_SIZE", default=1024)
+
 # Email
 EMAIL_BACKEND = env(
     "EMAIL_BACKEND",
     default="django.core.mail.backends.console.EmailBackend",
 )
+# Email outbox: 실패한 메일은 EMAIL_OUTBOX_RETRY_DELAY초부터 두 배씩 늘려 재시도
+EMAIL_OUTBOX_MAX_ATTEMPTS = env.int("EMAIL_OUTBOX_MAX_ATTEMPTS", default=5)
+EMAIL_OUTBOX_RETRY_DELAY = env.int("EMAIL_OUTBOX_RETRY_DELAY", default=60)
+EMAIL_OUTBOX_RETRY_MAX_DELAY = env.int("EMAIL_OUTBOX_RETRY_MAX_DELAY", default=3600)
+# 발송하려고 잡은 메일을 다른 worker가 다시 잡지 않는 시간(초). worker가 죽으면
+# 이 시간이 지난 뒤 다시 보낸다.
+EMAIL_OUTBOX_CLAIM_TIMEOUT = env.int("EMAIL_OUTBOX_CLAIM_TIMEOUT", default=300)
+# 대량 발송: 연결 하나로 보낼 메일 수와 동시에 열 연결 수
+EMAIL_BULK_BATCH_SIZE = env.int("EMAIL_BULK_BATCH_SIZE", default=50)
+EMAIL_BULK_CONCURRENCY = env.int("EMAIL_BULK_CONCURRENCY", default=1)
 
 # Frontend URL (for email links)
 FRONTEND_URL = env("FRONTEND_URL", default="http://localhost:5173")
@@ -94,6 +154,9 @@ FRONTEND_RESET_PASSWORD_PATH = "/auth/reset-password"
 # Media files
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
+# 프로필 이미지 WebP 썸네일 크기(px). generate_profile_thumbnails가 만든다.
+PROFILE_THUMBNAIL_SIZES = (32, 64, 256)
+PROFILE_THUMBNAIL_QUALITY = env.int("PROFILE_THUMBNAIL_QUALITY", default=80)
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
@@ -131,6 +194,10 @@ WSGI_APPLICATION = "config.wsgi.application"
 
 DATABASES = {"default": env.db()}
 
+# Cache: 여러 worker가 함께 보려면 공유 backend를 지정한다.
+# 예) rediscache://localhost:6379/0, pymemcache://localhost:11211
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -178,4 +245,8 @@ SIMPLE_JWT = {
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
     "AUTH_HEADER_TYPES": ("Bearer",),
+    "TOKEN_REFRESH_SERIALIZER": "users.serializers.TokenRefreshSerializer",
 }
+# JWT 미들웨어가 검증한 access token을 exp까지 기억하는 프로세스 로컬 LRU 크기
+# (0이면 요청마다 서명을 검증한다)
+JWT_VERIFIED_TOKEN_CACHE_SIZE = env.int("JWT_VERIFIED_TOKEN_CACHE_SIZE", default=4096)
@@ -0,0 +1,201 @@
+import json
+
+import pytest
+from django.urls import reverse
+
+from conftest import make_auth_client
+from organizations.models import OrganizationMembership, Role
+from organizations.tests.factories import OrganizationFactory
+from projects.models import ProjectMembership
+from projects.tests.factories import ProjectFactory
+
+ASYNC_GRAPHQL_URL = reverse("graphql-async")
+
+ME_QUERY = """
+    query {
+        me {
+            id
+            email
+        }
+    }
+"""
+
+MY_ORGANIZATIONS_QUERY = """
+    query {
+        myOrganizations {
+            id
+            name
+            createdBy {
+                id
+            }
+            members {
+                role
+                user {
+                    email
+                }
+            }
+        }
+    }
+"""
+
+PROJECTS_QUERY = """
+    query Projects($organizationId: ID!) {
+        projects(organizationId: $organizationId) {
+            id
+            name
+            organization {
+                id
+            }
+            members {
+                user {
+                    id
+                }
+            }
+        }
+    }
+"""
+
+PROJECT_QUERY = """
+    query Project($id: ID!) {
+        project(id: $id) {
+            id
+            name
+        }
+    }
+"""
+
+MY_ORGANIZATIONS_CONNECTION_QUERY = """
+    query {
+        myOrganizationsConnection(first: 10) {
+            edges {
+                node {
+                    id
+                    membersConnection(first: 1) {
+                        edges {
+                            node {
+                                role
+                            }
+                        }
+                        pageInfo {
+                            hasNextPage
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
+CREATE_ORGANIZATION_MUTATION = """
+    mutation CreateOrganization($input: CreateOrganizationInput!) {
+        createOrganization(input: $input) {
+            organization {
+                id
+                name
+            }
+        }
+    }
+"""
+
+
+def post(client, query, variables=None):
+    return client.post(
+        ASYNC_GRAPHQL_URL,
+        json.dumps({"query": query, "variables": variables or {}}),
+        content_type="application/json",
+    )
+
+
+@pytest.fixture
+def organization(verified_user):
+    org = OrganizationFactory(created_by=verified_user)
+    OrganizationMembership.objects.create(
+        organization=org, user=verified_user, role=Role.OWNER
+    )
+    return org
+
+
+@pytest.mark.django_db(transaction=True)
+class TestAsyncGraphQLView:
+    def test_me(self, auth_client, verified_user):
+        response = post(auth_client, ME_QUERY)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "errors" not in data
+        assert data["data"]["me"]["email"] == verified_user.email
+
+    def test_anonymous_me_returns_error(self, api_client):
+        response = post(api_client, ME_QUERY)
+
+        data = response.json()
+        assert data["data"]["me"] is None
+        assert data["errors"][0]["message"] == "로그인이 필요합니다."
+
+    def test_my_organizations_with_members(self, auth_client, organization):
+        response = post(auth_client, MY_ORGANIZATIONS_QUERY)
+
+        data = response.json()
+        assert "errors" not in data
+        [org] = data["data"]["myOrganizations"]
+        assert org["id"] == str(organization.id)
+        assert org["members"][0]["role"] == "OWNER"
+        assert "cost" in data["extensions"]
+
+    def test_connections(self, auth_client, user_factory, organization):
+        OrganizationMembership.objects.create(
+            organization=organization, user=user_factory(), role=Role.MEMBER
+        )
+
+        response = post(auth_client, MY_ORGANIZATIONS_CONNECTION_QUERY)
+
+        data = response.json()
+        assert "errors" not in data
+        [edge] = data["data"]["myOrganizationsConnection"]["edges"]
+        members = edge["node"]["membersConnection"]
+        assert members["edges"] == [{"node": {"role": "OWNER"}}]
+        assert members["pageInfo"]["hasNextPage"] is True
+
+    def test_projects_list(self, auth_client, verified_user, organization):
+        project = ProjectFactory(organization=organization, created_by=verified_user)
+        ProjectMembership.objects.create(
+            project=project, user=verified_user, added_by=verified_user
+        )
+
+        response = post(
+            auth_client, PROJECTS_QUERY, {"organizationId": str(organization.id)}
+        )
+
+        data = response.json()
+        assert "errors" not in data
+        [result] = data["data"]["projects"]
+        assert result["organization"]["id"] == str(organization.id)
+        assert result["members"][0]["user"]["id"] == str(verified_user.id)
+
+    def test_project_access_denied(self, user_factory, organization, verified_user):
+        project = ProjectFactory(organization=organization, created_by=verified_user)
+        outsider = user_factory(email_verified=True)
+
+        response = post(
+            make_auth_client(outsider), PROJECT_QUERY, {"id": str(project.id)}
+        )
+
+        data = response.json()
+        assert data["data"]["project"] is None
+        assert data["errors"][0]["message"] == "이 Organization의 멤버가 아닙니다."
+
+    def test_mutation_runs_on_sync_path(self, auth_client):
+        response = post(
+            auth_client,
+            CREATE_ORGANIZATION_MUTATION,
+            {"input": {"name": "Async Org"}},
+        )
+
+        data = response.json()
+        assert "errors" not in data
+        assert data["data"]["createOrganization"]["organization"]["name"] == "Async Org"
+
+    def test_rejects_unsupported_method(self, auth_client):
+        response = auth_client.put(ASYNC_GRAPHQL_URL)
+
+        assert response.status_code == 405
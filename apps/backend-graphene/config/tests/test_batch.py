@@ -0,0 +1,207 @@
+import json
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from organizations.models import OrganizationMembership, Role
+from organizations.tests.factories import OrganizationFactory
+
+GRAPHQL_URL = reverse("graphql")
+ASYNC_GRAPHQL_URL = reverse("graphql-async")
+
+ME_QUERY = "query { me { id email } }"
+
+MY_ORGANIZATIONS_QUERY = """
+    query {
+        myOrganizations {
+            id
+            members {
+                user {
+                    id
+                }
+            }
+        }
+    }
+"""
+
+# membersConnection은 DataLoader로 불러온다.
+MEMBER_ROLES_QUERY = """
+    query {
+        myOrganizationsConnection(first: 1) {
+            edges {
+                node {
+                    membersConnection(first: 10) {
+                        edges { node { role user { id } } }
+                    }
+                }
+            }
+        }
+    }
+"""
+
+UPDATE_MEMBER_ROLE = """
+    mutation UpdateMemberRole($input: UpdateMemberRoleInput!) {
+        updateMemberRole(input: $input) {
+            membership {
+                role
+            }
+        }
+    }
+"""
+
+PROJECTS_QUERY = """
+    query Projects($organizationId: ID!) {
+        projects(organizationId: $organizationId) {
+            id
+        }
+    }
+"""
+
+
+@pytest.fixture
+def organization(verified_user):
+    org = OrganizationFactory(created_by=verified_user)
+    OrganizationMembership.objects.create(
+        organization=org, user=verified_user, role=Role.OWNER
+    )
+    return org
+
+
+def page_load_batch(organization):
+    return [
+        {"query": ME_QUERY},
+        {"query": MY_ORGANIZATIONS_QUERY},
+        {
+            "query": PROJECTS_QUERY,
+            "variables": {"organizationId": str(organization.id)},
+        },
+    ]
+
+
+def post(client, body, url=GRAPHQL_URL):
+    return client.post(url, json.dumps(body), content_type="application/json")
+
+
+@pytest.mark.django_db
+class TestBatchedOperations:
+    def test_responses_in_request_order(self, auth_client, verified_user, organization):
+        response = post(auth_client, page_load_batch(organization))
+
+        assert response.status_code == 200
+        me, organizations, projects = response.json()
+        assert me["data"]["me"]["email"] == verified_user.email
+        assert organizations["data"]["myOrganizations"][0]["id"] == str(organization.id)
+        assert projects["data"]["projects"] == []
+
+    def test_single_operation_still_returns_object(self, auth_client):
+        response = post(auth_client, {"query": ME_QUERY})
+
+        assert isinstance(response.json(), dict)
+
+    def test_authenticates_once(self, auth_client, organization, settings):
+        # 사용자 캐시 없이 요청마다 사용자를 조회하는 조건에서 비교한다.
+        settings.USER_CACHE_TIMEOUT = 0
+        with CaptureQueriesContext(connection) as single:
+            post(auth_client, {"query": ME_QUERY})
+        with CaptureQueriesContext(connection) as batch:
+            post(auth_client, [{"query": ME_QUERY}, {"query": ME_QUERY}])
+
+        assert len(batch) == len(single)
+
+    def test_errors_are_per_operation(self, auth_client):
+        response = post(
+            auth_client, [{"query": ME_QUERY}, {"query": "query { unknownField }"}]
+        )
+
+        assert response.status_code == 400
+        ok, failed = response.json()
+        assert "errors" not in ok
+        assert failed["errors"]
+
+    def test_query_after_mutation_sees_changes(
+        self, auth_client, organization, user_factory
+    ):
+        member = user_factory()
+        OrganizationMembership.objects.create(
+            organization=organization, user=member, role=Role.MEMBER
+        )
+        update_role = {
+            "query": UPDATE_MEMBER_ROLE,
+            "variables": {
+                "input": {
+                    "organizationId": str(organization.id),
+                    "userId": str(member.id),
+                    "role": "admin",
+                }
+            },
+        }
+
+        response = post(
+            auth_client,
+            [
+                {"query": MEMBER_ROLES_QUERY},
+                update_role,
+                {"query": MEMBER_ROLES_QUERY},
+            ],
+        )
+
+        before, updated, after = response.json()
+        assert updated["data"]["updateMemberRole"]["membership"]["role"] == "ADMIN"
+
+        def member_role(result):
+            organization = result["data"]["myOrganizationsConnection"]["edges"][0]
+            members = organization["node"]["membersConnection"]["edges"]
+            return next(
+                m["node"]["role"]
+                for m in members
+                if m["node"]["user"]["id"] == str(member.id)
+            )
+
+        assert member_role(before) == "MEMBER"
+        assert member_role(after) == "ADMIN"
+
+    def test_cost_budget_applies_to_whole_batch(self, auth_client, settings):
+        # MY_ORGANIZATIONS_QUERY 하나의 비용은 20 × (1 + 50 × 2) = 2020
+        settings.GRAPHENE = {**settings.GRAPHENE, "QUERY_COST_MAX": 3000}
+
+        response = post(
+            auth_client,
+            [{"query": MY_ORGANIZATIONS_QUERY}, {"query": MY_ORGANIZATIONS_QUERY}],
+        )
+
+        first, second = response.json()
+        assert "errors" not in first
+        error = second["errors"][0]
+        assert error["extensions"]["code"] == "QUERY_COST_EXCEEDED"
+        assert error["extensions"]["cost"] == 2 * 2020
+
+    def test_empty_batch_rejected(self, auth_client):
+        response = post(auth_client, [])
+
+        assert response.status_code == 400
+
+    def test_batch_size_limited(self, auth_client, settings):
+        settings.GRAPHENE = {**settings.GRAPHENE, "BATCH_MAX_OPERATIONS": 2}
+
+        response = post(auth_client, [{"query": ME_QUERY}] * 3)
+
+        assert response.status_code == 400
+
+    def test_non_object_entry_rejected(self, auth_client):
+        response = post(auth_client, [{"query": ME_QUERY}, "me"])
+
+        assert response.status_code == 400
+
+
+@pytest.mark.django_db(transaction=True)
+class TestAsyncBatchedOperations:
+    def test_responses_in_request_order(self, auth_client, verified_user, organization):
+        response = post(auth_client, page_load_batch(organization), ASYNC_GRAPHQL_URL)
+
+        assert response.status_code == 200
+        me, organizations, projects = response.json()
+        assert me["data"]["me"]["email"] == verified_user.email
+        assert organizations["data"]["myOrganizations"][0]["members"]
+        assert projects["data"]["projects"] == []
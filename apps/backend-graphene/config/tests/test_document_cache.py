@@ -0,0 +1,98 @@
+import json
+
+import pytest
+from django.urls import reverse
+from graphql import build_schema
+
+from config.documents import DocumentCache, document_cache
+from config.schema import schema
+
+GRAPHQL_URL = reverse("graphql")
+
+
+class TestDocumentCache:
+    def test_reuses_parsed_document(self):
+        cache = DocumentCache(maxsize=2)
+        graphql_schema = schema.graphql_schema
+
+        first = cache.get(graphql_schema, "{ __typename }")
+        second = cache.get(graphql_schema, "{ __typename }")
+
+        assert first is second
+        assert cache.info() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 2}
+
+    def test_evicts_least_recently_used(self):
+        cache = DocumentCache(maxsize=2)
+        graphql_schema = schema.graphql_schema
+
+        cache.get(graphql_schema, "query A { __typename }")
+        cache.get(graphql_schema, "query B { __typename }")
+        cache.get(graphql_schema, "query A { __typename }")
+        cache.get(graphql_schema, "query C { __typename }")
+        cache.get(graphql_schema, "query A { __typename }")
+
+        assert cache.info()["size"] == 2
+        assert cache.hits == 2
+        cache.get(graphql_schema, "query B { __typename }")
+        assert cache.misses == 4
+
+    def test_caches_validation_errors(self):
+        cache = DocumentCache()
+        graphql_schema = schema.graphql_schema
+
+        _, errors, _ = cache.get(graphql_schema, "{ unknownField }")
+        _, cached_errors, _ = cache.get(graphql_schema, "{ unknownField }")
+
+        assert len(errors) == 1
+        assert cached_errors is errors
+
+    def test_validation_inputs_are_part_of_key(self):
+        cache = DocumentCache()
+        graphql_schema = schema.graphql_schema
+        query = "{ unknownField }"
+
+        _, errors, _ = cache.get(graphql_schema, query)
+        _, without_rules, _ = cache.get(graphql_schema, query, validation_rules=[])
+        other = build_schema("type Query { unknownField: Int }")
+        _, other_schema, _ = cache.get(other, query)
+        _, limited, _ = cache.get(graphql_schema, query, max_errors=1)
+
+        assert len(errors) == 1
+        assert without_rules == []
+        assert other_schema == []
+        assert limited is not errors
+        assert cache.info()["misses"] == 4
+
+    def test_parse_error_is_not_cached(self):
+        cache = DocumentCache()
+
+        with pytest.raises(Exception):
+            cache.get(schema.graphql_schema, "{ broken")
+
+        assert cache.info()["size"] == 0
+
+
+@pytest.mark.django_db
+class TestGraphQLViewDocumentCache:
+    def test_repeated_query_hits_cache(self, auth_client):
+        document_cache.clear()
+        body = json.dumps({"query": "query Me { me { id email } }"})
+
+        for _ in range(3):
+            response = auth_client.post(
+                GRAPHQL_URL, body, content_type="application/json"
+            )
+            assert "errors" not in response.json()
+
+        assert document_cache.info()["misses"] == 1
+        assert document_cache.info()["hits"] == 2
+
+    def test_cached_validation_errors_are_returned(self, auth_client):
+        body = json.dumps({"query": "{ me { unknownField } }"})
+
+        for _ in range(2):
+            response = auth_client.post(
+                GRAPHQL_URL, body, content_type="application/json"
+            )
+            assert response.status_code == 400
+            assert "unknownField" in response.json()["errors"][0]["message"]
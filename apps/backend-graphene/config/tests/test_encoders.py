@@ -0,0 +1,101 @@
+import datetime
+import decimal
+import json
+
+import pytest
+from django.urls import reverse
+
+from config.encoders import JSONResponseEncoder, OrjsonResponseEncoder, orjson
+from organizations.models import OrganizationMembership, Role
+from organizations.tests.factories import OrganizationFactory
+
+GRAPHQL_URL = reverse("graphql")
+
+RESPONSE = {
+    "data": {
+        "members": [{"id": str(i), "role": "MEMBER"} for i in range(250)],
+        "organization": {"name": "한글 조직", "createdAt": None},
+    },
+    "extensions": {"cost": {"requestedQueryCost": 3}},
+}
+
+
+@pytest.fixture
+def encoder(settings):
+    settings.GRAPHENE = {
+        **settings.GRAPHENE,
+        "RESPONSE_STREAM_MIN_ITEMS": 100,
+        "RESPONSE_CHUNK_SIZE": 1024,
+    }
+    return JSONResponseEncoder()
+
+
+class TestJSONResponseEncoder:
+    def test_encodes_compact_utf8(self, encoder):
+        content = encoder.encode({"message": "권한이 부족합니다."})
+
+        assert content == '{"message":"권한이 부족합니다."}'.encode()
+
+    def test_fast_path_types(self, encoder):
+        value = {
+            "at": datetime.datetime(2026, 1, 2, 3, 4, 5, 6, tzinfo=datetime.UTC),
+            "day": datetime.date(2026, 1, 2),
+            "amount": decimal.Decimal("1.50"),
+        }
+
+        assert json.loads(encoder.encode(value)) == {
+            "at": "2026-01-02T03:04:05.000006+00:00",
+            "day": "2026-01-02",
+            "amount": "1.50",
+        }
+
+    def test_unknown_type_raises(self, encoder):
+        with pytest.raises(TypeError):
+            encoder.encode({"value": object()})
+
+    def test_should_stream_only_large_lists(self, encoder):
+        assert encoder.should_stream(RESPONSE)
+        assert not encoder.should_stream({"data": {"members": [{}] * 99}})
+
+    def test_iter_encode_matches_encode(self, encoder):
+        chunks = list(encoder.iter_encode(RESPONSE))
+
+        assert len(chunks) > 1
+        assert json.loads(b"".join(chunks)) == RESPONSE
+
+
+@pytest.mark.skipif(orjson is None, reason="orjson이 설치되어 있지 않다")
+class TestOrjsonResponseEncoder:
+    def test_matches_json_encoder(self, encoder):
+        assert json.loads(OrjsonResponseEncoder().encode(RESPONSE)) == RESPONSE
+
+
+@pytest.mark.django_db
+class TestStreamingResponse:
+    def test_large_list_is_streamed(self, auth_client, verified_user, settings):
+        settings.GRAPHENE = {**settings.GRAPHENE, "RESPONSE_STREAM_MIN_ITEMS": 3}
+        for _ in range(3):
+            org = OrganizationFactory()
+            OrganizationMembership.objects.create(
+                organization=org, user=verified_user, role=Role.MEMBER
+            )
+
+        response = auth_client.post(
+            GRAPHQL_URL,
+            json.dumps({"query": "query { myOrganizations { id } }"}),
+            content_type="application/json",
+        )
+
+        assert response.streaming
+        data = json.loads(b"".join(response.streaming_content))
+        assert len(data["data"]["myOrganizations"]) == 3
+
+    def test_small_response_is_not_streamed(self, auth_client):
+        response = auth_client.post(
+            GRAPHQL_URL,
+            json.dumps({"query": "query { me { id } }"}),
+            content_type="application/json",
+        )
+
+        assert not response.streaming
+        assert response["Content-Type"] == "application/json"
@@ -0,0 +1,171 @@
+import json
+from unittest import mock
+
+import pytest
+from django.urls import reverse
+from graphql import get_operation_ast, parse
+
+from config.cost import calculate_cost, get_cost_settings
+from config.documents import document_cache
+from config.schema import schema
+
+GRAPHQL_URL = reverse("graphql")
+
+DASHBOARD_QUERY = """
+    query Dashboard {
+        myOrganizations {
+            name
+            members {
+                role
+                user { email }
+            }
+        }
+    }
+"""
+
+
+VARIABLE_FIRST_QUERY = """
+    query Organizations($first: Int) {
+        myOrganizationsConnection(first: $first) {
+            edges { node { id } }
+        }
+    }
+"""
+
+
+def cost_of(query, variables=None, **overrides):
+    document = parse(query)
+    cost_settings = {**get_cost_settings(), **overrides}
+    return calculate_cost(
+        schema.graphql_schema,
+        document,
+        get_operation_ast(document),
+        cost_settings,
+        variables,
+    )
+
+
+def post(client, query, **variables):
+    return client.post(
+        GRAPHQL_URL,
+        json.dumps({"query": query, "variables": variables}),
+        content_type="application/json",
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_document_cache():
+    document_cache.clear()
+
+
+class TestCalculateCost:
+    def test_scalar_fields_are_free(self):
+        assert cost_of("{ me { id email } }") == 1
+
+    def test_list_multipliers_apply_to_nested_lists(self):
+        # myOrganizations(20) × (1 + members(50) × (1 + user 1))
+        assert cost_of(DASHBOARD_QUERY) == 20 * (1 + 50 * 2)
+
+    def test_aliases_are_counted_separately(self):
+        query = """
+            {
+                a: myOrganizations { id }
+                b: myOrganizations { id }
+            }
+        """
+        assert cost_of(query) == 2 * 20
+
+    def test_fragments_are_expanded(self):
+        query = """
+            fragment Member on OrganizationMemberType { user { id } }
+            { myOrganizations { members { ...Member } } }
+        """
+        assert cost_of(query) == 20 * (1 + 50 * 2)
+
+    def test_configured_weights(self):
+        assert cost_of("{ me { id } }", weights={"UserType": 5}) == 5
+        assert cost_of("{ me { id } }", weights={"Query.me": 3}) == 3
+
+    def test_connections_use_first_as_multiplier(self):
+        query = """
+            {
+                myOrganizationsConnection(first: 5) {
+                    edges {
+                        node {
+                            membersConnection(first: 3) {
+                                edges { node { user { id } } }
+                            }
+                        }
+                    }
+                }
+            }
+        """
+        # connection × (1 + edges(1) × (1 + node(1 + ...)))
+        members = 3 * (1 + 1 + (1 + 1))
+        assert cost_of(query) == 5 * (1 + 1 + (1 + members))
+
+    def test_variable_first_uses_its_value(self):
+        # connection × (1 + edges(1) × node(1))
+        assert cost_of(VARIABLE_FIRST_QUERY, {"first": 5}) == 5 * 3
+
+    @pytest.mark.parametrize("variables", [None, {"first": None}, {"first": "5"}])
+    def test_unknown_first_assumes_connection_max(self, variables):
+        assert cost_of(VARIABLE_FIRST_QUERY, variables) == 100 * 3
+
+    def test_first_is_counted_up_to_connection_max(self):
+        assert cost_of(VARIABLE_FIRST_QUERY, {"first": 10**6}) == 100 * 3
+
+    def test_introspection_is_free(self):
+        assert cost_of("{ __schema { types { name fields { name } } } }") == 0
+
+
+@pytest.mark.django_db
+class TestQueryCostEndpoint:
+    def test_cost_is_reported_in_extensions(self, auth_client):
+        response = auth_client.post(
+            GRAPHQL_URL,
+            json.dumps({"query": DASHBOARD_QUERY}),
+            content_type="application/json",
+        )
+        data = response.json()
+        assert data["extensions"]["cost"] == {
+            "requestedQueryCost": 20 * (1 + 50 * 2),
+            "maximumAvailable": get_cost_settings()["max_cost"],
+        }
+
+    def test_over_budget_operation_is_rejected(self, auth_client, settings):
+        settings.GRAPHENE = {**settings.GRAPHENE, "QUERY_COST_MAX": 1000}
+
+        response = auth_client.post(
+            GRAPHQL_URL,
+            json.dumps({"query": DASHBOARD_QUERY}),
+            content_type="application/json",
+        )
+        assert response.status_code == 400
+        data = response.json()
+        assert "data" not in data
+        error = data["errors"][0]
+        assert error["extensions"]["code"] == "QUERY_COST_EXCEEDED"
+        assert error["extensions"]["cost"] == 20 * (1 + 50 * 2)
+
+    def test_variable_first_cannot_bypass_budget(self, auth_client, settings):
+        settings.GRAPHENE = {**settings.GRAPHENE, "QUERY_COST_MAX": 100}
+
+        assert post(auth_client, VARIABLE_FIRST_QUERY, first=5).status_code == 200
+        response = post(auth_client, VARIABLE_FIRST_QUERY)
+
+        assert response.status_code == 400
+        error = response.json()["errors"][0]
+        assert error["extensions"]["code"] == "QUERY_COST_EXCEEDED"
+        assert error["extensions"]["cost"] == 100 * 3
+
+    def test_cost_is_cached_with_document(self, auth_client):
+        with mock.patch(
+            "config.documents.calculate_cost", side_effect=calculate_cost
+        ) as calculate:
+            for _ in range(3):
+                post(auth_client, VARIABLE_FIRST_QUERY, first=5)
+            post(auth_client, VARIABLE_FIRST_QUERY, first=7)
+
+        # 변수 값이 다를 때만 다시 계산한다.
+        assert calculate.call_count == 2
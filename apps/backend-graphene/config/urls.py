@@ -1,19 +1,29 @@
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
-from django.urls import include, path
+from django.urls import include, path, re_path
 from drf_spectacular.views import (
     SpectacularAPIView,
     SpectacularRedocView,
     SpectacularSwaggerView,
 )
-from graphene_django.views import GraphQLView
+
+from config.views import AsyncTaskFlowGraphQLView, TaskFlowGraphQLView
+from users.images import CONTENT_ADDRESSED_NAME
+from users.views import profile_image_file
 
 urlpatterns = [
     path("admin/", admin.site.urls),
-    path("graphql/", GraphQLView.as_view(graphiql=True), name="graphql"),
+    path("graphql/", TaskFlowGraphQLView.as_view(graphiql=True), name="graphql"),
+    path("graphql/async/", AsyncTaskFlowGraphQLView.as_view(), name="graphql-async"),
     path("api/v1/", include("users.urls")),
+    path("api/v1/", include("monitoring.urls")),
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
+    re_path(
+        rf"^{settings.MEDIA_URL.lstrip('/')}(?P<name>{CONTENT_ADDRESSED_NAME.pattern})$",
+        profile_image_file,
+        name="profile-image-file",
+    ),
 ]
 
 if settings.DEBUG:
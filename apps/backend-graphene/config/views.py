@@ -0,0 +1,524 @@
+import inspect
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection, transaction
+from django.http import HttpResponse, HttpResponseNotAllowed, StreamingHttpResponse
+from django.http.response import HttpResponseBadRequest
+from django.utils.decorators import method_decorator
+from django.utils.functional import SimpleLazyObject
+from django.views.decorators.csrf import ensure_csrf_cookie
+from graphene_django.constants import MUTATION_ERRORS_FLAG
+from graphene_django.settings import graphene_settings
+from graphene_django.utils.utils import set_rollback
+from graphene_django.views import GraphQLView, HttpError
+from graphql import (
+    ExecutionResult,
+    GraphQLError,
+    OperationType,
+    execute,
+    get_operation_ast,
+    validate_schema,
+)
+from graphql.validation import specified_rules
+from graphql_core_promise import PromiseExecutionContext
+
+from config.cost import cost_exceeded_error, get_cost_settings
+from config.documents import document_cache, operation_cost
+from config.encoders import get_response_encoder
+from config.execution import AsyncQuerySetMiddleware
+from monitoring.middleware import ResolverTimingMiddleware, is_timing_sampled
+from monitoring.stats import resolver_stats
+from organizations.decorators import clear_membership_cache
+from persisted_queries.utils import (
+    aregister_persisted_query,
+    aresolve_persisted_query,
+    register_persisted_query,
+    resolve_persisted_query,
+)
+from users.middleware import check_claim_user, is_claim_user
+
+
+class TaskFlowGraphQLView(GraphQLView):
+    """TaskFlow GraphQL 엔드포인트.
+
+    graphene-django의 GraphQLView에 다음을 더한다.
+    - PromiseExecutionContext: DataLoader(promise) 기반 resolver 지원
+    - 문서 캐시: 같은 쿼리 문자열의 parse/validate 결과 재사용
+    - Automatic Persisted Queries: extensions.persistedQuery.sha256Hash 지원
+    - 쿼리 비용 분석: 예산 초과 operation 거부, 계산된 비용은 extensions.cost로 응답
+    - 배치: operation 배열을 POST하면 같은 request에서 순서대로 실행해 배열로 응답
+      (비용 예산은 배치 전체에 적용)
+    - 응답 직렬화: GRAPHENE["RESPONSE_ENCODER"], 큰 목록은 chunk로 스트리밍
+    - resolver 시간 측정: RESOLVER_TIMING_SAMPLE_RATE 비율의 operation에만 적용
+    """
+
+    execution_context_class = PromiseExecutionContext
+    validation_rules = specified_rules
+    document_cache = document_cache
+
+    def get_document(self, schema, query):
+        return self.document_cache.get(
+            schema,
+            query,
+            self.validation_rules,
+            graphene_settings.MAX_VALIDATION_ERRORS,
+        )
+
+    @staticmethod
+    def get_extensions(request, data):
+        extensions = request.GET.get("extensions") or data.get("extensions")
+        if extensions and isinstance(extensions, str):
+            try:
+                extensions = json.loads(extensions)
+            except Exception:
+                raise HttpError(HttpResponseBadRequest("Extensions are invalid JSON."))
+        # 객체가 아닌 값은 resolve_persisted_query가 BAD_REQUEST로 거부한다.
+        return extensions
+
+    def execute_graphql_request(
+        self, request, data, query, variables, operation_name, show_graphiql=False
+    ):
+        try:
+            query, persisted_hash = resolve_persisted_query(
+                query, self.get_extensions(request, data)
+            )
+        except GraphQLError as e:
+            return ExecutionResult(errors=[e])
+
+        schema = self.schema.graphql_schema
+        document, operation_ast, cost, result = self.get_validated_document(
+            request, schema, query, variables, operation_name, show_graphiql
+        )
+        if document is None:
+            return result
+        # APQ 문서는 파싱/검증을 통과한 뒤에만 등록한다.
+        if persisted_hash is not None:
+            register_persisted_query(persisted_hash, query)
+
+        result = self.execute_document(
+            request, schema, document, operation_ast, variables, operation_name
+        )
+        return self.add_cost_extension(result, cost)
+
+    def get_validated_document(
+        self, request, schema, query, variables, operation_name, show_graphiql=False
+    ):
+        """쿼리를 파싱/검증하고 operation 비용을 구한다.
+
+        비용은 variables(``first``)에 따라 달라지므로 검증 규칙 대신 여기서
+        확인하고, 예산을 넘으면 실행하지 않는다.
+
+        Returns (document, operation_ast, cost, result) 튜플. 실행할 수 없으면
+        document가 None이고 result에 응답할 ExecutionResult(또는 None)가 담긴다.
+        """
+        if not query:
+            if show_graphiql:
+                return None, None, None, None
+            raise HttpError(HttpResponseBadRequest("Must provide query string."))
+
+        schema_validation_errors = validate_schema(schema)
+        if schema_validation_errors:
+            return (
+                None,
+                None,
+                None,
+                ExecutionResult(data=None, errors=schema_validation_errors),
+            )
+
+        try:
+            document, validation_errors, costs = self.get_document(schema, query)
+        except Exception as e:
+            return None, None, None, ExecutionResult(errors=[e])
+
+        operation_ast = get_operation_ast(document, operation_name)
+
+        if (
+            request.method.lower() == "get"
+            and operation_ast is not None
+            and operation_ast.operation != OperationType.QUERY
+        ):
+            if show_graphiql:
+                return None, None, None, None
+
+            raise HttpError(
+                HttpResponseNotAllowed(
+                    ["POST"],
+                    f"Can only perform a {operation_ast.operation.value} "
+                    "operation from a POST request.",
+                )
+            )
+
+        if validation_errors:
+            return (
+                None,
+                None,
+                None,
+                ExecutionResult(data=None, errors=validation_errors),
+            )
+
+        cost = None
+        if operation_ast is not None:
+            cost_settings = get_cost_settings()
+            cost = operation_cost(
+                costs, schema, document, operation_ast, cost_settings, variables
+            )
+            # 배치에서는 앞선 operation들의 비용까지 더해 예산과 비교한다.
+            spent = getattr(request, "batch_cost", 0)
+            error = cost_exceeded_error(spent + cost, operation_ast, cost_settings)
+            if error is not None:
+                return None, None, None, ExecutionResult(data=None, errors=[error])
+            if hasattr(request, "batch_cost"):
+                request.batch_cost = spent + cost
+        return document, operation_ast, cost, None
+
+    def execute_document(
+        self, request, schema, document, operation_ast, variables, operation_name
+    ):
+        try:
+            execute_options = {
+                "root_value": self.get_root_value(request),
+                "context_value": self.get_context(request),
+                "variable_values": variables,
+                "operation_name": operation_name,
+                "middleware": self.get_middleware(request),
+                "execution_context_class": self.execution_context_class,
+            }
+
+            is_mutation = (
+                operation_ast is not None
+                and operation_ast.operation == OperationType.MUTATION
+            )
+            if is_mutation:
+                # 쓰기 전에 claim 사용자의 is_active/token_generation을 확인한다.
+                check_claim_user(request)
+
+            if is_mutation and (
+                graphene_settings.ATOMIC_MUTATIONS is True
+                or connection.settings_dict.get("ATOMIC_MUTATIONS", False) is True
+            ):
+                try:
+                    with transaction.atomic():
+                        result = execute(schema, document, **execute_options)
+                        if getattr(request, MUTATION_ERRORS_FLAG, False) is True:
+                            transaction.set_rollback(True)
+                finally:
+                    # 변경(또는 롤백) 전의 값이 배치의 다음 operation에 보이지
+                    # 않도록 요청 단위 캐시를 버린다.
+                    self.clear_request_caches(request)
+                return result
+
+            return execute(schema, document, **execute_options)
+        except Exception as e:
+            return ExecutionResult(errors=[e])
+
+    def add_cost_extension(self, result, cost):
+        if cost is not None:
+            result.extensions = {
+                **(result.extensions or {}),
+                "cost": {
+                    "requestedQueryCost": cost,
+                    "maximumAvailable": get_cost_settings()["max_cost"],
+                },
+            }
+        return result
+
+    def get_middleware(self, request):
+        middleware = super().get_middleware(request)
+        if is_timing_sampled():
+            middleware = [*(middleware or ()), ResolverTimingMiddleware()]
+            request.resolver_timing_sampled = True
+        return middleware
+
+    @method_decorator(ensure_csrf_cookie)
+    def dispatch(self, request, *args, **kwargs):
+        try:
+            if request.method.lower() not in ("get", "post"):
+                raise HttpError(
+                    HttpResponseNotAllowed(
+                        ["GET", "POST"], "GraphQL only supports GET and POST requests."
+                    )
+                )
+
+            data = self.parse_body(request)
+            if self.graphiql and self.can_display_graphiql(request, data):
+                return super().dispatch(request, *args, **kwargs)
+
+            result, status_code = self.get_response(request, data)
+            if getattr(request, "resolver_timing_sampled", False):
+                resolver_stats.maybe_publish()
+            return self.make_response(result, status_code)
+        except HttpError as e:
+            return self.make_error_response(request, e)
+
+    @staticmethod
+    def make_response(content, status_code):
+        """encoder가 chunk iterator를 반환했으면 StreamingHttpResponse로 보낸다."""
+        if isinstance(content, (bytes, str)):
+            return HttpResponse(
+                status=status_code, content=content, content_type="application/json"
+            )
+        return StreamingHttpResponse(
+            content, status=status_code, content_type="application/json"
+        )
+
+    def make_error_response(self, request, error):
+        response = error.response
+        response["Content-Type"] = "application/json"
+        response.content = self.json_encode(
+            request, {"errors": [self.format_error(error)]}
+        )
+        return response
+
+    def json_encode(self, request, d, pretty=False):
+        pretty = bool(self.pretty or pretty or request.GET.get("pretty"))
+        encoder = get_response_encoder()
+        if not pretty and encoder.should_stream(d):
+            return encoder.iter_encode(d)
+        return encoder.encode(d, pretty=pretty)
+
+    def parse_body(self, request):
+        """JSON 본문으로 operation 객체 하나 또는 operation 배열을 받는다."""
+        if self.batch or self.get_content_type(request) != "application/json":
+            return super().parse_body(request)
+
+        try:
+            body = request.body.decode("utf-8")
+        except Exception as e:
+            raise HttpError(HttpResponseBadRequest(str(e)))
+
+        try:
+            data = json.loads(body)
+        except (TypeError, ValueError):
+            raise HttpError(HttpResponseBadRequest("POST body sent invalid JSON."))
+
+        if isinstance(data, list):
+            self.validate_batch(data)
+        elif not isinstance(data, dict):
+            raise HttpError(
+                HttpResponseBadRequest("The received data is not a valid JSON query.")
+            )
+        return data
+
+    @staticmethod
+    def validate_batch(data):
+        max_operations = settings.GRAPHENE.get("BATCH_MAX_OPERATIONS", 10)
+        if not data:
+            raise HttpError(
+                HttpResponseBadRequest("Received an empty list in the batch request.")
+            )
+        if len(data) > max_operations:
+            raise HttpError(
+                HttpResponseBadRequest(
+                    f"Batch requests are limited to {max_operations} operations."
+                )
+            )
+        if not all(isinstance(entry, dict) for entry in data):
+            raise HttpError(
+                HttpResponseBadRequest("Each batch entry must be a JSON object.")
+            )
+
+    @staticmethod
+    def join_batch_responses(responses):
+        """배치 응답을 요청 순서대로 JSON 배열로 합친다. 상태 코드는 가장 큰 값."""
+        status_code = max(response[1] for response in responses)
+        contents = [response[0] for response in responses]
+        if all(isinstance(content, bytes) for content in contents):
+            return b"[" + b",".join(contents) + b"]", status_code
+
+        def chunks():
+            yield b"["
+            for index, content in enumerate(contents):
+                if index:
+                    yield b","
+                if isinstance(content, bytes):
+                    yield content
+                else:
+                    yield from content
+            yield b"]"
+
+        return chunks(), status_code
+
+    @staticmethod
+    def clear_request_caches(request):
+        """DataLoader와 멤버십 캐시 등 요청 단위 캐시를 버린다."""
+        if hasattr(request, "loaders"):
+            del request.loaders
+        clear_membership_cache(request)
+
+    @staticmethod
+    def reset_operation_state(request):
+        # 앞선 mutation의 오류 플래그가 다음 operation을 롤백시키지 않도록 한다.
+        if hasattr(request, MUTATION_ERRORS_FLAG):
+            delattr(request, MUTATION_ERRORS_FLAG)
+
+    def get_response(self, request, data, show_graphiql=False):
+        if isinstance(data, list):
+            # 배치의 operation들은 같은 request(info.context)를 공유하므로 인증된
+            # 사용자와 DataLoader 등 request 범위 캐시를 함께 쓴다. mutation 뒤에는
+            # 캐시를 버리고, 쿼리 비용은 배치 전체의 합계로 제한한다.
+            responses = []
+            request.batch_cost = 0
+            try:
+                for entry in data:
+                    self.reset_operation_state(request)
+                    responses.append(self.get_response(request, entry))
+            finally:
+                del request.batch_cost
+            return self.join_batch_responses(responses)
+
+        query, variables, operation_name, id = self.get_graphql_params(request, data)
+
+        execution_result = self.execute_graphql_request(
+            request, data, query, variables, operation_name, show_graphiql
+        )
+        return self.format_response(request, execution_result, id, show_graphiql)
+
+    def format_response(self, request, execution_result, id, show_graphiql=False):
+        if getattr(request, MUTATION_ERRORS_FLAG, False) is True:
+            set_rollback()
+
+        status_code = 200
+        if not execution_result:
+            return None, status_code
+
+        response = {}
+        if execution_result.errors:
+            set_rollback()
+            response["errors"] = [self.format_error(e) for e in execution_result.errors]
+
+        if execution_result.errors and any(
+            not getattr(e, "path", None) for e in execution_result.errors
+        ):
+            status_code = 400
+        else:
+            response["data"] = execution_result.data
+
+        if execution_result.extensions:
+            response["extensions"] = execution_result.extensions
+
+        if self.batch:
+            response["id"] = id
+            response["status"] = status_code
+
+        return self.json_encode(request, response, pretty=show_graphiql), status_code
+
+
+class AsyncTaskFlowGraphQLView(TaskFlowGraphQLView):
+    """ASGI용 async GraphQL 엔드포인트.
+
+    query는 이벤트 루프에서 async resolver/DataLoader와 async ORM으로 실행하므로
+    느린 클라이언트가 많아도 요청마다 스레드를 점유하지 않는다.
+    mutation은 트랜잭션(ATOMIC_MUTATIONS)이 sync 전용이므로 스레드에서 sync
+    경로로 실행한다. GraphiQL은 sync 엔드포인트(/graphql/)에서 제공한다.
+    """
+
+    view_is_async = True
+
+    @method_decorator(ensure_csrf_cookie)
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            if request.method.lower() not in ("get", "post"):
+                raise HttpError(
+                    HttpResponseNotAllowed(
+                        ["GET", "POST"], "GraphQL only supports GET and POST requests."
+                    )
+                )
+
+            if isinstance(request.user, SimpleLazyObject):
+                # 세션 인증 사용자는 sync ORM으로 평가되므로 미리 스레드에서 평가한다.
+                await sync_to_async(lambda: request.user.pk)()
+            elif is_claim_user(request.user):
+                # sync 미들웨어가 만든 claim 사용자는 resolver에서 행을 불러올 수
+                # 없으므로 미리 스레드에서 불러와 확인한다.
+                await sync_to_async(check_claim_user)(request)
+
+            data = self.parse_body(request)
+            result, status_code = await self.get_response_async(request, data)
+            if getattr(request, "resolver_timing_sampled", False):
+                await sync_to_async(resolver_stats.maybe_publish)()
+            if not isinstance(result, (bytes, str)):
+                result = _aiter_chunks(result)
+            return self.make_response(result, status_code)
+        except HttpError as e:
+            return self.make_error_response(request, e)
+
+    async def get_response_async(self, request, data):
+        if isinstance(data, list):
+            responses = []
+            request.batch_cost = 0
+            try:
+                for entry in data:
+                    self.reset_operation_state(request)
+                    responses.append(await self.get_response_async(request, entry))
+            finally:
+                del request.batch_cost
+            return self.join_batch_responses(responses)
+
+        query, variables, operation_name, id = self.get_graphql_params(request, data)
+
+        execution_result = await self.execute_graphql_request_async(
+            request, data, query, variables, operation_name
+        )
+        return self.format_response(request, execution_result, id)
+
+    async def execute_graphql_request_async(
+        self, request, data, query, variables, operation_name
+    ):
+        try:
+            query, persisted_hash = await aresolve_persisted_query(
+                query, self.get_extensions(request, data)
+            )
+        except GraphQLError as e:
+            return ExecutionResult(errors=[e])
+
+        schema = self.schema.graphql_schema
+        document, operation_ast, cost, result = self.get_validated_document(
+            request, schema, query, variables, operation_name
+        )
+        if document is None:
+            return result
+        if persisted_hash is not None:
+            await aregister_persisted_query(persisted_hash, query)
+
+        if operation_ast is not None and operation_ast.operation in (
+            OperationType.MUTATION,
+            OperationType.SUBSCRIPTION,
+        ):
+            result = await sync_to_async(self.execute_document)(
+                request, schema, document, operation_ast, variables, operation_name
+            )
+        else:
+            result = await self.execute_document_async(
+                request, schema, document, variables, operation_name
+            )
+        return self.add_cost_extension(result, cost)
+
+    async def execute_document_async(
+        self, request, schema, document, variables, operation_name
+    ):
+        try:
+            result = execute(
+                schema,
+                document,
+                root_value=self.get_root_value(request),
+                context_value=self.get_context(request),
+                variable_values=variables,
+                operation_name=operation_name,
+                middleware=[
+                    AsyncQuerySetMiddleware(),
+                    *(self.get_middleware(request) or ()),
+                ],
+            )
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        except Exception as e:
+            return ExecutionResult(errors=[e])
+
+
+async def _aiter_chunks(chunks):
+    # ASGI에서 StreamingHttpResponse가 sync iterator를 통째로 소비하지 않도록 한다.
+    for chunk in chunks:
+        yield chunk
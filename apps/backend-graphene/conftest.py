@@ -1,9 +1,11 @@
 import pytest
+from django.core.cache import cache
 from pytest_factoryboy import register
 from rest_framework.test import APIClient
-from rest_framework_simplejwt.tokens import RefreshToken
 
+from users.cache import local_user_cache, verified_token_cache
 from users.tests.factories import UserFactory
+from users.tokens import RefreshToken
 
 register(UserFactory)
 
@@ -30,3 +32,11 @@ def make_auth_client(user):
     refresh = RefreshToken.for_user(user)
     client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
     return client
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # 권한/사용자/APQ 캐시가 테스트 사이에 남지 않도록 한다 (rollback 후 PK가 재사용됨).
+    cache.clear()
+    local_user_cache.clear()
+    verified_token_cache.clear()
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+
+from monitoring.stats import collect_stats, reset_stats, summarize
+
+SORT_CHOICES = ("total_ms", "p95_ms", "avg_ms", "count", "queries")
+
+
+class Command(BaseCommand):
+    help = "GraphQL resolver별 실행 시간/SQL 수 히스토그램을 출력한다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sort", choices=SORT_CHOICES, default="total_ms")
+        parser.add_argument("--limit", type=int, default=30)
+        parser.add_argument(
+            "--reset", action="store_true", help="출력 후 수집된 통계를 지운다."
+        )
+
+    def handle(self, *args, **options):
+        rows = sorted(
+            summarize(collect_stats()),
+            key=lambda row: row[options["sort"]] or 0,
+            reverse=True,
+        )[: options["limit"]]
+
+        if not rows:
+            self.stdout.write("수집된 resolver 통계가 없습니다.")
+        else:
+            width = max(len(row["field"]) for row in rows)
+            self.stdout.write(
+                f"{'field':<{width}}  {'count':>8}  {'total_ms':>10}  {'avg_ms':>8}"
+                f"  {'p50':>6}  {'p95':>6}  {'p99':>6}  {'max_ms':>8}  {'avg_sql':>7}"
+            )
+            for row in rows:
+                self.stdout.write(
+                    f"{row['field']:<{width}}  {row['count']:>8}"
+                    f"  {row['total_ms']:>10.1f}  {row['avg_ms']:>8.2f}"
+                    f"  {_bound(row['p50_ms'])}  {_bound(row['p95_ms'])}"
+                    f"  {_bound(row['p99_ms'])}  {row['max_ms']:>8.1f}"
+                    f"  {row['avg_queries']:>7.2f}"
+                )
+
+        if options["reset"]:
+            reset_stats()
+
+
+def _bound(value):
+    return f"{value:>6g}" if value is not None else f"{'-':>6}"
@@ -0,0 +1,79 @@
+import inspect
+import random
+import time
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import QuerySet
+from promise import Promise
+
+from monitoring.stats import resolver_stats
+
+
+def is_timing_sampled():
+    """이 operation의 resolver 시간을 잴지 RESOLVER_TIMING_SAMPLE_RATE로 정한다.
+
+    0이면 미들웨어를 아예 붙이지 않으므로 필드별 오버헤드가 없다.
+    """
+    rate = settings.GRAPHENE.get("RESOLVER_TIMING_SAMPLE_RATE", 0.0)
+    return rate > 0 and (rate >= 1 or random.random() < rate)
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class ResolverTimingMiddleware:
+    """resolver의 실행 시간과 SQL 수를 "ParentType.field"별로 기록한다.
+
+    - 시간: resolver 호출부터 결과(Promise/awaitable 포함)가 완료될 때까지
+    - SQL 수: resolver 호출 중 동기로 실행된 쿼리(반환한 QuerySet 평가 포함).
+      DataLoader 배치 쿼리처럼 나중에 실행되는 쿼리와 async ORM 쿼리는
+      포함하지 않는다.
+    """
+
+    def resolve(self, next, root, info, **args):
+        key = f"{info.parent_type.name}.{info.field_name}"
+        counter = QueryCounter()
+        start = time.perf_counter()
+        try:
+            with connection.execute_wrapper(counter):
+                result = next(root, info, **args)
+                if isinstance(result, QuerySet):
+                    # graphql-core가 나중에 순회할 QuerySet을 여기서 평가해
+                    # 목록 필드의 쿼리도 해당 resolver에 집계한다.
+                    result._fetch_all()
+        except Exception:
+            self._record(key, start, counter.count)
+            raise
+
+        if isinstance(result, Promise):
+            return result.then(
+                lambda value: self._record(key, start, counter.count, value),
+                lambda error: self._record_error(key, start, counter.count, error),
+            )
+        if inspect.isawaitable(result):
+            return self._await(key, start, counter.count, result)
+        return self._record(key, start, counter.count, result)
+
+    async def _await(self, key, start, queries, result):
+        try:
+            value = await result
+        except Exception:
+            self._record(key, start, queries)
+            raise
+        return self._record(key, start, queries, value)
+
+    def _record_error(self, key, start, queries, error):
+        self._record(key, start, queries)
+        raise error
+
+    @staticmethod
+    def _record(key, start, queries, value=None):
+        resolver_stats.record(key, (time.perf_counter() - start) * 1000, queries)
+        return value
@@ -0,0 +1,147 @@
+import bisect
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+# 실행 시간 히스토그램 bucket 상한(ms). 마지막 bucket은 그 이상 전부.
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+CACHE_KEY_PREFIX = "resolver_timing:"
+PROCESSES_CACHE_KEY = f"{CACHE_KEY_PREFIX}processes"
+DEFAULT_PUBLISH_INTERVAL = 10
+
+
+def empty_field_stats():
+    return {
+        "count": 0,
+        "total_ms": 0.0,
+        "max_ms": 0.0,
+        "buckets": [0] * (len(BUCKETS_MS) + 1),
+        "queries": 0,
+        "max_queries": 0,
+    }
+
+
+def merge_stats(target, source):
+    """source의 필드별 통계를 target에 더한다."""
+    for key, stats in source.items():
+        merged = target.setdefault(key, empty_field_stats())
+        merged["count"] += stats["count"]
+        merged["total_ms"] += stats["total_ms"]
+        merged["max_ms"] = max(merged["max_ms"], stats["max_ms"])
+        merged["buckets"] = [a + b for a, b in zip(merged["buckets"], stats["buckets"])]
+        merged["queries"] += stats["queries"]
+        merged["max_queries"] = max(merged["max_queries"], stats["max_queries"])
+    return target
+
+
+def percentile(stats, q):
+    """히스토그램에서 q 분위수가 속한 bucket의 상한(ms)을 돌려준다."""
+    if not stats["count"]:
+        return None
+    threshold = q * stats["count"]
+    cumulative = 0
+    for bound, count in zip(BUCKETS_MS, stats["buckets"]):
+        cumulative += count
+        if cumulative >= threshold:
+            return bound
+    return stats["max_ms"]
+
+
+def summarize(stats):
+    """ "ParentType.field"별 통계를 표시용 행 목록으로 만든다."""
+    rows = []
+    for key, field_stats in stats.items():
+        count = field_stats["count"]
+        rows.append(
+            {
+                "field": key,
+                "count": count,
+                "total_ms": round(field_stats["total_ms"], 3),
+                "avg_ms": round(field_stats["total_ms"] / count, 3) if count else 0,
+                "p50_ms": percentile(field_stats, 0.5),
+                "p95_ms": percentile(field_stats, 0.95),
+                "p99_ms": percentile(field_stats, 0.99),
+                "max_ms": round(field_stats["max_ms"], 3),
+                "queries": field_stats["queries"],
+                "avg_queries": (
+                    round(field_stats["queries"] / count, 2) if count else 0
+                ),
+                "max_queries": field_stats["max_queries"],
+            }
+        )
+    return rows
+
+
+class ResolverStats:
+    """프로세스 안에서 "ParentType.field"별 실행 시간/SQL 수를 모은다.
+
+    관리 명령이나 다른 워커에서도 볼 수 있도록 일정 간격으로 Django 캐시에
+    스냅샷을 올린다. 기본 LocMemCache에서는 같은 프로세스에서만 보이므로,
+    여러 워커를 합쳐 보려면 공유 캐시(Redis 등)를 설정해야 한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._last_published = 0.0
+
+    def record(self, key, duration_ms, queries):
+        index = bisect.bisect_left(BUCKETS_MS, duration_ms)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = empty_field_stats()
+            stats["count"] += 1
+            stats["total_ms"] += duration_ms
+            stats["max_ms"] = max(stats["max_ms"], duration_ms)
+            stats["buckets"][index] += 1
+            stats["queries"] += queries
+            stats["max_queries"] = max(stats["max_queries"], queries)
+
+    def snapshot(self):
+        with self._lock:
+            return merge_stats({}, self._stats)
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+            self._last_published = 0.0
+
+    def maybe_publish(self):
+        interval = settings.GRAPHENE.get(
+            "RESOLVER_TIMING_PUBLISH_INTERVAL", DEFAULT_PUBLISH_INTERVAL
+        )
+        now = time.monotonic()
+        if now - self._last_published < interval:
+            return
+        self._last_published = now
+        self.publish()
+
+    def publish(self):
+        process_key = f"{CACHE_KEY_PREFIX}{os.getpid()}"
+        cache.set(process_key, self.snapshot(), timeout=None)
+        processes = cache.get(PROCESSES_CACHE_KEY) or []
+        if process_key not in processes:
+            cache.set(PROCESSES_CACHE_KEY, [*processes, process_key], timeout=None)
+
+
+resolver_stats = ResolverStats()
+
+
+def collect_stats():
+    """캐시에 올라온 모든 프로세스의 스냅샷과 현재 프로세스 통계를 합친다."""
+    own_key = f"{CACHE_KEY_PREFIX}{os.getpid()}"
+    merged = merge_stats({}, resolver_stats.snapshot())
+    for process_key in cache.get(PROCESSES_CACHE_KEY) or []:
+        if process_key == own_key:
+            continue
+        merge_stats(merged, cache.get(process_key) or {})
+    return merged
+
+
+def reset_stats():
+    resolver_stats.reset()
+    cache.delete_many([*(cache.get(PROCESSES_CACHE_KEY) or []), PROCESSES_CACHE_KEY])
@@ -0,0 +1,117 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from conftest import make_auth_client
+from monitoring.stats import collect_stats, percentile, reset_stats, resolver_stats
+from organizations.models import OrganizationMembership, Role
+from organizations.tests.factories import OrganizationFactory
+
+GRAPHQL_URL = reverse("graphql")
+TIMINGS_URL = reverse("monitoring:resolver-timings")
+
+MY_ORGANIZATIONS_QUERY = """
+    query {
+        myOrganizations {
+            id
+            members {
+                role
+            }
+        }
+    }
+"""
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    reset_stats()
+    yield
+    reset_stats()
+
+
+@pytest.fixture
+def sample_rate(settings):
+    def set_rate(rate):
+        settings.GRAPHENE = {**settings.GRAPHENE, "RESOLVER_TIMING_SAMPLE_RATE": rate}
+
+    return set_rate
+
+
+@pytest.fixture
+def organization(verified_user):
+    org = OrganizationFactory()
+    OrganizationMembership.objects.create(
+        organization=org, user=verified_user, role=Role.OWNER
+    )
+    return org
+
+
+def post(client, query):
+    return client.post(
+        GRAPHQL_URL, json.dumps({"query": query}), content_type="application/json"
+    )
+
+
+class TestResolverStats:
+    def test_histogram_percentiles(self):
+        for duration in (0.5, 3, 3, 3, 40, 40, 40, 40, 40, 900):
+            resolver_stats.record("Query.me", duration, 1)
+
+        stats = resolver_stats.snapshot()["Query.me"]
+        assert stats["count"] == 10
+        assert stats["queries"] == 10
+        assert percentile(stats, 0.5) == 50
+        assert percentile(stats, 0.99) == 1000
+
+
+@pytest.mark.django_db
+class TestResolverTimingMiddleware:
+    def test_disabled_by_default(self, auth_client, organization):
+        post(auth_client, MY_ORGANIZATIONS_QUERY)
+
+        assert collect_stats() == {}
+
+    def test_records_time_and_queries_per_field(
+        self, auth_client, organization, sample_rate
+    ):
+        sample_rate(1.0)
+
+        post(auth_client, MY_ORGANIZATIONS_QUERY)
+
+        stats = collect_stats()
+        # organizations 조회 + memberships prefetch
+        assert stats["Query.myOrganizations"]["queries"] == 2
+        assert stats["OrganizationType.members"]["count"] == 1
+        assert stats["OrganizationMemberType.role"]["count"] == 1
+
+    def test_command_prints_fields(self, auth_client, organization, sample_rate):
+        sample_rate(1.0)
+        post(auth_client, MY_ORGANIZATIONS_QUERY)
+
+        out = StringIO()
+        call_command("resolver_timings", "--reset", stdout=out)
+
+        assert "Query.myOrganizations" in out.getvalue()
+        assert collect_stats() == {}
+
+
+@pytest.mark.django_db
+class TestResolverTimingsEndpoint:
+    def test_staff_can_read(self, user_factory, sample_rate, organization, auth_client):
+        sample_rate(1.0)
+        post(auth_client, MY_ORGANIZATIONS_QUERY)
+        staff = make_auth_client(user_factory(is_staff=True))
+
+        response = staff.get(TIMINGS_URL)
+
+        assert response.status_code == 200
+        fields = {row["field"] for row in response.json()["fields"]}
+        assert "Query.myOrganizations" in fields
+
+    def test_non_staff_forbidden(self, auth_client):
+        response = auth_client.get(TIMINGS_URL)
+
+        assert response.status_code == 403
@@ -0,0 +1,13 @@
+from django.urls import path
+
+from monitoring.views import ResolverTimingsView
+
+app_name = "monitoring"
+
+urlpatterns = [
+    path(
+        "monitoring/resolver-timings/",
+        ResolverTimingsView.as_view(),
+        name="resolver-timings",
+    ),
+]
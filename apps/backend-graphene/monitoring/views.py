@@ -0,0 +1,30 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from monitoring.stats import BUCKETS_MS, collect_stats, reset_stats, summarize
+
+
+class ResolverTimingsView(APIView):
+    """resolver별 실행 시간 히스토그램 (staff 전용)."""
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(tags=["monitoring"])
+    def get(self, request):
+        stats = collect_stats()
+        return Response(
+            {
+                "buckets_ms": BUCKETS_MS,
+                "fields": sorted(
+                    summarize(stats), key=lambda row: row["total_ms"], reverse=True
+                ),
+                "histograms": {key: value["buckets"] for key, value in stats.items()},
+            }
+        )
+
+    @extend_schema(tags=["monitoring"])
+    def delete(self, request):
+        reset_stats()
+        return Response(status=204)
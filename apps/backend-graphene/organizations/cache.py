@@ -0,0 +1,74 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from organizations.models import Organization, OrganizationMembership
+
+# 멤버가 아님을 캐시할 때 쓰는 값 (cache.get의 None은 miss와 구분되지 않는다)
+NOT_MEMBER = "not-member"
+
+
+def organization_pk(organization_id):
+    """클라이언트가 보낸 ID("007" 등)를 FK 값과 같은 pk 값으로 바꾼다.
+
+    같은 조직이 표기마다 다른 key로 캐시되면 FK 값으로 지우는 무효화가 닿지
+    않으므로 모든 캐시 key는 이 값으로 만든다. 잘못된 값이면 ValidationError.
+    """
+    return Organization._meta.pk.to_python(organization_id)
+
+
+def membership_cache_key(user_id, organization_id):
+    return f"org_membership:{user_id}:{organization_pk(organization_id)}"
+
+
+def _timeout():
+    return settings.AUTHORIZATION_CACHE_TIMEOUT
+
+
+def _memberships(user, organization_id):
+    return OrganizationMembership.objects.filter(
+        organization_id=organization_id, user=user
+    )
+
+
+def get_cached_membership(user, organization_id):
+    """(user, organization) -> OrganizationMembership 또는 None. 요청 간 캐시.
+
+    역할이 바뀌거나 멤버십이 생성/삭제되면 signal로 무효화된다.
+    AUTHORIZATION_CACHE_TIMEOUT이 0이면 매번 DB에서 조회한다.
+    """
+    if not _timeout():
+        return _memberships(user, organization_id).first()
+
+    key = membership_cache_key(user.pk, organization_id)
+    cached = cache.get(key)
+    if cached is not None:
+        return None if cached == NOT_MEMBER else cached
+
+    membership = _memberships(user, organization_id).first()
+    cache.set(key, membership or NOT_MEMBER, _timeout())
+    return membership
+
+
+async def aget_cached_membership(user, organization_id):
+    if not _timeout():
+        return await _memberships(user, organization_id).afirst()
+
+    key = membership_cache_key(user.pk, organization_id)
+    cached = await cache.aget(key)
+    if cached is not None:
+        return None if cached == NOT_MEMBER else cached
+
+    membership = await _memberships(user, organization_id).afirst()
+    await cache.aset(key, membership or NOT_MEMBER, _timeout())
+    return membership
+
+
+def invalidate_membership_cache(organization_id, *user_ids):
+    """멤버십 캐시를 지운다.
+
+    커밋 전에 다른 요청이 옛 값을 다시 채울 수 있으므로 커밋 후에도 한 번 더 지운다.
+    """
+    keys = [membership_cache_key(user_id, organization_id) for user_id in user_ids]
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
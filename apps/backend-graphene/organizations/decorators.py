@@ -1,8 +1,15 @@
 from functools import wraps
 
+from django.core.exceptions import ValidationError
 from graphql import GraphQLError
 
-from organizations.models import ROLE_HIERARCHY, OrganizationMembership
+from config.execution import is_async_execution, maybe_await
+from organizations.cache import (
+    aget_cached_membership,
+    get_cached_membership,
+    organization_pk,
+)
+from organizations.models import ROLE_HIERARCHY, OrganizationMembership, Role
 
 
 def get_membership(user, organization_id):
@@ -14,63 +21,129 @@ def get_membership(user, organization_id):
         return None
 
 
+async def aget_membership(user, organization_id):
+    try:
+        return await OrganizationMembership.objects.aget(
+            organization_id=organization_id, user=user
+        )
+    except OrganizationMembership.DoesNotExist:
+        return None
+
+
+def _membership_cache(request):
+    cache = getattr(request, "membership_cache", None)
+    if cache is None:
+        cache = request.membership_cache = {}
+    return cache
+
+
+def _membership_key(user_id, organization_id):
+    # 인자로 받은 ID(str)와 FK 값(int)이 같은 키가 되도록 pk 값으로 맞춘다.
+    return (user_id, organization_pk(organization_id))
+
+
+def get_request_membership(info, organization_id):
+    """현재 사용자의 멤버십을 요청 단위로 memoize해서 조회한다.
+
+    info.context(request)에 저장하므로 같은 요청(배치 포함)의 decorator와
+    resolver가 조회 결과를 공유한다. 멤버가 아닌 경우(None)도 캐시한다.
+    요청 캐시에 없으면 요청 간 캐시(organizations.cache)를 거쳐 조회한다.
+    """
+    cache = _membership_cache(info.context)
+    key = _membership_key(info.context.user.pk, organization_id)
+    if key not in cache:
+        cache[key] = get_cached_membership(info.context.user, organization_id)
+    return cache[key]
+
+
+async def aget_request_membership(info, organization_id):
+    cache = _membership_cache(info.context)
+    key = _membership_key(info.context.user.pk, organization_id)
+    if key not in cache:
+        cache[key] = await aget_cached_membership(info.context.user, organization_id)
+    return cache[key]
+
+
+def set_request_membership(info, organization_id, membership):
+    """다른 경로로 조회한 현재 사용자의 멤버십(또는 None)을 요청 캐시에 넣는다."""
+    key = _membership_key(info.context.user.pk, organization_id)
+    _membership_cache(info.context)[key] = membership
+
+
+def remember_membership(info, membership):
+    """생성/역할 변경된 멤버십으로 요청 캐시를 갱신한다."""
+    key = _membership_key(membership.user_id, membership.organization_id)
+    _membership_cache(info.context)[key] = membership
+
+
+def forget_membership(info, organization_id, user_id=None):
+    """삭제된 멤버십을 요청 캐시에서 지운다. user_id가 없으면 조직 전체."""
+    cache = _membership_cache(info.context)
+    organization_id = organization_pk(organization_id)
+    for key in list(cache):
+        if key[1] == organization_id and user_id in (None, key[0]):
+            del cache[key]
+
+
+def clear_membership_cache(request):
+    """롤백된 mutation이 남긴 캐시를 버린다."""
+    request.membership_cache = {}
+
+
 def check_role(membership, min_role):
     return ROLE_HIERARCHY[membership.role] >= ROLE_HIERARCHY[min_role]
 
 
-def org_member_required(func):
-    @wraps(func)
-    def wrapper(root, info, *args, **kwargs):
-        user = info.context.user
-        if not user.is_authenticated:
-            raise GraphQLError("로그인이 필요합니다.")
-
-        input_arg = kwargs.get("input") or (args[0] if args else None)
-        organization_id = (
-            getattr(input_arg, "organization_id", None)
-            or kwargs.get("organization_id")
-            or kwargs.get("id")
-        )
-        if not organization_id:
-            raise GraphQLError("Organization ID가 필요합니다.")
+def _get_organization_id(args, kwargs):
+    input_arg = kwargs.get("input") or (args[0] if args else None)
+    organization_id = (
+        getattr(input_arg, "organization_id", None)
+        or kwargs.get("organization_id")
+        or kwargs.get("id")
+    )
+    if not organization_id:
+        raise GraphQLError("Organization ID가 필요합니다.")
+    try:
+        return organization_pk(organization_id)
+    except ValidationError:
+        raise GraphQLError("잘못된 Organization ID입니다.")
+
 
-        membership = get_membership(user, organization_id)
-        if not membership:
-            raise GraphQLError("이 Organization의 멤버가 아닙니다.")
+def _authorize(info, membership, min_role):
+    if not membership:
+        raise GraphQLError("이 Organization의 멤버가 아닙니다.")
 
-        info.context.membership = membership
-        return func(root, info, *args, **kwargs)
+    if not check_role(membership, min_role):
+        raise GraphQLError("권한이 부족합니다.")
 
-    return wrapper
+    info.context.membership = membership
 
 
 def org_role_required(min_role):
     def decorator(func):
+        async def async_wrapper(root, info, *args, **kwargs):
+            organization_id = _get_organization_id(args, kwargs)
+            membership = await aget_request_membership(info, organization_id)
+            _authorize(info, membership, min_role)
+            return await maybe_await(func(root, info, *args, **kwargs))
+
         @wraps(func)
         def wrapper(root, info, *args, **kwargs):
             user = info.context.user
             if not user.is_authenticated:
                 raise GraphQLError("로그인이 필요합니다.")
 
-            input_arg = kwargs.get("input") or (args[0] if args else None)
-            organization_id = (
-                getattr(input_arg, "organization_id", None)
-                or kwargs.get("organization_id")
-                or kwargs.get("id")
-            )
-            if not organization_id:
-                raise GraphQLError("Organization ID가 필요합니다.")
-
-            membership = get_membership(user, organization_id)
-            if not membership:
-                raise GraphQLError("이 Organization의 멤버가 아닙니다.")
+            if is_async_execution():
+                return async_wrapper(root, info, *args, **kwargs)
 
-            if not check_role(membership, min_role):
-                raise GraphQLError("권한이 부족합니다.")
-
-            info.context.membership = membership
+            organization_id = _get_organization_id(args, kwargs)
+            _authorize(info, get_request_membership(info, organization_id), min_role)
             return func(root, info, *args, **kwargs)
 
         return wrapper
 
     return decorator
+
+
+def org_member_required(func):
+    return org_role_required(Role.MEMBER)(func)
@@ -0,0 +1,72 @@
+from collections import defaultdict
+
+from graphene.utils.dataloader import DataLoader as AsyncDataLoader
+from promise import Promise
+from promise.dataloader import DataLoader
+
+from config.pagination import AsyncKeysetPageLoader, KeysetPageLoader
+from organizations.models import Organization, OrganizationMembership
+
+
+class AsyncOrganizationLoader(AsyncDataLoader):
+    async def batch_load_fn(self, organization_ids):
+        organizations = await Organization.objects.ain_bulk(organization_ids)
+        return [
+            organizations.get(organization_id) for organization_id in organization_ids
+        ]
+
+
+class OrganizationLoader(DataLoader):
+    """organization_id -> Organization"""
+
+    async_loader_class = AsyncOrganizationLoader
+
+    def batch_load_fn(self, organization_ids):
+        organizations = Organization.objects.in_bulk(organization_ids)
+        return Promise.resolve(
+            [organizations.get(organization_id) for organization_id in organization_ids]
+        )
+
+
+class AsyncOrganizationMembershipsLoader(AsyncDataLoader):
+    async def batch_load_fn(self, organization_ids):
+        memberships = defaultdict(list)
+        async for membership in OrganizationMembership.objects.filter(
+            organization_id__in=organization_ids
+        ):
+            memberships[membership.organization_id].append(membership)
+        return [memberships[organization_id] for organization_id in organization_ids]
+
+
+class OrganizationMembershipsLoader(DataLoader):
+    """organization_id -> 해당 Organization의 OrganizationMembership 목록"""
+
+    async_loader_class = AsyncOrganizationMembershipsLoader
+
+    def batch_load_fn(self, organization_ids):
+        memberships = defaultdict(list)
+        for membership in OrganizationMembership.objects.filter(
+            organization_id__in=organization_ids
+        ):
+            memberships[membership.organization_id].append(membership)
+        return Promise.resolve(
+            [memberships[organization_id] for organization_id in organization_ids]
+        )
+
+
+class OrganizationMembersPage:
+    model = OrganizationMembership
+    parent_field = "organization_id"
+    ordering = OrganizationMembership.KEYSET_ORDERING
+
+
+class AsyncOrganizationMembersPageLoader(
+    OrganizationMembersPage, AsyncKeysetPageLoader
+):
+    pass
+
+
+class OrganizationMembersPageLoader(OrganizationMembersPage, KeysetPageLoader):
+    """(organization_id, page_size, after) -> OrganizationMembership 페이지"""
+
+    async_loader_class = AsyncOrganizationMembersPageLoader
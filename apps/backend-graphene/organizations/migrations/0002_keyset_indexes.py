@@ -0,0 +1,23 @@
+# Generated by Django 6.0.2 on 2026-10-18 05:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='organization',
+            index=models.Index(fields=['created_at', 'id'], name='organization_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='organizationmembership',
+            index=models.Index(fields=['organization', 'joined_at', 'id'], name='org_membership_keyset_idx'),
+        ),
+    ]
@@ -17,6 +17,9 @@ ROLE_HIERARCHY = {
 
 
 class Organization(models.Model):
+    # keyset pagination 정렬 키 (Meta.indexes와 일치해야 한다)
+    KEYSET_ORDERING = ("created_at", "id")
+
     name = models.CharField(max_length=100)
     slug = models.SlugField(unique=True)
     description = models.TextField(blank=True)
@@ -36,6 +39,11 @@ class Organization(models.Model):
         related_name="organizations",
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="organization_keyset_idx"),
+        ]
+
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = self._generate_unique_slug()
@@ -57,6 +65,8 @@ class Organization(models.Model):
 
 
 class OrganizationMembership(models.Model):
+    KEYSET_ORDERING = ("joined_at", "id")
+
     organization = models.ForeignKey(
         Organization,
         on_delete=models.CASCADE,
@@ -83,6 +93,12 @@ class OrganizationMembership(models.Model):
 
     class Meta:
         unique_together = ("organization", "user")
+        indexes = [
+            models.Index(
+                fields=["organization", "joined_at", "id"],
+                name="org_membership_keyset_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user} - {self.organization} ({self.role})"
@@ -3,8 +3,11 @@ from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import transaction
 from graphql import GraphQLError
 
+from organizations.cache import invalidate_membership_cache
 from organizations.decorators import (
+    forget_membership,
     org_role_required,
+    remember_membership,
 )
 from organizations.models import (
     Organization,
@@ -50,9 +53,10 @@ class CreateOrganization(graphene.Mutation):
             raise GraphQLError("; ".join(messages))
 
         org.save()
-        OrganizationMembership.objects.create(
+        membership = OrganizationMembership.objects.create(
             organization=org, user=user, role=Role.OWNER
         )
+        remember_membership(info, membership)
         return CreateOrganization(organization=org)
 
 
@@ -110,6 +114,7 @@ class DeleteOrganization(graphene.Mutation):
             raise GraphQLError("Organization을 찾을 수 없습니다.")
 
         org.delete()
+        forget_membership(info, id)
         return DeleteOrganization(success=True)
 
 
@@ -145,6 +150,7 @@ class InviteMember(graphene.Mutation):
             role=Role.MEMBER,
             invited_by=info.context.user,
         )
+        remember_membership(info, membership)
         return InviteMember(membership=membership)
 
 
@@ -183,6 +189,8 @@ class UpdateMemberRole(graphene.Mutation):
 
         target_membership.role = new_role
         target_membership.save(update_fields=["role"])
+        invalidate_membership_cache(input.organization_id, target_membership.user_id)
+        remember_membership(info, target_membership)
         return UpdateMemberRole(membership=target_membership)
 
 
@@ -212,6 +220,8 @@ class RemoveMember(graphene.Mutation):
             raise GraphQLError("Admin은 Member만 제거할 수 있습니다.")
 
         target_membership.delete()
+        invalidate_membership_cache(input.organization_id, target_membership.user_id)
+        forget_membership(info, input.organization_id, target_membership.user_id)
         return RemoveMember(success=True)
 
 
@@ -239,6 +249,13 @@ class TransferOwnership(graphene.Mutation):
             target_membership.save(update_fields=["role"])
             actor_membership.role = Role.ADMIN
             actor_membership.save(update_fields=["role"])
+            invalidate_membership_cache(
+                input.organization_id,
+                target_membership.user_id,
+                actor_membership.user_id,
+            )
+        remember_membership(info, target_membership)
+        remember_membership(info, actor_membership)
 
         org = Organization.objects.get(pk=input.organization_id)
         return TransferOwnership(organization=org)
@@ -1,31 +1,68 @@
 import graphene
 from graphql import GraphQLError
 
-from organizations.decorators import get_membership
+from config.execution import is_async_execution
+from config.optimizer import optimize_queryset
+from config.pagination import connection_from_queryset
+from organizations.decorators import aget_request_membership, get_request_membership
 from organizations.models import Organization
-from organizations.types import OrganizationType
+from organizations.types import OrganizationConnection, OrganizationType
 from users.decorators import login_required
 
 
 class OrganizationQuery(graphene.ObjectType):
     my_organizations = graphene.List(graphene.NonNull(OrganizationType))
+    my_organizations_connection = graphene.Field(
+        OrganizationConnection,
+        first=graphene.Int(),
+        after=graphene.String(),
+    )
     organization = graphene.Field(OrganizationType, id=graphene.ID(required=True))
 
     @login_required
     def resolve_my_organizations(root, info):
-        return Organization.objects.filter(
+        queryset = Organization.objects.filter(
             memberships__user=info.context.user
         ).distinct()
+        return optimize_queryset(queryset, info)
+
+    @login_required
+    def resolve_my_organizations_connection(root, info, first=None, after=None):
+        # (organization, user)는 unique이므로 distinct 없이도 중복이 없다.
+        queryset = Organization.objects.filter(memberships__user=info.context.user)
+        return connection_from_queryset(
+            optimize_queryset(queryset, info, Organization.KEYSET_ORDERING),
+            OrganizationConnection,
+            Organization.KEYSET_ORDERING,
+            first,
+            after,
+        )
 
     @login_required
     def resolve_organization(root, info, id):
+        if is_async_execution():
+            return _aresolve_organization(info, id)
+
         try:
             org = Organization.objects.get(pk=id)
         except Organization.DoesNotExist:
             raise GraphQLError("Organization을 찾을 수 없습니다.")
 
-        membership = get_membership(info.context.user, id)
+        membership = get_request_membership(info, id)
         if not membership:
             raise GraphQLError("이 Organization의 멤버가 아닙니다.")
 
         return org
+
+
+async def _aresolve_organization(info, id):
+    try:
+        org = await Organization.objects.aget(pk=id)
+    except Organization.DoesNotExist:
+        raise GraphQLError("Organization을 찾을 수 없습니다.")
+
+    membership = await aget_request_membership(info, id)
+    if not membership:
+        raise GraphQLError("이 Organization의 멤버가 아닙니다.")
+
+    return org
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from organizations.cache import invalidate_membership_cache
+from organizations.models import OrganizationMembership
+
+
+@receiver(post_save, sender=OrganizationMembership)
+@receiver(post_delete, sender=OrganizationMembership)
+def invalidate_membership(sender, instance, **kwargs):
+    invalidate_membership_cache(instance.organization_id, instance.user_id)
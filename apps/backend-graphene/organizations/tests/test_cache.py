@@ -0,0 +1,185 @@
+import json
+from unittest import mock
+
+import pytest
+from django.urls import reverse
+
+from conftest import make_auth_client
+from organizations.cache import get_cached_membership
+from organizations.checks import check_authorization_cache
+from organizations.models import OrganizationMembership, Role
+
+GRAPHQL_URL = reverse("graphql")
+
+
+@pytest.mark.django_db
+class TestMembershipCache:
+    @pytest.fixture(autouse=True)
+    def enable_cache(self, settings):
+        settings.AUTHORIZATION_CACHE_TIMEOUT = 300
+
+    def test_warm_lookup_costs_no_queries(
+        self, organization_factory, user_factory, django_assert_num_queries
+    ):
+        org = organization_factory()
+        user = user_factory()
+        OrganizationMembership.objects.create(
+            organization=org, user=user, role=Role.ADMIN
+        )
+        get_cached_membership(user, org.id)
+
+        with django_assert_num_queries(0):
+            membership = get_cached_membership(user, org.id)
+
+        assert membership.role == Role.ADMIN
+
+    def test_non_member_is_cached(
+        self, organization_factory, user_factory, django_assert_num_queries
+    ):
+        org = organization_factory()
+        user = user_factory()
+        get_cached_membership(user, org.id)
+
+        with django_assert_num_queries(0):
+            assert get_cached_membership(user, org.id) is None
+
+    def test_role_change_invalidates(self, organization_factory, user_factory):
+        org = organization_factory()
+        user = user_factory()
+        membership = OrganizationMembership.objects.create(
+            organization=org, user=user, role=Role.MEMBER
+        )
+        get_cached_membership(user, org.id)
+
+        membership.role = Role.ADMIN
+        membership.save(update_fields=["role"])
+
+        assert get_cached_membership(user, org.id).role == Role.ADMIN
+
+    def test_create_and_delete_invalidate(self, organization_factory, user_factory):
+        org = organization_factory()
+        user = user_factory()
+        assert get_cached_membership(user, org.id) is None
+
+        membership = OrganizationMembership.objects.create(
+            organization=org, user=user, role=Role.MEMBER
+        )
+        assert get_cached_membership(user, org.id) is not None
+
+        membership.delete()
+        assert get_cached_membership(user, org.id) is None
+
+    def test_organization_delete_invalidates(self, organization_factory, user_factory):
+        org = organization_factory()
+        user = user_factory()
+        OrganizationMembership.objects.create(
+            organization=org, user=user, role=Role.OWNER
+        )
+        org_id = org.id
+        get_cached_membership(user, org_id)
+
+        org.delete()
+
+        assert get_cached_membership(user, org_id) is None
+
+    def test_disabled_cache_always_queries(
+        self, settings, organization_factory, user_factory, django_assert_num_queries
+    ):
+        settings.AUTHORIZATION_CACHE_TIMEOUT = 0
+        org = organization_factory()
+        user = user_factory()
+        get_cached_membership(user, org.id)
+
+        with django_assert_num_queries(1):
+            assert get_cached_membership(user, org.id) is None
+
+
+class TestAuthorizationCacheCheck:
+    def test_process_local_cache_fails(self, settings):
+        settings.AUTHORIZATION_CACHE_TIMEOUT = 300
+
+        assert [error.id for error in check_authorization_cache(None)] == [
+            "organizations.E001"
+        ]
+
+    def test_shared_cache_passes(self, settings):
+        settings.AUTHORIZATION_CACHE_TIMEOUT = 300
+
+        with mock.patch("organizations.checks.is_shared_cache", return_value=True):
+            assert check_authorization_cache(None) == []
+
+    def test_disabled_cache_passes(self, settings):
+        settings.AUTHORIZATION_CACHE_TIMEOUT = 0
+
+        assert check_authorization_cache(None) == []
+
+
+ORGANIZATION_QUERY = """
+    query Organization($id: ID!) {
+        organization(id: $id) { id }
+    }
+"""
+
+UPDATE_MEMBER_ROLE = """
+    mutation UpdateMemberRole($input: UpdateMemberRoleInput!) {
+        updateMemberRole(input: $input) { membership { role } }
+    }
+"""
+
+
+def post(client, query, variables):
+    response = client.post(
+        GRAPHQL_URL,
+        json.dumps({"query": query, "variables": variables}),
+        content_type="application/json",
+    )
+    return response.json()
+
+
+@pytest.mark.django_db
+class TestZeroPaddedOrganizationId:
+    """ID 표기가 달라도 같은 캐시 key를 써서 무효화가 닿는다."""
+
+    @pytest.fixture(autouse=True)
+    def enable_cache(self, settings):
+        settings.AUTHORIZATION_CACHE_TIMEOUT = 300
+
+    def test_removed_member_is_denied(self, organization_factory, user_factory):
+        org = organization_factory()
+        user = user_factory(email_verified=True)
+        membership = OrganizationMembership.objects.create(
+            organization=org, user=user, role=Role.MEMBER
+        )
+        client = make_auth_client(user)
+        padded = {"id": f"0{org.id}"}
+        assert post(client, ORGANIZATION_QUERY, padded)["data"]["organization"]
+
+        membership.delete()
+
+        data = post(client, ORGANIZATION_QUERY, padded)
+        assert data["data"]["organization"] is None
+        assert data["errors"][0]["message"] == "이 Organization의 멤버가 아닙니다."
+
+    def test_demoted_admin_is_denied(self, org_with_owner, admin_user, member_user):
+        org = org_with_owner
+        admin = OrganizationMembership.objects.create(
+            organization=org, user=admin_user, role=Role.ADMIN
+        )
+        OrganizationMembership.objects.create(
+            organization=org, user=member_user, role=Role.MEMBER
+        )
+        client = make_auth_client(admin_user)
+        variables = {
+            "input": {
+                "organizationId": f"00{org.id}",
+                "userId": str(member_user.id),
+                "role": "member",
+            }
+        }
+        assert "errors" not in post(client, UPDATE_MEMBER_ROLE, variables)
+
+        admin.role = Role.MEMBER
+        admin.save(update_fields=["role"])
+
+        data = post(client, UPDATE_MEMBER_ROLE, variables)
+        assert data["errors"][0]["message"] == "권한이 부족합니다."
@@ -1,7 +1,22 @@
+import json
+from types import SimpleNamespace
+
 import pytest
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from organizations.decorators import (
+    check_role,
+    forget_membership,
+    get_membership,
+    get_request_membership,
+    remember_membership,
+)
+from organizations.models import Organization, OrganizationMembership, Role
 
-from organizations.decorators import check_role, get_membership
-from organizations.models import OrganizationMembership, Role
+GRAPHQL_URL = reverse("graphql")
 
 
 @pytest.mark.django_db
@@ -53,3 +68,130 @@ class TestCheckRole:
         assert check_role(membership, Role.MEMBER) is True
         assert check_role(membership, Role.ADMIN) is False
         assert check_role(membership, Role.OWNER) is False
+
+
+def make_info(user):
+    request = RequestFactory().post("/graphql/")
+    request.user = user
+    return SimpleNamespace(context=request)
+
+
+@pytest.mark.django_db
+class TestRequestMembershipCache:
+    def test_lookup_is_memoized_per_request(
+        self, organization_factory, user_factory, django_assert_num_queries
+    ):
+        org = organization_factory()
+        user = user_factory()
+        OrganizationMembership.objects.create(
+            organization=org, user=user, role=Role.ADMIN
+        )
+        info = make_info(user)
+
+        with django_assert_num_queries(1):
+            first = get_request_membership(info, org.id)
+            # GraphQL ID 인자(str)와 FK 값(int)은 같은 키다.
+            second = get_request_membership(info, str(org.id))
+
+        assert first is second
+        assert get_request_membership(make_info(user), org.id) is not first
+
+    def test_non_member_is_cached(
+        self, organization_factory, user_factory, django_assert_num_queries
+    ):
+        org = organization_factory()
+        info = make_info(user_factory())
+
+        with django_assert_num_queries(1):
+            assert get_request_membership(info, org.id) is None
+            assert get_request_membership(info, org.id) is None
+
+    def test_remember_and_forget(self, organization_factory, user_factory):
+        org = organization_factory()
+        user = user_factory()
+        info = make_info(user)
+        assert get_request_membership(info, org.id) is None
+
+        membership = OrganizationMembership.objects.create(
+            organization=org, user=user, role=Role.MEMBER
+        )
+        remember_membership(info, membership)
+        assert get_request_membership(info, org.id) is membership
+
+        membership.delete()
+        forget_membership(info, org.id, user.id)
+        assert get_request_membership(info, org.id) is None
+
+
+@pytest.mark.django_db
+class TestMembershipCacheInBatches:
+    def _post(self, client, operations):
+        response = client.post(
+            GRAPHQL_URL, json.dumps(operations), content_type="application/json"
+        )
+        return response.json()
+
+    def test_batched_operations_share_lookup(
+        self, auth_client, verified_user, organization_factory
+    ):
+        org = organization_factory()
+        OrganizationMembership.objects.create(
+            organization=org, user=verified_user, role=Role.MEMBER
+        )
+        query = """
+            query Projects($organizationId: ID!) {
+                projects(organizationId: $organizationId) { id }
+            }
+        """
+        operation = {"query": query, "variables": {"organizationId": str(org.id)}}
+
+        with CaptureQueriesContext(connection) as context:
+            results = self._post(auth_client, [operation, operation])
+
+        assert all("errors" not in result for result in results)
+        membership_queries = [
+            q
+            for q in context.captured_queries
+            if 'FROM "organizations_organizationmembership"' in q["sql"]
+        ]
+        assert len(membership_queries) == 1
+
+    def test_role_change_is_visible_to_later_operations(
+        self, auth_client, verified_user, organization_factory, user_factory
+    ):
+        org = organization_factory()
+        OrganizationMembership.objects.create(
+            organization=org, user=verified_user, role=Role.OWNER
+        )
+        new_owner = user_factory()
+        OrganizationMembership.objects.create(
+            organization=org, user=new_owner, role=Role.ADMIN
+        )
+        transfer = """
+            mutation Transfer($input: TransferOwnershipInput!) {
+                transferOwnership(input: $input) { organization { id } }
+            }
+        """
+        delete = """
+            mutation Delete($id: ID!) { deleteOrganization(id: $id) { success } }
+        """
+
+        transferred, deleted = self._post(
+            auth_client,
+            [
+                {
+                    "query": transfer,
+                    "variables": {
+                        "input": {
+                            "organizationId": str(org.id),
+                            "userId": str(new_owner.id),
+                        }
+                    },
+                },
+                {"query": delete, "variables": {"id": str(org.id)}},
+            ],
+        )
+
+        assert "errors" not in transferred
+        assert deleted["errors"][0]["message"] == "권한이 부족합니다."
+        assert Organization.objects.filter(pk=org.id).exists()
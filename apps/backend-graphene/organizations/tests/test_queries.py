@@ -1,6 +1,8 @@
 import json
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from organizations.models import OrganizationMembership, Role
@@ -171,3 +173,184 @@ class TestOrganizationDetailQuery:
         data = response.json()
         members = data["data"]["organization"]["members"]
         assert len(members) == 2
+
+
+MY_ORGANIZATIONS_WITH_MEMBERS_QUERY = """
+    query {
+        myOrganizations {
+            id
+            createdBy {
+                id
+            }
+            members {
+                role
+                user {
+                    id
+                    email
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.mark.django_db
+class TestMyOrganizationsBatching:
+    def test_nested_members_load_in_constant_queries(
+        self,
+        auth_client,
+        verified_user,
+        organization_factory,
+        user_factory,
+        django_assert_num_queries,
+    ):
+        for _ in range(5):
+            org = organization_factory()
+            OrganizationMembership.objects.create(
+                organization=org, user=verified_user, role=Role.MEMBER
+            )
+            OrganizationMembership.objects.create(
+                organization=org,
+                user=user_factory(email_verified=True),
+                role=Role.OWNER,
+            )
+
+        # organizations(+createdBy JOIN), memberships(+user JOIN)
+        # (JWT 사용자는 token claim으로 만들어 조회하지 않는다)
+        with django_assert_num_queries(2):
+            response = auth_client.post(
+                GRAPHQL_URL,
+                json.dumps({"query": MY_ORGANIZATIONS_WITH_MEMBERS_QUERY}),
+                content_type="application/json",
+            )
+        data = response.json()
+        assert "errors" not in data
+        orgs = data["data"]["myOrganizations"]
+        assert len(orgs) == 5
+        assert all(len(org["members"]) == 2 for org in orgs)
+
+    def test_unrequested_columns_are_not_fetched(
+        self, auth_client, verified_user, organization_factory
+    ):
+        org = organization_factory(description="Long description")
+        OrganizationMembership.objects.create(
+            organization=org, user=verified_user, role=Role.OWNER
+        )
+        query = "query { myOrganizations { id name } }"
+
+        with CaptureQueriesContext(connection) as context:
+            response = auth_client.post(
+                GRAPHQL_URL,
+                json.dumps({"query": query}),
+                content_type="application/json",
+            )
+        assert response.json()["data"]["myOrganizations"][0]["name"] == org.name
+        org_sql = next(
+            q["sql"] for q in context.captured_queries if "DISTINCT" in q["sql"]
+        )
+        assert '"description"' not in org_sql
+
+
+MY_ORGANIZATIONS_CONNECTION_QUERY = """
+    query MyOrganizations($first: Int, $after: String, $membersFirst: Int) {
+        myOrganizationsConnection(first: $first, after: $after) {
+            edges {
+                cursor
+                node {
+                    id
+                    membersConnection(first: $membersFirst) {
+                        edges {
+                            node {
+                                user {
+                                    id
+                                }
+                            }
+                        }
+                        pageInfo {
+                            hasNextPage
+                        }
+                    }
+                }
+            }
+            pageInfo {
+                hasNextPage
+                hasPreviousPage
+                endCursor
+            }
+        }
+    }
+"""
+
+
+@pytest.mark.django_db
+class TestMyOrganizationsConnection:
+    def _post(self, client, **variables):
+        response = client.post(
+            GRAPHQL_URL,
+            json.dumps(
+                {"query": MY_ORGANIZATIONS_CONNECTION_QUERY, "variables": variables}
+            ),
+            content_type="application/json",
+        )
+        return response.json()
+
+    def test_pages_through_organizations(
+        self, auth_client, verified_user, organization_factory
+    ):
+        orgs = [organization_factory() for _ in range(5)]
+        for org in orgs:
+            OrganizationMembership.objects.create(
+                organization=org, user=verified_user, role=Role.MEMBER
+            )
+
+        seen = []
+        after = None
+        for expected_has_next in (True, True, False):
+            data = self._post(auth_client, first=2, after=after)
+            connection_data = data["data"]["myOrganizationsConnection"]
+            seen += [edge["node"]["id"] for edge in connection_data["edges"]]
+            assert connection_data["pageInfo"]["hasNextPage"] is expected_has_next
+            assert connection_data["pageInfo"]["hasPreviousPage"] is bool(after)
+            after = connection_data["pageInfo"]["endCursor"]
+
+        assert seen == [str(org.id) for org in orgs]
+
+    def test_nested_members_are_paginated_in_constant_queries(
+        self,
+        auth_client,
+        verified_user,
+        organization_factory,
+        user_factory,
+        django_assert_num_queries,
+    ):
+        for _ in range(3):
+            org = organization_factory()
+            OrganizationMembership.objects.create(
+                organization=org, user=verified_user, role=Role.OWNER
+            )
+            for _ in range(2):
+                OrganizationMembership.objects.create(
+                    organization=org, user=user_factory(), role=Role.MEMBER
+                )
+
+        # organizations, memberships 페이지(윈도 함수), users
+        with django_assert_num_queries(3):
+            data = self._post(auth_client, membersFirst=2)
+
+        edges = data["data"]["myOrganizationsConnection"]["edges"]
+        assert len(edges) == 3
+        for edge in edges:
+            members = edge["node"]["membersConnection"]
+            assert members["edges"][0]["node"]["user"]["id"] == str(verified_user.id)
+            assert len(members["edges"]) == 2
+            assert members["pageInfo"]["hasNextPage"] is True
+
+    def test_invalid_cursor(self, auth_client):
+        data = self._post(auth_client, after="not-a-cursor", membersFirst=2)
+
+        assert data["errors"][0]["message"] == "잘못된 cursor입니다."
+
+    def test_first_over_limit(self, auth_client):
+        data = self._post(auth_client, first=1000, membersFirst=2)
+
+        assert data["errors"][0]["message"] == "first는 100 이하여야 합니다."
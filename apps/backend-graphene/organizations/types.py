@@ -1,7 +1,14 @@
 import graphene
 from graphene_django import DjangoObjectType
 
+from config.optimizer import is_prefetched
+from config.pagination import connection_from_loader
+from organizations.loaders import (
+    OrganizationMembershipsLoader,
+    OrganizationMembersPageLoader,
+)
 from organizations.models import Organization, OrganizationMembership
+from users.loaders import UserLoader, get_loader, load_related
 from users.types import UserType
 
 
@@ -19,9 +26,30 @@ class OrganizationType(DjangoObjectType):
         ]
 
     members = graphene.List(lambda: OrganizationMemberType)
+    members_connection = graphene.Field(
+        lambda: OrganizationMemberConnection,
+        first=graphene.Int(),
+        after=graphene.String(),
+    )
+
+    optimizer_hints = {"members": "memberships"}
 
     def resolve_members(self, info):
-        return self.memberships.select_related("user").all()
+        if is_prefetched(self, "memberships"):
+            return self.memberships.all()
+        return get_loader(info, OrganizationMembershipsLoader).load(self.id)
+
+    def resolve_members_connection(self, info, first=None, after=None):
+        return connection_from_loader(
+            get_loader(info, OrganizationMembersPageLoader),
+            self.id,
+            OrganizationMemberConnection,
+            first,
+            after,
+        )
+
+    def resolve_created_by(self, info):
+        return load_related(info, self, "created_by", UserLoader)
 
 
 class OrganizationMemberType(DjangoObjectType):
@@ -32,7 +60,17 @@ class OrganizationMemberType(DjangoObjectType):
     user = graphene.Field(UserType)
 
     def resolve_user(self, info):
-        return self.user
+        return load_related(info, self, "user", UserLoader)
+
+
+class OrganizationConnection(graphene.relay.Connection):
+    class Meta:
+        node = OrganizationType
+
+
+class OrganizationMemberConnection(graphene.relay.Connection):
+    class Meta:
+        node = OrganizationMemberType
 
 
 class CreateOrganizationInput(graphene.InputObjectType):
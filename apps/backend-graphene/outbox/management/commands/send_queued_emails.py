@@ -0,0 +1,52 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from outbox.utils import dispatch_due_emails, purge_sent_emails
+
+# 보낸 메일을 정리하는 최소 간격(초)
+PURGE_INTERVAL = 3600
+
+
+class Command(BaseCommand):
+    help = "outbox에 쌓인 메일을 보낸다. 기본은 계속 실행되는 worker이다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="보낼 메일이 없을 때 다시 확인하기까지 기다리는 시간(초)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="지금 보낼 수 있는 메일을 모두 보내고 종료한다.",
+        )
+        parser.add_argument(
+            "--purge-sent-after",
+            type=int,
+            metavar="DAYS",
+            help="보낸 지 DAYS일이 지난 메일을 보낼 메일이 없을 때 지운다.",
+        )
+
+    def handle(self, *args, **options):
+        purge_after = options["purge_sent_after"]
+        purged_at = None
+        while True:
+            sent, failed = dispatch_due_emails(options["batch_size"])
+            if sent or failed:
+                self.stdout.write(f"보냄 {sent}, 실패 {failed}")
+                continue
+            if purge_after is not None and (
+                purged_at is None or time.monotonic() - purged_at >= PURGE_INTERVAL
+            ):
+                purged = purge_sent_emails(timedelta(days=purge_after))
+                purged_at = time.monotonic()
+                if purged:
+                    self.stdout.write(f"보낸 메일 {purged}개 삭제")
+            if options["once"]:
+                return
+            time.sleep(options["interval"])
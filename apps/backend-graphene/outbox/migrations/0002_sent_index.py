@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-10-18 05:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('outbox', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='outgoingemail',
+            index=models.Index(fields=['status', 'sent_at'], name='outbox_sent_idx'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.mail import get_connection
+
+
+def send_bulk(messages, batch_size=None, concurrency=None):
+    """EmailMessage 목록을 batch_size개씩 묶어 묶음마다 연결 하나로 보낸다.
+
+    묶음은 최대 concurrency개를 동시에 보내므로, 메일 서버에 열리는 연결도
+    concurrency개를 넘지 않는다.
+    Returns messages와 같은 순서의 결과 목록. 보낸 메일은 None, 실패한 메일은
+    발생한 예외이다.
+    """
+    batch_size = batch_size or settings.EMAIL_BULK_BATCH_SIZE
+    concurrency = concurrency or settings.EMAIL_BULK_CONCURRENCY
+    messages = list(messages)
+    batches = [
+        messages[start : start + batch_size]
+        for start in range(0, len(messages), batch_size)
+    ]
+    if concurrency == 1 or len(batches) <= 1:
+        results = map(_send_batch, batches)
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(_send_batch, batches))
+    return [error for batch_errors in results for error in batch_errors]
+
+
+def _send_batch(messages):
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as e:
+        return [e] * len(messages)
+
+    errors = []
+    try:
+        for message in messages:
+            message.connection = connection
+            try:
+                message.send()
+            except Exception as e:
+                errors.append(e)
+            else:
+                errors.append(None)
+    finally:
+        connection.close()
+    return errors
@@ -0,0 +1,180 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.utils import timezone
+
+from outbox.models import OutgoingEmail
+from outbox.sender import send_bulk
+from outbox.utils import (
+    dispatch_due_emails,
+    enqueue_email,
+    purge_sent_emails,
+    retry_delay,
+)
+
+
+def queue(count=1):
+    for index in range(count):
+        enqueue_email(f"제목 {index}", "본문", [f"user{index}@example.com"])
+
+
+@pytest.mark.django_db
+class TestDispatchDueEmails:
+    def test_sends_and_marks_sent(self):
+        queue(3)
+
+        assert dispatch_due_emails(batch_size=10) == (3, 0)
+
+        assert [message.to for message in mail.outbox] == [
+            ["user0@example.com"],
+            ["user1@example.com"],
+            ["user2@example.com"],
+        ]
+        assert set(OutgoingEmail.objects.values_list("status", flat=True)) == {
+            OutgoingEmail.Status.SENT
+        }
+
+    def test_one_connection_per_batch(self):
+        queue(3)
+
+        with mock.patch.object(
+            EmailBackend, "open", autospec=True, side_effect=EmailBackend.open
+        ) as opened:
+            dispatch_due_emails(batch_size=10)
+
+        assert opened.call_count == 1
+
+    def test_batch_size_limits_work(self):
+        queue(3)
+
+        assert dispatch_due_emails(batch_size=2) == (2, 0)
+        assert OutgoingEmail.objects.filter(status="pending").count() == 1
+
+    def test_failure_is_retried_with_backoff(self, settings):
+        settings.EMAIL_OUTBOX_RETRY_DELAY = 60
+        queue()
+
+        with mock.patch.object(
+            EmailBackend, "send_messages", side_effect=OSError("smtp down")
+        ):
+            assert dispatch_due_emails(batch_size=10) == (0, 1)
+
+        email = OutgoingEmail.objects.get()
+        assert email.status == OutgoingEmail.Status.PENDING
+        assert email.attempts == 1
+        assert email.last_error == "OSError: smtp down"
+        assert email.next_attempt_at > timezone.now() + timedelta(seconds=50)
+        # 아직 다시 시도할 때가 아니다.
+        assert dispatch_due_emails(batch_size=10) == (0, 0)
+
+    def test_gives_up_after_max_attempts(self, settings):
+        settings.EMAIL_OUTBOX_MAX_ATTEMPTS = 2
+        settings.EMAIL_OUTBOX_RETRY_DELAY = 0
+        queue()
+
+        with mock.patch.object(
+            EmailBackend, "send_messages", side_effect=OSError("smtp down")
+        ):
+            dispatch_due_emails(batch_size=10)
+            dispatch_due_emails(batch_size=10)
+
+        email = OutgoingEmail.objects.get()
+        assert email.status == OutgoingEmail.Status.FAILED
+        assert email.attempts == 2
+
+    def test_claimed_emails_are_skipped_while_sending(self):
+        queue(2)
+        nested = []
+
+        def send_and_dispatch_again(messages):
+            # 보내는 동안 다른 worker가 같은 메일을 잡지 않는다.
+            nested.append(dispatch_due_emails(batch_size=10))
+            return send_bulk(messages)
+
+        with mock.patch("outbox.utils.send_bulk", side_effect=send_and_dispatch_again):
+            assert dispatch_due_emails(batch_size=10) == (2, 0)
+
+        assert nested == [(0, 0)]
+        assert len(mail.outbox) == 2
+
+    def test_crash_keeps_results_of_sent_chunks(self, settings):
+        settings.EMAIL_BULK_BATCH_SIZE = 1
+        settings.EMAIL_BULK_CONCURRENCY = 1
+        settings.EMAIL_OUTBOX_CLAIM_TIMEOUT = 300
+        queue(3)
+
+        # 첫 묶음을 보낸 뒤 worker가 죽는다.
+        with mock.patch(
+            "outbox.utils.send_bulk", side_effect=[[None], RuntimeError("crash")]
+        ):
+            with pytest.raises(RuntimeError):
+                dispatch_due_emails(batch_size=10)
+
+        first, *rest = OutgoingEmail.objects.order_by("pk")
+        assert first.status == OutgoingEmail.Status.SENT
+        for email in rest:
+            assert email.status == OutgoingEmail.Status.PENDING
+            assert email.next_attempt_at > timezone.now() + timedelta(seconds=250)
+        # 잡아 둔 시간이 지나야 다시 보낸다.
+        assert dispatch_due_emails(batch_size=10) == (0, 0)
+
+    def test_retry_delay_is_capped(self, settings):
+        settings.EMAIL_OUTBOX_RETRY_DELAY = 60
+        settings.EMAIL_OUTBOX_RETRY_MAX_DELAY = 300
+
+        assert retry_delay(1) == timedelta(seconds=60)
+        assert retry_delay(2) == timedelta(seconds=120)
+        assert retry_delay(10) == timedelta(seconds=300)
+
+
+def sent_email(days_ago):
+    return OutgoingEmail.objects.create(
+        subject="제목",
+        body="본문",
+        to=["user@example.com"],
+        status=OutgoingEmail.Status.SENT,
+        sent_at=timezone.now() - timedelta(days=days_ago),
+    )
+
+
+@pytest.mark.django_db
+class TestPurgeSentEmails:
+    def test_deletes_only_old_sent_emails(self):
+        old = sent_email(days_ago=10)
+        recent = sent_email(days_ago=1)
+        queue()
+
+        assert purge_sent_emails(timedelta(days=7), batch_size=1) == 1
+
+        remaining = set(OutgoingEmail.objects.values_list("pk", flat=True))
+        assert old.pk not in remaining
+        assert recent.pk in remaining
+        assert OutgoingEmail.objects.filter(status="pending").exists()
+
+
+@pytest.mark.django_db
+class TestSendQueuedEmailsCommand:
+    def test_once_drains_outbox(self):
+        queue(5)
+        out = StringIO()
+
+        call_command("send_queued_emails", "--once", "--batch-size", "2", stdout=out)
+
+        assert len(mail.outbox) == 5
+        assert not OutgoingEmail.objects.filter(status="pending").exists()
+
+    def test_purge_sent_after(self):
+        sent_email(days_ago=10)
+        queue()
+
+        call_command(
+            "send_queued_emails", "--once", "--purge-sent-after", "7", stdout=StringIO()
+        )
+
+        assert OutgoingEmail.objects.count() == 1
+        assert OutgoingEmail.objects.get().status == OutgoingEmail.Status.SENT
@@ -0,0 +1,68 @@
+from unittest import mock
+
+from django.core import mail
+from django.core.mail import EmailMessage
+from django.core.mail.backends.locmem import EmailBackend
+
+from outbox.sender import send_bulk
+
+
+def messages(count):
+    return [
+        EmailMessage(f"제목 {index}", "본문", to=[f"user{index}@example.com"])
+        for index in range(count)
+    ]
+
+
+def opened_connections():
+    return mock.patch.object(
+        EmailBackend, "open", autospec=True, side_effect=EmailBackend.open
+    )
+
+
+class TestSendBulk:
+    def test_sends_all_and_reports_success(self):
+        assert send_bulk(messages(3)) == [None, None, None]
+        assert len(mail.outbox) == 3
+
+    def test_one_connection_per_batch(self):
+        with opened_connections() as opened:
+            send_bulk(messages(5), batch_size=2)
+
+        assert opened.call_count == 3
+        assert len(mail.outbox) == 5
+
+    def test_concurrent_batches_keep_message_order(self):
+        with opened_connections() as opened:
+            errors = send_bulk(messages(10), batch_size=3, concurrency=4)
+
+        assert errors == [None] * 10
+        assert opened.call_count == 4
+        assert sorted(message.to[0] for message in mail.outbox) == sorted(
+            f"user{index}@example.com" for index in range(10)
+        )
+
+    def test_reports_per_message_failure(self):
+        original = EmailBackend.send_messages
+
+        def fail_second(backend, email_messages):
+            if email_messages[0].to == ["user1@example.com"]:
+                raise OSError("rejected")
+            return original(backend, email_messages)
+
+        with mock.patch.object(
+            EmailBackend, "send_messages", autospec=True, side_effect=fail_second
+        ):
+            errors = send_bulk(messages(3))
+
+        assert errors[0] is None
+        assert isinstance(errors[1], OSError)
+        assert errors[2] is None
+        assert len(mail.outbox) == 2
+
+    def test_connection_failure_fails_whole_batch(self):
+        error = OSError("connection refused")
+        with mock.patch.object(EmailBackend, "open", side_effect=error):
+            assert send_bulk(messages(2)) == [error, error]
+
+        assert mail.outbox == []
@@ -0,0 +1,108 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage
+from django.db import transaction
+from django.utils import timezone
+
+from outbox.models import OutgoingEmail
+from outbox.sender import send_bulk
+
+
+def enqueue_email(subject, message, recipient_list, from_email=None):
+    """send_mail 대신 outbox에 메일을 쌓는다. 호출한 트랜잭션과 함께 커밋된다."""
+    return OutgoingEmail.objects.create(
+        subject=subject,
+        body=message,
+        from_email=from_email or "",
+        to=list(recipient_list),
+    )
+
+
+def retry_delay(attempts):
+    """attempts번 실패한 뒤 다음 시도까지 기다릴 시간 (지수 backoff)."""
+    delay = settings.EMAIL_OUTBOX_RETRY_DELAY * 2 ** (attempts - 1)
+    return timedelta(seconds=min(delay, settings.EMAIL_OUTBOX_RETRY_MAX_DELAY))
+
+
+def dispatch_due_emails(batch_size):
+    """발송할 때가 된 메일을 batch_size개까지 send_bulk로 보낸다.
+
+    짧은 트랜잭션에서 행을 잡아(skip_locked) next_attempt_at을
+    EMAIL_OUTBOX_CLAIM_TIMEOUT 뒤로 미루고, 트랜잭션 밖에서 보낸다. 결과는 연결
+    묶음을 보낼 때마다 기록하므로 worker가 죽어도 기록하지 못한 묶음만 다시
+    보낸다. 실패한 메일은 backoff 후 다시 시도하고, EMAIL_OUTBOX_MAX_ATTEMPTS번
+    실패하면 failed로 남긴다.
+    Returns (보낸 수, 실패한 수) 튜플.
+    """
+    emails = _claim_due_emails(batch_size)
+    chunk_size = settings.EMAIL_BULK_BATCH_SIZE * settings.EMAIL_BULK_CONCURRENCY
+    sent = failed = 0
+    for start in range(0, len(emails), chunk_size):
+        chunk = emails[start : start + chunk_size]
+        errors = send_bulk(_message(email) for email in chunk)
+        now = timezone.now()
+        for email, error in zip(chunk, errors):
+            if error is None:
+                email.status = OutgoingEmail.Status.SENT
+                email.sent_at = now
+                sent += 1
+            else:
+                _mark_failed(email, error, now)
+                failed += 1
+        OutgoingEmail.objects.bulk_update(
+            chunk,
+            ["status", "attempts", "next_attempt_at", "last_error", "sent_at"],
+        )
+    return sent, failed
+
+
+def _claim_due_emails(batch_size):
+    now = timezone.now()
+    with transaction.atomic():
+        emails = list(
+            OutgoingEmail.objects.select_for_update(skip_locked=True)
+            .filter(status=OutgoingEmail.Status.PENDING, next_attempt_at__lte=now)
+            .order_by("next_attempt_at", "pk")[:batch_size]
+        )
+        if emails:
+            OutgoingEmail.objects.filter(pk__in=[email.pk for email in emails]).update(
+                next_attempt_at=now
+                + timedelta(seconds=settings.EMAIL_OUTBOX_CLAIM_TIMEOUT)
+            )
+    return emails
+
+
+def purge_sent_emails(older_than, batch_size=1000):
+    """보낸 지 older_than(timedelta)이 지난 메일을 batch 단위로 지운다.
+
+    batch마다 별도 트랜잭션이므로 잠금이 짧다. Returns 지운 수.
+    """
+    expired = OutgoingEmail.objects.filter(
+        status=OutgoingEmail.Status.SENT, sent_at__lt=timezone.now() - older_than
+    ).order_by("pk")
+    total = 0
+    while True:
+        ids = list(expired.values_list("pk", flat=True)[:batch_size])
+        if not ids:
+            return total
+        deleted, _ = OutgoingEmail.objects.filter(pk__in=ids).delete()
+        total += deleted
+
+
+def _message(email):
+    return EmailMessage(
+        subject=email.subject,
+        body=email.body,
+        from_email=email.from_email or None,
+        to=email.to,
+    )
+
+
+def _mark_failed(email, error, now):
+    email.attempts += 1
+    email.last_error = f"{type(error).__name__}: {error}"
+    if email.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+        email.status = OutgoingEmail.Status.FAILED
+    else:
+        email.next_attempt_at = now + retry_delay(email.attempts)
@@ -0,0 +1 @@
+# Register your models here.
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class PersistedQueriesConfig(AppConfig):
+    name = "persisted_queries"
+
+    def ready(self):
+        from persisted_queries import checks  # noqa: F401
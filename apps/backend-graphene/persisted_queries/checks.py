@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.core.checks import Error, register
+
+from persisted_queries.stores import get_store, store_is_shared
+
+
+@register()
+def check_allowlist_store(app_configs, **kwargs):
+    """allow-list 모드는 관리 명령으로 등록한 문서를 모든 worker가 봐야 한다."""
+    if not settings.GRAPHENE.get("PERSISTED_QUERIES_ALLOWLIST_ONLY", False):
+        return []
+    if store_is_shared(get_store()):
+        return []
+    return [
+        Error(
+            "PERSISTED_QUERIES_ALLOWLIST_ONLY에는 공유 저장소가 필요합니다.",
+            hint=(
+                'PERSISTED_QUERIES_STORE를 "database"로 두거나 '
+                "Redis/Memcached cache(CACHE_URL)를 설정하세요."
+            ),
+            id="persisted_queries.E001",
+        )
+    ]
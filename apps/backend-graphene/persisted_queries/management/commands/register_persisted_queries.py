@@ -0,0 +1,30 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from config.documents import document_hash
+from persisted_queries.stores import get_store, store_is_shared
+
+
+class Command(BaseCommand):
+    help = "GraphQL 문서 파일을 persisted query 저장소(allow-list)에 등록한다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="+", help=".graphql 문서 파일 경로")
+
+    def handle(self, *args, **options):
+        store = get_store()
+        if not store_is_shared(store):
+            raise CommandError(
+                "persisted query 저장소가 이 프로세스의 메모리 cache라서 등록한 "
+                "문서가 명령이 끝나면 사라집니다. PERSISTED_QUERIES_STORE를 "
+                '"database"로 두거나 공유 cache(CACHE_URL)를 설정하세요.'
+            )
+        for path in options["paths"]:
+            try:
+                query = Path(path).read_text(encoding="utf-8")
+            except OSError as e:
+                raise CommandError(f"{path}: {e}")
+            sha256_hash = document_hash(query)
+            store.register(sha256_hash, query)
+            self.stdout.write(f"{sha256_hash}  {path}")
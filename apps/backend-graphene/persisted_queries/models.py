@@ -0,0 +1,10 @@
+from django.db import models
+
+
+class PersistedQuery(models.Model):
+    sha256_hash = models.CharField(max_length=64, unique=True)
+    query = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.sha256_hash
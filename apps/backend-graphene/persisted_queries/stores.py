@@ -0,0 +1,82 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+
+from config.caches import is_shared_cache
+from persisted_queries.models import PersistedQuery
+
+CACHE_KEY_PREFIX = "persisted_query:"
+
+
+class CachePersistedQueryStore:
+    """hash -> 쿼리 문서를 Django cache에 저장한다.
+
+    set은 클라이언트 자동 등록, register는 register_persisted_queries 명령의
+    등록이다. cache 저장소에서는 둘이 같다.
+    """
+
+    def __init__(self, timeout=None):
+        self.timeout = timeout
+
+    def is_shared(self):
+        """다른 프로세스(worker, 관리 명령)가 등록한 문서를 볼 수 있는지."""
+        return is_shared_cache()
+
+    def get(self, sha256_hash):
+        return cache.get(f"{CACHE_KEY_PREFIX}{sha256_hash}")
+
+    def set(self, sha256_hash, query):
+        cache.set(f"{CACHE_KEY_PREFIX}{sha256_hash}", query, self.timeout)
+
+    def register(self, sha256_hash, query):
+        self.set(sha256_hash, query)
+
+
+class DatabasePersistedQueryStore(CachePersistedQueryStore):
+    """PersistedQuery 테이블을 원본으로 두고 Django cache를 read-through로 쓴다.
+
+    테이블에는 register_persisted_queries로 등록한 문서만 쓴다. 클라이언트
+    자동 등록(set)은 익명 요청으로도 일어나므로 크기가 제한된 cache에만 둔다.
+    """
+
+    def is_shared(self):
+        return True
+
+    def get(self, sha256_hash):
+        query = super().get(sha256_hash)
+        if query is not None:
+            return query
+
+        query = (
+            PersistedQuery.objects.filter(sha256_hash=sha256_hash)
+            .values_list("query", flat=True)
+            .first()
+        )
+        if query is not None:
+            super().set(sha256_hash, query)
+        return query
+
+    def register(self, sha256_hash, query):
+        PersistedQuery.objects.get_or_create(
+            sha256_hash=sha256_hash, defaults={"query": query}
+        )
+        self.set(sha256_hash, query)
+
+
+STORES = {
+    "cache": CachePersistedQueryStore,
+    "database": DatabasePersistedQueryStore,
+}
+
+
+def store_is_shared(store):
+    is_shared = getattr(store, "is_shared", None)
+    return is_shared() if is_shared is not None else True
+
+
+def get_store():
+    store = settings.GRAPHENE.get("PERSISTED_QUERIES_STORE", "cache")
+    store_class = STORES.get(store) or import_string(store)
+    return store_class(
+        timeout=settings.GRAPHENE.get("PERSISTED_QUERIES_CACHE_TIMEOUT"),
+    )
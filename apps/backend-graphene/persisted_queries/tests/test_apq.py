@@ -0,0 +1,198 @@
+import json
+
+import pytest
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+
+from config.documents import document_hash
+from persisted_queries.checks import check_allowlist_store
+from persisted_queries.models import PersistedQuery
+
+GRAPHQL_URL = reverse("graphql")
+
+ME_QUERY = "query Me { me { id email } }"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+def apq_extensions(query, sha256_hash=None):
+    return {
+        "persistedQuery": {
+            "version": 1,
+            "sha256Hash": sha256_hash or document_hash(query),
+        }
+    }
+
+
+def post(client, body):
+    return client.post(GRAPHQL_URL, json.dumps(body), content_type="application/json")
+
+
+@pytest.mark.django_db
+class TestAutomaticPersistedQueries:
+    def test_unknown_hash_returns_not_found(self, auth_client):
+        response = post(auth_client, {"extensions": apq_extensions(ME_QUERY)})
+        error = response.json()["errors"][0]
+        assert error["message"] == "PersistedQueryNotFound"
+        assert error["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+    def test_register_then_hash_only_request(self, auth_client, verified_user):
+        response = post(
+            auth_client, {"query": ME_QUERY, "extensions": apq_extensions(ME_QUERY)}
+        )
+        assert response.json()["data"]["me"]["email"] == verified_user.email
+
+        response = post(auth_client, {"extensions": apq_extensions(ME_QUERY)})
+        assert response.json()["data"]["me"]["email"] == verified_user.email
+
+    def test_hash_only_get_request(self, auth_client, verified_user):
+        post(auth_client, {"query": ME_QUERY, "extensions": apq_extensions(ME_QUERY)})
+        response = auth_client.get(
+            GRAPHQL_URL,
+            {"extensions": json.dumps(apq_extensions(ME_QUERY))},
+            HTTP_ACCEPT="application/json",
+        )
+        assert response.json()["data"]["me"]["email"] == verified_user.email
+
+    def test_hash_mismatch_is_rejected(self, auth_client):
+        response = post(
+            auth_client,
+            {"query": ME_QUERY, "extensions": apq_extensions(ME_QUERY, "0" * 64)},
+        )
+        error = response.json()["errors"][0]
+        assert error["extensions"]["code"] == "INVALID_SHA256_HASH"
+        assert cache.get(f"persisted_query:{'0' * 64}") is None
+
+    def test_unsupported_version(self, auth_client):
+        extensions = apq_extensions(ME_QUERY)
+        extensions["persistedQuery"]["version"] = 2
+        response = post(auth_client, {"query": ME_QUERY, "extensions": extensions})
+        error = response.json()["errors"][0]
+        assert error["extensions"]["code"] == "PERSISTED_QUERY_VERSION_NOT_SUPPORTED"
+
+    @pytest.mark.parametrize("query", ["not graphql", "query { unknownField }"])
+    def test_invalid_document_is_not_registered(self, auth_client, query):
+        body = {"query": query, "extensions": apq_extensions(query)}
+        assert post(auth_client, body).status_code == 400
+
+        response = post(auth_client, {"extensions": apq_extensions(query)})
+        error = response.json()["errors"][0]
+        assert error["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+    @pytest.mark.parametrize(
+        "extensions",
+        [{"persistedQuery": "x"}, {"persistedQuery": 1}, {"persistedQuery": [1]}, [1]],
+    )
+    def test_malformed_extensions_are_bad_request(self, auth_client, extensions):
+        response = post(auth_client, {"query": ME_QUERY, "extensions": extensions})
+        assert response.json()["errors"][0]["extensions"]["code"] == "BAD_REQUEST"
+
+        response = auth_client.get(
+            GRAPHQL_URL,
+            {"query": ME_QUERY, "extensions": json.dumps(extensions)},
+            HTTP_ACCEPT="application/json",
+        )
+        assert response.json()["errors"][0]["extensions"]["code"] == "BAD_REQUEST"
+
+
+@pytest.mark.django_db
+class TestDatabaseStore:
+    @pytest.fixture(autouse=True)
+    def database_store(self, settings):
+        settings.GRAPHENE = {**settings.GRAPHENE, "PERSISTED_QUERIES_STORE": "database"}
+
+    def test_client_registration_stays_in_cache(self, auth_client, verified_user):
+        post(auth_client, {"query": ME_QUERY, "extensions": apq_extensions(ME_QUERY)})
+
+        assert not PersistedQuery.objects.exists()
+        response = post(auth_client, {"extensions": apq_extensions(ME_QUERY)})
+        assert response.json()["data"]["me"]["email"] == verified_user.email
+
+    def test_invalid_documents_write_no_rows(self, auth_client):
+        for index in range(5):
+            query = f"not graphql {index}"
+            post(auth_client, {"query": query, "extensions": apq_extensions(query)})
+
+        assert not PersistedQuery.objects.exists()
+
+    def test_command_registration_persists_to_database(
+        self, auth_client, verified_user, tmp_path
+    ):
+        document = tmp_path / "me.graphql"
+        document.write_text(ME_QUERY)
+        call_command("register_persisted_queries", str(document))
+        assert PersistedQuery.objects.filter(
+            sha256_hash=document_hash(ME_QUERY)
+        ).exists()
+
+        cache.clear()
+        response = post(auth_client, {"extensions": apq_extensions(ME_QUERY)})
+        assert response.json()["data"]["me"]["email"] == verified_user.email
+
+
+@pytest.mark.django_db
+class TestAllowListMode:
+    @pytest.fixture(autouse=True)
+    def allowlist_only(self, settings):
+        settings.GRAPHENE = {
+            **settings.GRAPHENE,
+            "PERSISTED_QUERIES_STORE": "database",
+            "PERSISTED_QUERIES_ALLOWLIST_ONLY": True,
+        }
+
+    def test_unregistered_query_is_rejected(self, auth_client):
+        response = post(
+            auth_client, {"query": ME_QUERY, "extensions": apq_extensions(ME_QUERY)}
+        )
+        error = response.json()["errors"][0]
+        assert error["extensions"]["code"] == "PERSISTED_QUERY_NOT_ALLOWED"
+        assert not PersistedQuery.objects.exists()
+
+    def test_plain_unregistered_query_is_rejected(self, auth_client):
+        response = post(auth_client, {"query": ME_QUERY})
+        error = response.json()["errors"][0]
+        assert error["extensions"]["code"] == "PERSISTED_QUERY_NOT_ALLOWED"
+
+    def test_registered_query_executes(self, auth_client, verified_user, tmp_path):
+        document = tmp_path / "me.graphql"
+        document.write_text(ME_QUERY)
+        call_command("register_persisted_queries", str(document))
+
+        response = post(auth_client, {"extensions": apq_extensions(ME_QUERY)})
+        assert response.json()["data"]["me"]["email"] == verified_user.email
+
+        response = post(auth_client, {"query": ME_QUERY})
+        assert response.json()["data"]["me"]["email"] == verified_user.email
+
+
+class TestSharedStoreRequirement:
+    def test_command_refuses_process_local_cache_store(self, tmp_path):
+        document = tmp_path / "me.graphql"
+        document.write_text(ME_QUERY)
+
+        with pytest.raises(CommandError):
+            call_command("register_persisted_queries", str(document))
+
+    def test_allowlist_with_process_local_cache_store_fails_check(self, settings):
+        settings.GRAPHENE = {
+            **settings.GRAPHENE,
+            "PERSISTED_QUERIES_STORE": "cache",
+            "PERSISTED_QUERIES_ALLOWLIST_ONLY": True,
+        }
+
+        assert [error.id for error in check_allowlist_store(None)] == [
+            "persisted_queries.E001"
+        ]
+
+    def test_allowlist_with_database_store_passes_check(self, settings):
+        settings.GRAPHENE = {
+            **settings.GRAPHENE,
+            "PERSISTED_QUERIES_STORE": "database",
+            "PERSISTED_QUERIES_ALLOWLIST_ONLY": True,
+        }
+
+        assert check_allowlist_store(None) == []
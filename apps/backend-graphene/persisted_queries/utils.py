@@ -0,0 +1,90 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from graphql import GraphQLError
+
+from config.documents import document_hash
+from persisted_queries.stores import get_store
+
+APQ_VERSION = 1
+
+
+def _error(message, code):
+    return GraphQLError(message, extensions={"code": code})
+
+
+def get_persisted_query(extensions):
+    """extensions.persistedQuery를 꺼낸다. 객체가 아니면 BAD_REQUEST."""
+    if extensions is None:
+        return None
+    if not isinstance(extensions, dict):
+        raise _error("extensions는 객체여야 합니다.", "BAD_REQUEST")
+    persisted_query = extensions.get("persistedQuery")
+    if persisted_query is not None and not isinstance(persisted_query, dict):
+        raise _error("extensions.persistedQuery는 객체여야 합니다.", "BAD_REQUEST")
+    return persisted_query
+
+
+def resolve_persisted_query(query, extensions):
+    """APQ 프로토콜에 따라 실행할 쿼리 문자열을 결정한다.
+
+    - hash만 온 경우: 저장소에서 문서를 찾는다. 없으면 PersistedQueryNotFound를
+      돌려주어 클라이언트가 문서와 함께 재전송하게 한다.
+    - 문서와 hash가 함께 온 경우: hash를 검증한다. 문서가 파싱/검증을 통과한
+      뒤에 register_persisted_query로 등록하도록 hash를 함께 돌려준다.
+    - allow-list 모드에서는 미리 등록된 hash의 문서만 실행하며, 클라이언트
+      요청으로는 새 문서를 등록하지 않는다.
+    Returns (query, 등록할 hash 또는 None) 튜플.
+    """
+    allowlist_only = settings.GRAPHENE.get("PERSISTED_QUERIES_ALLOWLIST_ONLY", False)
+    persisted_query = get_persisted_query(extensions)
+
+    if not persisted_query:
+        if allowlist_only and query and get_store().get(document_hash(query)) is None:
+            raise _error("PersistedQueryNotAllowed", "PERSISTED_QUERY_NOT_ALLOWED")
+        return query, None
+
+    if persisted_query.get("version") != APQ_VERSION:
+        raise _error(
+            "Unsupported persisted query version",
+            "PERSISTED_QUERY_VERSION_NOT_SUPPORTED",
+        )
+
+    sha256_hash = persisted_query.get("sha256Hash")
+    if not isinstance(sha256_hash, str):
+        raise _error("persistedQuery.sha256Hash가 필요합니다.", "BAD_REQUEST")
+
+    store = get_store()
+    if not query:
+        query = store.get(sha256_hash)
+        if query is None:
+            raise _error("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")
+        return query, None
+
+    if document_hash(query) != sha256_hash:
+        raise _error("provided sha does not match query", "INVALID_SHA256_HASH")
+
+    if allowlist_only:
+        if store.get(sha256_hash) is None:
+            raise _error("PersistedQueryNotAllowed", "PERSISTED_QUERY_NOT_ALLOWED")
+        return query, None
+    return query, sha256_hash
+
+
+async def aresolve_persisted_query(query, extensions):
+    """async 뷰용 resolve_persisted_query.
+
+    저장소 조회가 필요 없는 일반 요청은 스레드로 넘기지 않고 바로 반환한다.
+    """
+    allowlist_only = settings.GRAPHENE.get("PERSISTED_QUERIES_ALLOWLIST_ONLY", False)
+    if not get_persisted_query(extensions) and not allowlist_only:
+        return query, None
+    return await sync_to_async(resolve_persisted_query)(query, extensions)
+
+
+def register_persisted_query(sha256_hash, query):
+    """검증을 통과한 클라이언트 문서를 자동 등록한다 (저장소의 cache에만 둔다)."""
+    get_store().set(sha256_hash, query)
+
+
+async def aregister_persisted_query(sha256_hash, query):
+    await sync_to_async(register_persisted_query)(sha256_hash, query)
@@ -0,0 +1,140 @@
+from collections import defaultdict
+
+from django.db import transaction
+
+from organizations.models import ROLE_HIERARCHY, OrganizationMembership, Role
+from projects.models import Project, ProjectAccess, ProjectMembership
+
+
+def effective_role(org_role, is_project_member):
+    """조직 역할과 프로젝트 멤버 여부로 프로젝트 실효 역할을 계산한다.
+
+    ADMIN 이상은 조직의 모든 프로젝트에 조직 역할 그대로 접근하고,
+    MEMBER는 참여한 프로젝트에만 member로 접근한다. 접근할 수 없으면 None.
+    """
+    if org_role is None:
+        return None
+    if ROLE_HIERARCHY[org_role] >= ROLE_HIERARCHY[Role.ADMIN]:
+        return org_role
+    return Role.MEMBER if is_project_member else None
+
+
+def expected_access(organization_ids=None, user_id=None, project_id=None):
+    """멤버십 테이블에서 계산한 ProjectAccess 행.
+
+    {(user, org, project): (role, project created_at)}
+    """
+    projects = Project.objects.all()
+    if organization_ids is not None:
+        projects = projects.filter(organization_id__in=organization_ids)
+    if project_id is not None:
+        projects = projects.filter(pk=project_id)
+    project_orgs = {}
+    project_created = {}
+    for project, organization_id, created_at in projects.values_list(
+        "id", "organization_id", "created_at"
+    ):
+        project_orgs[project] = organization_id
+        project_created[project] = created_at
+    if not project_orgs:
+        return {}
+
+    org_memberships = OrganizationMembership.objects.filter(
+        organization_id__in=set(project_orgs.values())
+    )
+    project_memberships = ProjectMembership.objects.filter(project_id__in=project_orgs)
+    if user_id is not None:
+        org_memberships = org_memberships.filter(user_id=user_id)
+        project_memberships = project_memberships.filter(user_id=user_id)
+
+    org_roles = defaultdict(dict)
+    for organization_id, member_id, role in org_memberships.values_list(
+        "organization_id", "user_id", "role"
+    ):
+        org_roles[organization_id][member_id] = role
+    joined = set(project_memberships.values_list("project_id", "user_id"))
+
+    rows = {}
+    for project, organization_id in project_orgs.items():
+        for member_id, org_role in org_roles[organization_id].items():
+            role = effective_role(org_role, (project, member_id) in joined)
+            if role is not None:
+                rows[(member_id, organization_id, project)] = (
+                    role,
+                    project_created[project],
+                )
+    return rows
+
+
+def actual_access(organization_ids=None, user_id=None, project_id=None):
+    queryset = ProjectAccess.objects.all()
+    if organization_ids is not None:
+        queryset = queryset.filter(organization_id__in=organization_ids)
+    if user_id is not None:
+        queryset = queryset.filter(user_id=user_id)
+    if project_id is not None:
+        queryset = queryset.filter(project_id=project_id)
+    return {
+        (member_id, organization_id, project): (role, created_at)
+        for member_id, organization_id, project, role, created_at in (
+            queryset.values_list(
+                "user_id", "organization_id", "project_id", "role", "created_at"
+            )
+        )
+    }
+
+
+def sync_access(organization_id=None, user_id=None, project_id=None):
+    """범위 안의 ProjectAccess 행을 멤버십 테이블과 일치시킨다.
+
+    멤버십/역할이 바뀐 트랜잭션 안에서 호출되므로, 변경이 롤백되면 함께 롤백된다.
+    """
+    organization_ids = None if organization_id is None else [organization_id]
+    with transaction.atomic():
+        expected = expected_access(organization_ids, user_id, project_id)
+        actual = actual_access(organization_ids, user_id, project_id)
+        stale = [key for key in actual if key not in expected]
+        changed = []
+        for key, value in expected.items():
+            if actual.get(key) == value:
+                continue
+            member_id, organization_id, project = key
+            role, created_at = value
+            changed.append(
+                ProjectAccess(
+                    user_id=member_id,
+                    organization_id=organization_id,
+                    project_id=project,
+                    role=role,
+                    created_at=created_at,
+                )
+            )
+        if stale:
+            _delete_rows(stale)
+        if changed:
+            ProjectAccess.objects.bulk_create(
+                changed,
+                update_conflicts=True,
+                unique_fields=["user", "project"],
+                update_fields=["organization", "role", "created_at"],
+            )
+        return len(stale), len(changed)
+
+
+def _delete_rows(keys):
+    """(사용자 한 명, 여러 프로젝트) 또는 (프로젝트 하나, 여러 사용자)로 묶어 지운다."""
+    by_user = defaultdict(list)
+    by_project = defaultdict(list)
+    for member_id, _, project in keys:
+        by_user[member_id].append(project)
+        by_project[project].append(member_id)
+    if len(by_user) <= len(by_project):
+        for member_id, projects in by_user.items():
+            ProjectAccess.objects.filter(
+                user_id=member_id, project_id__in=projects
+            ).delete()
+    else:
+        for project, member_ids in by_project.items():
+            ProjectAccess.objects.filter(
+                project_id=project, user_id__in=member_ids
+            ).delete()
@@ -1,13 +1,15 @@
 from functools import wraps
 
+from django.db.models import OuterRef, Subquery
 from graphql import GraphQLError
 
-from organizations.decorators import check_role, get_membership
-from organizations.models import Role
-from projects.models import Project, ProjectMembership
+from config.execution import is_async_execution, maybe_await
+from organizations.decorators import set_request_membership
+from organizations.models import ROLE_HIERARCHY, OrganizationMembership, Role
+from projects.models import Project, ProjectAccess
 
 
-def _get_project(kwargs, args):
+def _get_project_id(kwargs, args):
     input_arg = kwargs.get("input") or (args[0] if args else None)
     project_id = (
         getattr(input_arg, "project_id", None)
@@ -16,27 +18,67 @@ def _get_project(kwargs, args):
     )
     if not project_id:
         raise GraphQLError("Project ID가 필요합니다.")
+    return project_id
 
+
+def _authorization_queryset(user):
+    """프로젝트와 요청 사용자의 조직 멤버십, 프로젝트 실효 역할을 함께 조회한다."""
+    org_memberships = OrganizationMembership.objects.filter(
+        organization_id=OuterRef("organization_id"), user=user
+    )
+    return Project.objects.select_related("organization").annotate(
+        org_membership_id=Subquery(org_memberships.values("pk")[:1]),
+        org_role=Subquery(org_memberships.values("role")[:1]),
+        access_role=Subquery(
+            ProjectAccess.objects.filter(project_id=OuterRef("pk"), user=user).values(
+                "role"
+            )[:1]
+        ),
+    )
+
+
+def _get_project(user, kwargs, args):
+    project_id = _get_project_id(kwargs, args)
     try:
-        project = Project.objects.select_related("organization").get(pk=project_id)
+        project = _authorization_queryset(user).get(pk=project_id)
     except Project.DoesNotExist:
         raise GraphQLError("Project를 찾을 수 없습니다.")
 
     return project
 
 
-def _resolve_project_context(info, args, kwargs):
-    """프로젝트와 조직 멤버십을 확인하고 info.context에 저장한다.
+async def _aget_project(user, kwargs, args):
+    project_id = _get_project_id(kwargs, args)
+    try:
+        project = await _authorization_queryset(user).aget(pk=project_id)
+    except Project.DoesNotExist:
+        raise GraphQLError("Project를 찾을 수 없습니다.")
 
-    인증 확인, 프로젝트 조회, 조직 멤버십 확인을 수행한다.
-    Returns (project, org_membership) 튜플.
-    """
-    user = info.context.user
-    if not user.is_authenticated:
+    return project
+
+
+def _org_membership(project, user):
+    """annotate된 값으로 OrganizationMembership을 만든다. 나머지 필드는 deferred."""
+    if project.org_membership_id is None:
+        return None
+    return OrganizationMembership.from_db(
+        project._state.db,
+        ["id", "organization_id", "user_id", "role"],
+        [project.org_membership_id, project.organization_id, user.pk, project.org_role],
+    )
+
+
+def _has_access(project, min_role):
+    role = project.access_role
+    return role is not None and ROLE_HIERARCHY[role] >= ROLE_HIERARCHY[min_role]
+
+
+def _require_login(info):
+    if not info.context.user.is_authenticated:
         raise GraphQLError("로그인이 필요합니다.")
 
-    project = _get_project(kwargs, args)
-    org_membership = get_membership(user, project.organization_id)
+
+def _set_project_context(info, project, org_membership):
     if not org_membership:
         raise GraphQLError("이 Organization의 멤버가 아닙니다.")
 
@@ -45,17 +87,47 @@ def _resolve_project_context(info, args, kwargs):
     return project, org_membership
 
 
+def _resolve_project_context(info, args, kwargs):
+    """프로젝트와 조직 멤버십을 확인하고 info.context에 저장한다.
+
+    인증 확인 후 프로젝트, 조직 멤버십, ProjectAccess의 실효 역할을 쿼리
+    한 번으로 조회한다. 조회한 조직 멤버십은 요청 단위 캐시에도 넣는다.
+    Returns (project, org_membership) 튜플.
+    """
+    _require_login(info)
+    project = _get_project(info.context.user, kwargs, args)
+    org_membership = _org_membership(project, info.context.user)
+    set_request_membership(info, project.organization_id, org_membership)
+    return _set_project_context(info, project, org_membership)
+
+
+async def _aresolve_project_context(info, args, kwargs):
+    """_resolve_project_context의 async ORM 버전."""
+    _require_login(info)
+    project = await _aget_project(info.context.user, kwargs, args)
+    org_membership = _org_membership(project, info.context.user)
+    set_request_membership(info, project.organization_id, org_membership)
+    return _set_project_context(info, project, org_membership)
+
+
 def project_access_required(func):
+    async def async_wrapper(root, info, *args, **kwargs):
+        project, _ = await _aresolve_project_context(info, args, kwargs)
+
+        if not _has_access(project, Role.MEMBER):
+            raise GraphQLError("이 프로젝트에 접근할 권한이 없습니다.")
+
+        return await maybe_await(func(root, info, *args, **kwargs))
+
     @wraps(func)
     def wrapper(root, info, *args, **kwargs):
-        project, org_membership = _resolve_project_context(info, args, kwargs)
+        if is_async_execution():
+            return async_wrapper(root, info, *args, **kwargs)
 
-        if not check_role(org_membership, Role.ADMIN):
-            is_project_member = ProjectMembership.objects.filter(
-                project=project, user=info.context.user
-            ).exists()
-            if not is_project_member:
-                raise GraphQLError("이 프로젝트에 접근할 권한이 없습니다.")
+        project, _ = _resolve_project_context(info, args, kwargs)
+
+        if not _has_access(project, Role.MEMBER):
+            raise GraphQLError("이 프로젝트에 접근할 권한이 없습니다.")
 
         return func(root, info, *args, **kwargs)
 
@@ -63,11 +135,22 @@ def project_access_required(func):
 
 
 def project_admin_required(func):
+    async def async_wrapper(root, info, *args, **kwargs):
+        project, _ = await _aresolve_project_context(info, args, kwargs)
+
+        if not _has_access(project, Role.ADMIN):
+            raise GraphQLError("권한이 부족합니다.")
+
+        return await maybe_await(func(root, info, *args, **kwargs))
+
     @wraps(func)
     def wrapper(root, info, *args, **kwargs):
-        _, org_membership = _resolve_project_context(info, args, kwargs)
+        if is_async_execution():
+            return async_wrapper(root, info, *args, **kwargs)
+
+        project, _ = _resolve_project_context(info, args, kwargs)
 
-        if not check_role(org_membership, Role.ADMIN):
+        if not _has_access(project, Role.ADMIN):
             raise GraphQLError("권한이 부족합니다.")
 
         return func(root, info, *args, **kwargs)
@@ -0,0 +1,46 @@
+from collections import defaultdict
+
+from graphene.utils.dataloader import DataLoader as AsyncDataLoader
+from promise import Promise
+from promise.dataloader import DataLoader
+
+from config.pagination import AsyncKeysetPageLoader, KeysetPageLoader
+from projects.models import ProjectMembership
+
+
+class AsyncProjectMembershipsLoader(AsyncDataLoader):
+    async def batch_load_fn(self, project_ids):
+        memberships = defaultdict(list)
+        async for membership in ProjectMembership.objects.filter(
+            project_id__in=project_ids
+        ):
+            memberships[membership.project_id].append(membership)
+        return [memberships[project_id] for project_id in project_ids]
+
+
+class ProjectMembershipsLoader(DataLoader):
+    """project_id -> 해당 Project의 ProjectMembership 목록"""
+
+    async_loader_class = AsyncProjectMembershipsLoader
+
+    def batch_load_fn(self, project_ids):
+        memberships = defaultdict(list)
+        for membership in ProjectMembership.objects.filter(project_id__in=project_ids):
+            memberships[membership.project_id].append(membership)
+        return Promise.resolve([memberships[project_id] for project_id in project_ids])
+
+
+class ProjectMembersPage:
+    model = ProjectMembership
+    parent_field = "project_id"
+    ordering = ProjectMembership.KEYSET_ORDERING
+
+
+class AsyncProjectMembersPageLoader(ProjectMembersPage, AsyncKeysetPageLoader):
+    pass
+
+
+class ProjectMembersPageLoader(ProjectMembersPage, KeysetPageLoader):
+    """(project_id, page_size, after) -> ProjectMembership 페이지"""
+
+    async_loader_class = AsyncProjectMembersPageLoader
@@ -0,0 +1,62 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from organizations.models import Organization
+from projects.access import actual_access, expected_access, sync_access
+
+
+class Command(BaseCommand):
+    help = "ProjectAccess 테이블을 멤버십 테이블과 비교하고 다시 만든다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="고치지 않고 어긋난 행만 보고한다. 어긋나 있으면 실패한다.",
+        )
+        parser.add_argument(
+            "--organization", type=int, help="이 Organization만 처리한다."
+        )
+
+    def handle(self, *args, **options):
+        organization_ids = Organization.objects.order_by("pk").values_list(
+            "pk", flat=True
+        )
+        if options["organization"] is not None:
+            organization_ids = organization_ids.filter(pk=options["organization"])
+
+        drifted = 0
+        for organization_id in organization_ids.iterator():
+            if options["verify"]:
+                drifted += self._verify(organization_id)
+            else:
+                deleted, written = sync_access(organization_id=organization_id)
+                if deleted or written:
+                    drifted += 1
+                    self.stdout.write(
+                        f"organization {organization_id}: "
+                        f"{deleted}개 삭제, {written}개 갱신"
+                    )
+
+        if options["verify"] and drifted:
+            raise CommandError(
+                f"{drifted}개 Organization의 ProjectAccess가 어긋났습니다."
+            )
+        self.stdout.write(f"완료: 어긋난 Organization {drifted}개")
+
+    def _verify(self, organization_id):
+        expected = expected_access([organization_id])
+        actual = actual_access([organization_id])
+        missing = expected.keys() - actual.keys()
+        stale = actual.keys() - expected.keys()
+        mismatched = [
+            key
+            for key in expected.keys() & actual.keys()
+            if expected[key] != actual[key]
+        ]
+        if not (missing or stale or mismatched):
+            return 0
+        self.stdout.write(
+            f"organization {organization_id}: 누락 {len(missing)}, "
+            f"불필요 {len(stale)}, 값(역할/생성 시각) 불일치 {len(mismatched)}"
+        )
+        return 1
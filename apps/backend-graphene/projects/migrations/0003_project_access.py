@@ -0,0 +1,69 @@
+# Generated by Django 6.0.2 on 2026-10-18 05:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+ADMIN_ROLES = ("owner", "admin")
+
+
+def backfill_project_access(apps, schema_editor):
+    OrganizationMembership = apps.get_model("organizations", "OrganizationMembership")
+    Project = apps.get_model("projects", "Project")
+    ProjectMembership = apps.get_model("projects", "ProjectMembership")
+    ProjectAccess = apps.get_model("projects", "ProjectAccess")
+
+    rows = {}
+    for membership in OrganizationMembership.objects.filter(role__in=ADMIN_ROLES):
+        for project_id in Project.objects.filter(
+            organization_id=membership.organization_id
+        ).values_list("id", flat=True):
+            rows[(membership.user_id, project_id)] = (
+                membership.organization_id,
+                membership.role,
+            )
+    for project_id, organization_id, user_id in ProjectMembership.objects.filter(
+        project__organization__memberships__user_id=models.F("user_id"),
+        project__organization__memberships__role="member",
+    ).values_list("project_id", "project__organization_id", "user_id"):
+        rows[(user_id, project_id)] = (organization_id, "member")
+
+    ProjectAccess.objects.bulk_create(
+        [
+            ProjectAccess(
+                user_id=user_id,
+                organization_id=organization_id,
+                project_id=project_id,
+                role=role,
+            )
+            for (user_id, project_id), (organization_id, role) in rows.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0002_keyset_indexes'),
+        ('projects', '0002_keyset_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectAccess',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(choices=[('owner', 'Owner'), ('admin', 'Admin'), ('member', 'Member')], max_length=10)),
+                ('organization', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='organizations.organization')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='access', to='projects.project')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_access', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'organization', 'project'], name='project_access_user_org_idx')],
+                'unique_together': {('user', 'project')},
+            },
+        ),
+        migrations.RunPython(backfill_project_access, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 6.0.2 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+def backfill_created_at(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+    ProjectAccess = apps.get_model("projects", "ProjectAccess")
+    ProjectAccess.objects.update(
+        created_at=models.Subquery(
+            Project.objects.filter(pk=models.OuterRef("project_id")).values(
+                "created_at"
+            )[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_project_access'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='projectaccess',
+            name='created_at',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.RunPython(backfill_created_at, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='projectaccess',
+            name='created_at',
+            field=models.DateTimeField(),
+        ),
+        migrations.RemoveIndex(
+            model_name='projectaccess',
+            name='project_access_user_org_idx',
+        ),
+        migrations.AddIndex(
+            model_name='projectaccess',
+            index=models.Index(fields=['user', 'organization', 'created_at', 'project'], name='project_access_keyset_idx'),
+        ),
+    ]
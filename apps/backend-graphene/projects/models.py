@@ -2,8 +2,13 @@ from django.conf import settings
 from django.db import models
 from django.utils.text import slugify
 
+from organizations.models import Role
+
 
 class Project(models.Model):
+    # keyset pagination 정렬 키 (Meta.indexes와 일치해야 한다)
+    KEYSET_ORDERING = ("created_at", "id")
+
     name = models.CharField(max_length=100)
     slug = models.SlugField(max_length=120)
     description = models.TextField(blank=True)
@@ -30,6 +35,11 @@ class Project(models.Model):
 
     class Meta:
         unique_together = ("organization", "slug")
+        indexes = [
+            models.Index(
+                fields=["organization", "created_at", "id"], name="project_keyset_idx"
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.slug:
@@ -56,6 +66,8 @@ class Project(models.Model):
 
 
 class ProjectMembership(models.Model):
+    KEYSET_ORDERING = ("joined_at", "id")
+
     project = models.ForeignKey(
         Project,
         on_delete=models.CASCADE,
@@ -77,6 +89,56 @@ class ProjectMembership(models.Model):
 
     class Meta:
         unique_together = ("project", "user")
+        indexes = [
+            models.Index(
+                fields=["project", "joined_at", "id"],
+                name="project_membership_keyset_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user} - {self.project}"
+
+
+class ProjectAccess(models.Model):
+    """(사용자, 프로젝트) -> 실효 역할. 멤버십 테이블에서 파생된 비정규화 테이블.
+
+    OrganizationMembership/ProjectMembership/Project가 바뀌면 signal로 같은
+    트랜잭션 안에서 갱신된다(projects.access.sync_access). 어긋났는지 확인하고
+    다시 만들려면 ``manage.py rebuild_project_access``를 쓴다.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="project_access",
+    )
+    organization = models.ForeignKey(
+        "organizations.Organization",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="access",
+    )
+    role = models.CharField(max_length=10, choices=Role.choices)
+    # Project.created_at의 복사본. 프로젝트 목록(projectsConnection)을
+    # Project.KEYSET_ORDERING 순서로 이 테이블의 인덱스에서 바로 읽는다.
+    created_at = models.DateTimeField()
+
+    # Project.KEYSET_ORDERING과 같은 값을 가지는 이 테이블의 컬럼
+    KEYSET_ORDERING = ("created_at", "project_id")
+
+    class Meta:
+        unique_together = ("user", "project")
+        indexes = [
+            models.Index(
+                fields=["user", "organization", "created_at", "project"],
+                name="project_access_keyset_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user} - {self.project} ({self.role})"
@@ -3,7 +3,7 @@ from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError as DjangoValidationError
 from graphql import GraphQLError
 
-from organizations.decorators import check_role, get_membership
+from organizations.decorators import check_role, get_request_membership
 from organizations.models import OrganizationMembership, Role
 from projects.decorators import project_admin_required
 from projects.models import Project, ProjectMembership
@@ -46,7 +46,7 @@ class CreateProject(graphene.Mutation):
     @login_required
     def mutate(root, info, input):
         user = info.context.user
-        org_membership = get_membership(user, input.organization_id)
+        org_membership = get_request_membership(info, input.organization_id)
         if not org_membership:
             raise GraphQLError("이 Organization의 멤버가 아닙니다.")
 
@@ -60,7 +60,7 @@ class CreateProject(graphene.Mutation):
         }
 
         project = Project(
-            organization_id=input.organization_id,
+            organization_id=org_membership.organization_id,
             created_by=user,
             **data,
         )
@@ -1,12 +1,12 @@
 import graphene
-from graphql import GraphQLError
+from django.db.models import Q
 
-from organizations.decorators import check_role, get_membership
-from organizations.models import Role
+from config.optimizer import optimize_queryset
+from config.pagination import connection_from_queryset
+from organizations.decorators import org_member_required
 from projects.decorators import project_access_required
-from projects.models import Project
-from projects.types import ProjectType
-from users.decorators import login_required
+from projects.models import Project, ProjectAccess
+from projects.types import ProjectConnection, ProjectType
 
 
 class ProjectQuery(graphene.ObjectType):
@@ -15,22 +15,45 @@ class ProjectQuery(graphene.ObjectType):
         graphene.NonNull(ProjectType),
         organization_id=graphene.ID(required=True),
     )
+    projects_connection = graphene.Field(
+        ProjectConnection,
+        organization_id=graphene.ID(required=True),
+        first=graphene.Int(),
+        after=graphene.String(),
+    )
 
     @project_access_required
     def resolve_project(root, info, id):
         return info.context.project
 
-    @login_required
+    @org_member_required
     def resolve_projects(root, info, organization_id):
-        user = info.context.user
-        org_membership = get_membership(user, organization_id)
-        if not org_membership:
-            raise GraphQLError("이 Organization의 멤버가 아닙니다.")
-
-        if check_role(org_membership, Role.ADMIN):
-            return Project.objects.filter(organization_id=organization_id)
+        return optimize_queryset(
+            Project.objects.filter(_visible_projects(info, organization_id)), info
+        )
 
-        return Project.objects.filter(
-            organization_id=organization_id,
-            memberships__user=user,
+    @org_member_required
+    def resolve_projects_connection(
+        root, info, organization_id, first=None, after=None
+    ):
+        # ProjectAccess에 복사한 (created_at, project_id)로 정렬해
+        # project_access_keyset_idx 순서로 읽는다 (정렬 단계 없음).
+        return connection_from_queryset(
+            optimize_queryset(Project.objects.all(), info, Project.KEYSET_ORDERING),
+            ProjectConnection,
+            Project.KEYSET_ORDERING,
+            first,
+            after,
+            sort_fields=[
+                f"access__{field_name}" for field_name in ProjectAccess.KEYSET_ORDERING
+            ],
+            where=_visible_projects(info, organization_id),
         )
+
+
+def _visible_projects(info, organization_id):
+    """Organization에서 현재 사용자가 볼 수 있는 프로젝트 조건 (ProjectAccess 기준)."""
+    return Q(
+        access__user=info.context.user,
+        access__organization_id=organization_id,
+    )
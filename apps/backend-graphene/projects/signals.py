@@ -0,0 +1,44 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from organizations.models import OrganizationMembership
+from projects.access import sync_access
+from projects.models import Project, ProjectMembership
+
+
+def _is_cascade(sender, origin):
+    """Project/Organization/User 삭제로 함께 지워지는 경우.
+
+    ProjectAccess 행도 FK cascade로 지워지므로 다시 계산하지 않는다.
+    """
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return origin_model is not sender
+
+
+@receiver(post_save, sender=OrganizationMembership)
+def sync_organization_member_access(sender, instance, **kwargs):
+    sync_access(organization_id=instance.organization_id, user_id=instance.user_id)
+
+
+@receiver(post_delete, sender=OrganizationMembership)
+def revoke_organization_member_access(sender, instance, origin=None, **kwargs):
+    if not _is_cascade(sender, origin):
+        sync_access(organization_id=instance.organization_id, user_id=instance.user_id)
+
+
+@receiver(post_save, sender=Project)
+def grant_project_access(sender, instance, created, **kwargs):
+    if created:
+        sync_access(project_id=instance.pk)
+
+
+@receiver(post_save, sender=ProjectMembership)
+def sync_project_member_access(sender, instance, **kwargs):
+    sync_access(project_id=instance.project_id, user_id=instance.user_id)
+
+
+@receiver(post_delete, sender=ProjectMembership)
+def revoke_project_member_access(sender, instance, origin=None, **kwargs):
+    if not _is_cascade(sender, origin):
+        sync_access(project_id=instance.project_id, user_id=instance.user_id)
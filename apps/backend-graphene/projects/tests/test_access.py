@@ -0,0 +1,133 @@
+from datetime import UTC, datetime
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from organizations.models import OrganizationMembership, Role
+from projects.models import ProjectAccess, ProjectMembership
+
+
+def access_of(user):
+    return dict(
+        ProjectAccess.objects.filter(user=user).values_list("project_id", "role")
+    )
+
+
+@pytest.mark.django_db
+class TestProjectAccessSync:
+    def test_org_admin_gets_every_project(
+        self, org_with_admin, admin_user, project_factory
+    ):
+        first = project_factory(organization=org_with_admin)
+        second = project_factory(organization=org_with_admin)
+
+        assert access_of(admin_user) == {first.pk: Role.ADMIN, second.pk: Role.ADMIN}
+
+    def test_member_gets_only_joined_projects(
+        self, org_with_member, member_user, project_factory
+    ):
+        joined = project_factory(organization=org_with_member)
+        project_factory(organization=org_with_member)
+        ProjectMembership.objects.create(project=joined, user=member_user)
+
+        assert access_of(member_user) == {joined.pk: Role.MEMBER}
+
+    def test_rows_copy_project_created_at(self, org_with_admin, project_factory):
+        project = project_factory(organization=org_with_admin)
+
+        assert set(
+            ProjectAccess.objects.filter(project=project).values_list(
+                "created_at", flat=True
+            )
+        ) == {project.created_at}
+
+    def test_role_change_updates_rows(
+        self, org_with_member, member_user, project_factory
+    ):
+        joined = project_factory(organization=org_with_member)
+        other = project_factory(organization=org_with_member)
+        ProjectMembership.objects.create(project=joined, user=member_user)
+        membership = OrganizationMembership.objects.get(user=member_user)
+
+        membership.role = Role.ADMIN
+        membership.save(update_fields=["role"])
+        assert access_of(member_user) == {joined.pk: Role.ADMIN, other.pk: Role.ADMIN}
+
+        membership.role = Role.MEMBER
+        membership.save(update_fields=["role"])
+        assert access_of(member_user) == {joined.pk: Role.MEMBER}
+
+    def test_leaving_organization_revokes_access(
+        self, org_with_member, member_user, project_factory
+    ):
+        project = project_factory(organization=org_with_member)
+        ProjectMembership.objects.create(project=project, user=member_user)
+
+        OrganizationMembership.objects.get(user=member_user).delete()
+
+        assert access_of(member_user) == {}
+
+    def test_removing_project_member_revokes_access(
+        self, org_with_member, member_user, project_factory
+    ):
+        project = project_factory(organization=org_with_member)
+        membership = ProjectMembership.objects.create(project=project, user=member_user)
+
+        membership.delete()
+
+        assert access_of(member_user) == {}
+
+    def test_deleting_organization_removes_rows(
+        self, org_with_member, member_user, project_factory
+    ):
+        project = project_factory(organization=org_with_member)
+        ProjectMembership.objects.create(project=project, user=member_user)
+
+        org_with_member.delete()
+
+        assert not ProjectAccess.objects.exists()
+
+
+@pytest.mark.django_db
+class TestRebuildProjectAccessCommand:
+    def test_verify_passes_when_in_sync(self, project_with_member):
+        out = StringIO()
+        call_command("rebuild_project_access", "--verify", stdout=out)
+
+        assert "어긋난 Organization 0개" in out.getvalue()
+
+    def test_verify_reports_drift(self, project_with_member, verified_user):
+        ProjectAccess.objects.filter(user=verified_user).delete()
+
+        with pytest.raises(CommandError):
+            call_command("rebuild_project_access", "--verify", stdout=StringIO())
+
+    def test_rebuild_repairs_drift(
+        self, org_with_member, member_user, project_with_member, verified_user
+    ):
+        ProjectAccess.objects.filter(user=verified_user).delete()
+        ProjectAccess.objects.create(
+            user=member_user,
+            organization=org_with_member,
+            project=project_with_member,
+            role=Role.MEMBER,
+            created_at=project_with_member.created_at,
+        )
+
+        call_command("rebuild_project_access", stdout=StringIO())
+
+        assert access_of(verified_user) == {project_with_member.pk: Role.OWNER}
+        assert access_of(member_user) == {}
+        call_command("rebuild_project_access", "--verify", stdout=StringIO())
+
+    def test_rebuild_repairs_created_at(self, project_with_member):
+        ProjectAccess.objects.update(created_at=datetime(2000, 1, 1, tzinfo=UTC))
+
+        with pytest.raises(CommandError):
+            call_command("rebuild_project_access", "--verify", stdout=StringIO())
+        call_command("rebuild_project_access", stdout=StringIO())
+
+        assert set(ProjectAccess.objects.values_list("created_at", flat=True)) == {
+            project_with_member.created_at
+        }
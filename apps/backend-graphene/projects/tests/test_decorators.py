@@ -0,0 +1,113 @@
+import json
+
+import pytest
+from django.urls import reverse
+
+from conftest import make_auth_client
+from organizations.models import OrganizationMembership, Role
+from projects.models import ProjectMembership
+
+GRAPHQL_URL = reverse("graphql")
+
+PROJECT_QUERY = """
+    query Project($id: ID!) {
+        project(id: $id) {
+            id
+            name
+        }
+    }
+"""
+
+
+def post_project_query(client, project):
+    response = client.post(
+        GRAPHQL_URL,
+        json.dumps({"query": PROJECT_QUERY, "variables": {"id": str(project.id)}}),
+        content_type="application/json",
+    )
+    return response.json()
+
+
+@pytest.mark.django_db
+class TestProjectAccessRequired:
+    def test_authorization_is_a_single_query(
+        self, org_with_member, member_user, project_factory, django_assert_num_queries
+    ):
+        project = project_factory(organization=org_with_member)
+        ProjectMembership.objects.create(project=project, user=member_user)
+        client = make_auth_client(member_user)
+
+        # project + 조직 멤버십 + ProjectAccess 역할 (JWT 사용자는 claim으로 만든다)
+        with django_assert_num_queries(1):
+            data = post_project_query(client, project)
+
+        assert data["data"]["project"]["id"] == str(project.id)
+
+    def test_removed_project_member_loses_access(
+        self, org_with_member, member_user, project_factory
+    ):
+        project = project_factory(organization=org_with_member)
+        membership = ProjectMembership.objects.create(project=project, user=member_user)
+        client = make_auth_client(member_user)
+        assert "errors" not in post_project_query(client, project)
+
+        membership.delete()
+
+        data = post_project_query(client, project)
+        assert data["errors"][0]["message"] == "이 프로젝트에 접근할 권한이 없습니다."
+
+    def test_missing_project(self, auth_client):
+        response = auth_client.post(
+            GRAPHQL_URL,
+            json.dumps({"query": PROJECT_QUERY, "variables": {"id": "999999"}}),
+            content_type="application/json",
+        )
+
+        data = response.json()
+        assert data["errors"][0]["message"] == "Project를 찾을 수 없습니다."
+
+    def test_membership_is_shared_with_request_cache(
+        self, org_with_member, member_user, project_factory, django_assert_num_queries
+    ):
+        project = project_factory(organization=org_with_member)
+        ProjectMembership.objects.create(project=project, user=member_user)
+        query = """
+            query Both($id: ID!, $organizationId: ID!) {
+                project(id: $id) { id }
+                projects(organizationId: $organizationId) { id }
+            }
+        """
+        client = make_auth_client(member_user)
+
+        # project 권한 조회, projects 목록 (조직 멤버십은 재사용)
+        with django_assert_num_queries(2):
+            response = client.post(
+                GRAPHQL_URL,
+                json.dumps(
+                    {
+                        "query": query,
+                        "variables": {
+                            "id": str(project.id),
+                            "organizationId": str(org_with_member.id),
+                        },
+                    }
+                ),
+                content_type="application/json",
+            )
+
+        assert "errors" not in response.json()
+
+    def test_removed_org_member_loses_access(
+        self, org_with_owner, member_user, project_factory
+    ):
+        org_membership = OrganizationMembership.objects.create(
+            organization=org_with_owner, user=member_user, role=Role.ADMIN
+        )
+        project = project_factory(organization=org_with_owner)
+        client = make_auth_client(member_user)
+        assert "errors" not in post_project_query(client, project)
+
+        org_membership.delete()
+
+        data = post_project_query(client, project)
+        assert data["errors"][0]["message"] == "이 Organization의 멤버가 아닙니다."
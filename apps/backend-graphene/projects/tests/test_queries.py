@@ -1,6 +1,8 @@
 import json
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from conftest import make_auth_client
@@ -275,3 +277,160 @@ class TestProjectsListQuery:
         assert response.status_code == 200
         data = response.json()
         assert data["errors"][0]["message"] == "로그인이 필요합니다."
+
+    def test_nested_fields_load_in_constant_queries(
+        self,
+        auth_client,
+        verified_user,
+        org_with_owner,
+        project_factory,
+        django_assert_num_queries,
+    ):
+        for _ in range(3):
+            project = project_factory(
+                organization=org_with_owner, created_by=verified_user
+            )
+            ProjectMembership.objects.create(
+                project=project, user=verified_user, added_by=verified_user
+            )
+
+        query = """
+            query Projects($organizationId: ID!) {
+                projects(organizationId: $organizationId) {
+                    organization { id }
+                    createdBy { id }
+                    members { user { id } addedBy { id } }
+                }
+            }
+        """
+        # 멤버십 확인, projects(+organization/createdBy JOIN),
+        # memberships(+user/addedBy JOIN)
+        with django_assert_num_queries(3):
+            response = auth_client.post(
+                GRAPHQL_URL,
+                json.dumps(
+                    {
+                        "query": query,
+                        "variables": {"organizationId": str(org_with_owner.id)},
+                    }
+                ),
+                content_type="application/json",
+            )
+        data = response.json()
+        assert "errors" not in data
+        assert len(data["data"]["projects"]) == 3
+
+
+PROJECTS_CONNECTION_QUERY = """
+    query Projects($organizationId: ID!, $first: Int, $after: String) {
+        projectsConnection(
+            organizationId: $organizationId, first: $first, after: $after
+        ) {
+            edges {
+                node {
+                    id
+                    name
+                    membersConnection(first: 1) {
+                        edges {
+                            cursor
+                            node {
+                                user {
+                                    id
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+        }
+    }
+"""
+
+
+@pytest.mark.django_db
+class TestProjectsConnectionQuery:
+    def _post(self, client, organization_id, **variables):
+        response = client.post(
+            GRAPHQL_URL,
+            json.dumps(
+                {
+                    "query": PROJECTS_CONNECTION_QUERY,
+                    "variables": {"organizationId": str(organization_id), **variables},
+                }
+            ),
+            content_type="application/json",
+        )
+        return response.json()
+
+    def test_pages_through_projects(
+        self, auth_client, verified_user, org_with_owner, project_factory
+    ):
+        projects = [
+            project_factory(organization=org_with_owner, created_by=verified_user)
+            for _ in range(3)
+        ]
+
+        first_page = self._post(auth_client, org_with_owner.id, first=2)
+        page = first_page["data"]["projectsConnection"]
+        assert [edge["node"]["id"] for edge in page["edges"]] == [
+            str(project.id) for project in projects[:2]
+        ]
+        assert page["pageInfo"]["hasNextPage"] is True
+
+        second_page = self._post(
+            auth_client, org_with_owner.id, first=2, after=page["pageInfo"]["endCursor"]
+        )
+        page = second_page["data"]["projectsConnection"]
+        assert [edge["node"]["id"] for edge in page["edges"]] == [str(projects[2].id)]
+        assert page["pageInfo"]["hasNextPage"] is False
+
+    @pytest.mark.skipif(
+        connection.vendor != "sqlite", reason="SQLite EXPLAIN QUERY PLAN 형식"
+    )
+    def test_pages_are_read_in_index_order(
+        self, auth_client, org_with_owner, project_factory
+    ):
+        for _ in range(3):
+            project_factory(organization=org_with_owner)
+        first_page = self._post(auth_client, org_with_owner.id, first=1)
+        cursor = first_page["data"]["projectsConnection"]["pageInfo"]["endCursor"]
+
+        with CaptureQueriesContext(connection) as context:
+            self._post(auth_client, org_with_owner.id, first=1, after=cursor)
+
+        [sql] = [
+            query["sql"]
+            for query in context.captured_queries
+            if 'FROM "projects_project"' in query["sql"]
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+            plan = " ".join(row[-1] for row in cursor.fetchall())
+        assert "project_access_keyset_idx" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_member_sees_only_assigned_projects(
+        self, org_with_member, member_user, project_factory
+    ):
+        assigned = project_factory(organization=org_with_member)
+        project_factory(organization=org_with_member)
+        ProjectMembership.objects.create(project=assigned, user=member_user)
+
+        data = self._post(make_auth_client(member_user), org_with_member.id)
+
+        edges = data["data"]["projectsConnection"]["edges"]
+        assert [edge["node"]["id"] for edge in edges] == [str(assigned.id)]
+        [member] = edges[0]["node"]["membersConnection"]["edges"]
+        assert member["node"]["user"]["id"] == str(member_user.id)
+
+    def test_non_org_member_cannot_list(self, org_with_owner, user_factory):
+        outsider = make_auth_client(user_factory(email_verified=True))
+
+        data = self._post(outsider, org_with_owner.id)
+
+        assert data["data"]["projectsConnection"] is None
+        assert "멤버가 아닙니다" in data["errors"][0]["message"]
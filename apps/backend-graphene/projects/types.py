@@ -1,7 +1,12 @@
 import graphene
 from graphene_django import DjangoObjectType
 
+from config.optimizer import is_prefetched
+from config.pagination import connection_from_loader
+from organizations.loaders import OrganizationLoader
+from projects.loaders import ProjectMembershipsLoader, ProjectMembersPageLoader
 from projects.models import Project, ProjectMembership
+from users.loaders import UserLoader, get_loader, load_related
 from users.types import UserType
 
 
@@ -20,9 +25,33 @@ class ProjectType(DjangoObjectType):
         ]
 
     members = graphene.List(lambda: ProjectMemberType)
+    members_connection = graphene.Field(
+        lambda: ProjectMemberConnection,
+        first=graphene.Int(),
+        after=graphene.String(),
+    )
+
+    optimizer_hints = {"members": "memberships"}
 
     def resolve_members(self, info):
-        return self.memberships.select_related("user", "added_by").all()
+        if is_prefetched(self, "memberships"):
+            return self.memberships.all()
+        return get_loader(info, ProjectMembershipsLoader).load(self.id)
+
+    def resolve_members_connection(self, info, first=None, after=None):
+        return connection_from_loader(
+            get_loader(info, ProjectMembersPageLoader),
+            self.id,
+            ProjectMemberConnection,
+            first,
+            after,
+        )
+
+    def resolve_organization(self, info):
+        return load_related(info, self, "organization", OrganizationLoader)
+
+    def resolve_created_by(self, info):
+        return load_related(info, self, "created_by", UserLoader)
 
 
 class ProjectMemberType(DjangoObjectType):
@@ -34,10 +63,20 @@ class ProjectMemberType(DjangoObjectType):
     added_by = graphene.Field(UserType)
 
     def resolve_user(self, info):
-        return self.user
+        return load_related(info, self, "user", UserLoader)
 
     def resolve_added_by(self, info):
-        return self.added_by
+        return load_related(info, self, "added_by", UserLoader)
+
+
+class ProjectConnection(graphene.relay.Connection):
+    class Meta:
+        node = ProjectType
+
+
+class ProjectMemberConnection(graphene.relay.Connection):
+    class Meta:
+        node = ProjectMemberType
 
 
 class CreateProjectInput(graphene.InputObjectType):
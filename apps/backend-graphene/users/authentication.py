@@ -0,0 +1,19 @@
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt import authentication
+
+from users.tokens import check_token_generation
+
+
+class JWTAuthentication(authentication.JWTAuthentication):
+    """token_generation claim이 사용자의 현재 값과 같은지도 확인한다."""
+
+    def get_user(self, validated_token):
+        user = super().get_user(validated_token)
+        check_token_generation(validated_token, user.token_generation)
+        return user
+
+
+class JWTScheme(SimpleJWTScheme):
+    """OpenAPI 스키마에서 simplejwt와 같은 jwtAuth 보안 스키마로 표시한다."""
+
+    target_class = "users.authentication.JWTAuthentication"
@@ -0,0 +1,157 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+# 캐시하는 사용자 필드: UserType이 쓰는 필드와 인증에 필요한 is_active,
+# token_generation.
+# 나머지 필드는 deferred로 남아 접근할 때 조회된다.
+CACHED_USER_FIELDS = (
+    "id",
+    "email",
+    "username",
+    "first_name",
+    "last_name",
+    "email_verified",
+    "profile_image",
+    "profile_thumbnails",
+    "date_joined",
+    "is_active",
+    "token_generation",
+)
+
+
+def user_cache_key(user_id):
+    return f"user:{user_id}"
+
+
+class LocalLRUCache:
+    """프로세스 로컬 LRU. 항목마다 만료 시각(time.time 기준)을 둔다.
+
+    최대 항목 수는 size_setting에 지정된 설정값을 set할 때마다 읽는다.
+    """
+
+    def __init__(self, size_setting):
+        self.size_setting = size_setting
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, expires_at):
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > getattr(settings, self.size_setting):
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# 다른 프로세스의 무효화는 받지 못하므로 USER_CACHE_LOCAL_TIMEOUT을 짧게 둔다.
+local_user_cache = LocalLRUCache("USER_CACHE_LOCAL_SIZE")
+# raw access token -> 검증된 token. 서명/claim 검증을 exp까지 건너뛴다.
+verified_token_cache = LocalLRUCache("JWT_VERIFIED_TOKEN_CACHE_SIZE")
+
+
+def _field_names():
+    """CACHED_USER_FIELDS를 모델 필드 순서로 정렬한다 (from_db가 요구하는 순서)."""
+    return [
+        field.attname
+        for field in get_user_model()._meta.concrete_fields
+        if field.attname in CACHED_USER_FIELDS
+    ]
+
+
+def _build_user(values):
+    return get_user_model().from_db(DEFAULT_DB_ALIAS, _field_names(), values)
+
+
+def _build_user_or_none(values):
+    return None if values is None else _build_user(values)
+
+
+def get_cached_user(user_id):
+    """user_id -> CACHED_USER_FIELDS만 불러온 사용자 또는 None.
+
+    프로세스 로컬 LRU, 공유 캐시, DB 순으로 찾는다. 사용자가 저장/삭제되거나
+    invalidate_all_tokens가 호출되면 무효화된다. USER_CACHE_TIMEOUT이 0이면
+    매번 DB에서 조회한다.
+    """
+    if not settings.USER_CACHE_TIMEOUT:
+        return _build_user_or_none(_user_values(user_id).first())
+
+    values = local_user_cache.get(user_id)
+    if values is None:
+        key = user_cache_key(user_id)
+        values = cache.get(key)
+        if values is None:
+            values = _user_values(user_id).first()
+            if values is None:
+                return None
+            cache.set(key, values, settings.USER_CACHE_TIMEOUT)
+        _set_local(user_id, values)
+    return _build_user(values)
+
+
+async def aget_cached_user(user_id):
+    """get_cached_user의 async 버전."""
+    if not settings.USER_CACHE_TIMEOUT:
+        return _build_user_or_none(await _user_values(user_id).afirst())
+
+    values = local_user_cache.get(user_id)
+    if values is None:
+        key = user_cache_key(user_id)
+        values = await cache.aget(key)
+        if values is None:
+            values = await _user_values(user_id).afirst()
+            if values is None:
+                return None
+            await cache.aset(key, values, settings.USER_CACHE_TIMEOUT)
+        _set_local(user_id, values)
+    return _build_user(values)
+
+
+def _user_values(user_id):
+    return get_user_model().objects.filter(pk=user_id).values_list(*_field_names())
+
+
+def _set_local(user_id, values):
+    if settings.USER_CACHE_LOCAL_TIMEOUT:
+        local_user_cache.set(
+            user_id, values, time.time() + settings.USER_CACHE_LOCAL_TIMEOUT
+        )
+
+
+def invalidate_user_cache(user_id):
+    """사용자 캐시를 지운다.
+
+    커밋 전에 다른 요청이 옛 값을 다시 채울 수 있으므로 커밋 후에도 한 번 더 지운다.
+    """
+
+    def delete():
+        local_user_cache.delete(user_id)
+        cache.delete(user_cache_key(user_id))
+
+    delete()
+    transaction.on_commit(delete)
@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.checks import Error, register
+
+from config.caches import is_shared_cache
+
+
+@register()
+def check_user_cache(app_configs, **kwargs):
+    """사용자 캐시 무효화는 모든 worker가 같은 cache를 볼 때만 닿는다."""
+    if not settings.USER_CACHE_TIMEOUT or is_shared_cache():
+        return []
+    return [
+        Error(
+            "USER_CACHE_TIMEOUT에는 공유 cache가 필요합니다.",
+            hint=(
+                "Redis/Memcached cache(CACHE_URL)를 설정하거나 "
+                "USER_CACHE_TIMEOUT을 0으로 두세요."
+            ),
+            id="users.E001",
+        )
+    ]
@@ -0,0 +1,200 @@
+import io
+import logging
+import mimetypes
+import os
+import re
+import time
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+from users.cache import invalidate_user_cache
+from users.models import CustomUser, content_addressed_name
+
+PROFILE_IMAGE_DIR = "profile_images"
+# 내용 주소 파일 이름: 원본은 <hash>.<확장자>, 썸네일은 <hash>_<크기>.webp
+CONTENT_ADDRESSED_NAME = re.compile(
+    r"profile_images/[0-9a-f]{2}/(?P<digest>[0-9a-f]{64}(?:_\d+)?)"
+    r"\.(?:jpe?g|png|webp)"
+)
+
+logger = logging.getLogger(__name__)
+
+
+def profile_image_storage():
+    return CustomUser._meta.get_field("profile_image").storage
+
+
+def store_profile_image(uploaded):
+    """업로드된 파일을 내용 주소 이름으로 저장하고 그 이름을 반환한다.
+
+    같은 내용의 파일이 이미 있으면 다시 저장하지 않는다.
+    """
+    storage = profile_image_storage()
+    # 확장자는 업로드된 파일 이름 대신 검증된 content type에서 정한다.
+    extension = mimetypes.guess_extension(uploaded.content_type) or ""
+    name = content_addressed_name(uploaded, f"image{extension}")
+    if storage.exists(name):
+        _touch(storage, name)
+        return name
+    saved = storage.save(name, uploaded)
+    if saved != name:
+        # 같은 내용이 동시에 저장되어 storage가 다른 이름을 붙였다.
+        storage.delete(saved)
+    return name
+
+
+def _touch(storage, name):
+    """수정 시각을 갱신해 collect_profile_images가 다시 쓰인 파일을 지우지 않게 한다."""
+    try:
+        path = storage.path(name)
+    except NotImplementedError:
+        return
+    os.utime(path)
+
+
+def pending_thumbnail_users():
+    """프로필 이미지는 있지만 썸네일을 아직 만들지 않은 사용자."""
+    return CustomUser.objects.filter(
+        profile_thumbnails__isnull=True, profile_image__gt=""
+    )
+
+
+def make_thumbnail(image, size):
+    """가운데를 기준으로 size×size로 잘라 WebP bytes로 만든다."""
+    thumbnail = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+    buffer = io.BytesIO()
+    thumbnail.save(
+        buffer, format="WEBP", quality=settings.PROFILE_THUMBNAIL_QUALITY, method=6
+    )
+    return buffer.getvalue()
+
+
+def generate_profile_thumbnails(user):
+    """user의 프로필 이미지로 PROFILE_THUMBNAIL_SIZES 크기의 썸네일을 만든다.
+
+    썸네일 이름은 원본 이름에서 정해지므로 같은 이미지의 썸네일이 이미 있으면
+    이미지를 다시 읽지 않는다. 만드는 동안 이미지가 바뀌었으면 기록하지 않는다.
+    Returns 기록했으면 True.
+    """
+    source = user.profile_image
+    storage = source.storage
+    stem = os.path.splitext(source.name)[0]
+    thumbnails = {
+        str(size): f"{stem}_{size}.webp" for size in settings.PROFILE_THUMBNAIL_SIZES
+    }
+    missing = {}
+    for size, name in thumbnails.items():
+        if storage.exists(name):
+            _touch(storage, name)
+        else:
+            missing[size] = name
+    if missing:
+        with source.open("rb"), Image.open(source) as image:
+            image = ImageOps.exif_transpose(image)
+            image = image.convert(
+                "RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB"
+            )
+            for size, name in missing.items():
+                saved = storage.save(
+                    name, ContentFile(make_thumbnail(image, int(size)))
+                )
+                if saved != name:
+                    storage.delete(saved)
+
+    updated = CustomUser.objects.filter(
+        pk=user.pk, profile_image=source.name, profile_thumbnails__isnull=True
+    ).update(profile_thumbnails=thumbnails)
+    if not updated:
+        return False
+    invalidate_user_cache(user.pk)
+    return True
+
+
+def generate_pending_thumbnails(batch_size):
+    """썸네일을 기다리는 사용자 batch_size명의 썸네일을 만든다.
+
+    이미지를 읽지 못하면 빈 dict를 저장해 원본을 그대로 쓰고 다시 시도하지 않는다.
+    Returns (만든 수, 실패한 수) 튜플.
+    """
+    users = list(
+        pending_thumbnail_users()
+        .only("id", "profile_image")
+        .order_by("pk")[:batch_size]
+    )
+    done = failed = 0
+    for user in users:
+        try:
+            generate_profile_thumbnails(user)
+        except Exception:
+            logger.exception("프로필 썸네일 생성 실패: user %s", user.pk)
+            CustomUser.objects.filter(
+                pk=user.pk,
+                profile_image=user.profile_image.name,
+                profile_thumbnails__isnull=True,
+            ).update(profile_thumbnails={})
+            invalidate_user_cache(user.pk)
+            failed += 1
+        else:
+            done += 1
+    return done, failed
+
+
+def referenced_profile_images():
+    """사용자가 참조하는 프로필 이미지와 썸네일 파일 이름의 집합."""
+    names = set()
+    rows = (
+        CustomUser.objects.filter(profile_image__gt="")
+        .values_list("profile_image", "profile_thumbnails")
+        .iterator()
+    )
+    for profile_image, thumbnails in rows:
+        names.add(profile_image)
+        names.update((thumbnails or {}).values())
+    return names
+
+
+def collect_profile_images(grace_period, dry_run=False):
+    """어떤 사용자도 참조하지 않는 프로필 이미지 파일을 지운다.
+
+    파일을 저장한 뒤 사용자 행이 커밋되기 전일 수 있으므로, 수정된 지
+    grace_period초가 지나지 않은 파일은 남긴다.
+    Returns 지운(dry_run이면 지울) 파일 이름 목록.
+    """
+    storage = profile_image_storage()
+    if not storage.exists(PROFILE_IMAGE_DIR):
+        return []
+    referenced = referenced_profile_images()
+    cutoff = time.time() - grace_period
+    orphans = []
+    for name in _walk(storage, PROFILE_IMAGE_DIR):
+        if name in referenced:
+            continue
+        if storage.get_modified_time(name).timestamp() > cutoff:
+            continue
+        orphans.append(name)
+        if not dry_run:
+            storage.delete(name)
+    return orphans
+
+
+def _walk(storage, path):
+    directories, files = storage.listdir(path)
+    for name in files:
+        yield f"{path}/{name}"
+    for directory in directories:
+        yield from _walk(storage, f"{path}/{directory}")
+
+
+def thumbnail_url(user, size):
+    """size 이상인 가장 작은 썸네일의 URL. 없으면 가장 큰 썸네일, 썸네일을 아직
+    만들지 않았으면 원본 이미지의 URL."""
+    if not user.profile_image:
+        return None
+    thumbnails = user.profile_thumbnails
+    if not thumbnails:
+        return user.profile_image.url
+    sizes = sorted(int(key) for key in thumbnails)
+    chosen = next((s for s in sizes if s >= size), sizes[-1])
+    return user.profile_image.storage.url(thumbnails[str(chosen)])
@@ -0,0 +1,54 @@
+from graphene.utils.dataloader import DataLoader as AsyncDataLoader
+from promise import Promise
+from promise.dataloader import DataLoader
+
+from config.execution import is_async_execution
+from users.models import CustomUser
+
+
+def get_loader(info, loader_class):
+    """요청 단위로 DataLoader 인스턴스를 생성하고 재사용한다.
+
+    info.context(request)에 저장하므로 같은 요청 안의 resolver들은 하나의
+    로더를 공유하고, 요청이 끝나면 캐시도 함께 사라진다.
+    async 실행 중에는 loader_class.async_loader_class(asyncio 기반)를 쓴다.
+    """
+    if is_async_execution():
+        loader_class = loader_class.async_loader_class
+    loaders = getattr(info.context, "loaders", None)
+    if loaders is None:
+        loaders = info.context.loaders = {}
+    if loader_class not in loaders:
+        loaders[loader_class] = loader_class()
+    return loaders[loader_class]
+
+
+class AsyncUserLoader(AsyncDataLoader):
+    async def batch_load_fn(self, user_ids):
+        users = await CustomUser.objects.ain_bulk(user_ids)
+        return [users.get(user_id) for user_id in user_ids]
+
+
+class UserLoader(DataLoader):
+    """user_id -> CustomUser"""
+
+    async_loader_class = AsyncUserLoader
+
+    def batch_load_fn(self, user_ids):
+        users = CustomUser.objects.in_bulk(user_ids)
+        return Promise.resolve([users.get(user_id) for user_id in user_ids])
+
+
+def load_related(info, instance, field_name, loader_class):
+    """FK 필드를 resolve한다.
+
+    select_related로 이미 JOIN된 객체가 있으면 그대로 쓰고, 없으면
+    DataLoader로 배치 조회한다.
+    """
+    field = instance._meta.get_field(field_name)
+    if field.is_cached(instance):
+        return getattr(instance, field_name)
+    key = getattr(instance, field.attname)
+    if key is None:
+        return None
+    return get_loader(info, loader_class).load(key)
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from users.images import collect_profile_images
+
+
+class Command(BaseCommand):
+    help = "어떤 사용자도 참조하지 않는 프로필 이미지와 썸네일 파일을 지운다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace-period",
+            type=int,
+            default=3600,
+            help="수정된 지 이 시간(초)이 지나지 않은 파일은 남긴다.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="지우지 않고 지울 파일만 출력한다.",
+        )
+
+    def handle(self, *args, **options):
+        orphans = collect_profile_images(
+            options["grace_period"], dry_run=options["dry_run"]
+        )
+        if options["dry_run"]:
+            for name in orphans:
+                self.stdout.write(name)
+        self.stdout.write(f"참조되지 않는 파일 {len(orphans)}개")
@@ -0,0 +1,53 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "만료된 OutstandingToken/BlacklistedToken을 batch 단위로 지운다. "
+        "batch마다 별도 트랜잭션이므로 잠금이 짧다. 주기적으로 실행한다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.0,
+            help="batch 사이에 쉬는 시간(초). 복제 지연/부하를 줄일 때 쓴다.",
+        )
+        parser.add_argument(
+            "--max-batches", type=int, help="이번 실행에서 처리할 최대 batch 수"
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        max_batches = options["max_batches"]
+        # 실행 중에 만료되는 토큰까지 쫓아가지 않도록 기준 시각을 고정한다.
+        now = timezone.now()
+        expired = OutstandingToken.objects.filter(expires_at__lte=now).order_by("pk")
+
+        outstanding_total = blacklisted_total = batches = 0
+        while max_batches is None or batches < max_batches:
+            ids = list(expired.values_list("pk", flat=True)[:batch_size])
+            if not ids:
+                break
+            # blacklist 행을 먼저 지우면 OutstandingToken 삭제의 cascade가 비어 있다.
+            blacklisted, _ = BlacklistedToken.objects.filter(token_id__in=ids).delete()
+            outstanding, _ = OutstandingToken.objects.filter(pk__in=ids).delete()
+            blacklisted_total += blacklisted
+            outstanding_total += outstanding
+            batches += 1
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        self.stdout.write(
+            f"OutstandingToken {outstanding_total}개, "
+            f"BlacklistedToken {blacklisted_total}개 삭제 ({batches} batch)"
+        )
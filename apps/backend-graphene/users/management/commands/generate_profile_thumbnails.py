@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from users.images import generate_pending_thumbnails
+
+
+class Command(BaseCommand):
+    help = "프로필 이미지의 WebP 썸네일을 만든다. 기본은 계속 실행되는 worker이다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="처리할 이미지가 없을 때 다시 확인하기까지 기다리는 시간(초)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="지금 기다리는 이미지를 모두 처리하고 종료한다.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            done, failed = generate_pending_thumbnails(options["batch_size"])
+            if done or failed:
+                self.stdout.write(f"생성 {done}, 실패 {failed}")
+                continue
+            if options["once"]:
+                return
+            time.sleep(options["interval"])
@@ -1,12 +1,26 @@
 import logging
+from functools import partial
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from django.db import DEFAULT_DB_ALIAS
 from rest_framework_simplejwt.exceptions import (
     AuthenticationFailed,
     InvalidToken,
     TokenError,
 )
+from rest_framework_simplejwt.settings import api_settings
+
+from users.authentication import JWTAuthentication
+from users.cache import (
+    CACHED_USER_FIELDS,
+    aget_cached_user,
+    get_cached_user,
+    verified_token_cache,
+)
+from users.tokens import check_token_generation
 
 logger = logging.getLogger(__name__)
 
@@ -23,23 +37,160 @@ class JWTAuthenticationMiddleware:
     This is intentional: JWT takes precedence over session auth so that
     API clients can authenticate independently of browser sessions.
     If the token is invalid or expired, request.user is set to AnonymousUser.
+
+    When USER_CACHE_TIMEOUT is set, request.user is loaded through the user
+    cache (users.cache) and checked (is_active, token_generation) up front.
+    When it is 0, request.user is built from the token claims with only the
+    pk loaded, so id-only checks such as get_membership cost no query. The
+    row (CACHED_USER_FIELDS) is read on the first access to another field,
+    and is_active/token_generation are checked at that point; a failed check
+    raises AuthenticationFailed from the attribute access. Mutations load
+    the row before executing (check_claim_user), so only read requests that
+    never touch the row trust the claims until the access token expires
+    (ACCESS_TOKEN_LIFETIME). Verified access tokens are remembered until exp
+    so repeated requests with the same token skip signature verification.
+
+    The middleware is sync and async capable: under ASGI the user is looked
+    up with the async cache/ORM API instead of a thread hop.
     """
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
         self.jwt_auth = JWTAuthentication()
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
-        header = request.META.get("HTTP_AUTHORIZATION", "")
-        if header.startswith("Bearer "):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        raw_token = self.get_raw_token(request)
+        if raw_token is not None:
             try:
-                validated_token = self.jwt_auth.get_validated_token(
-                    header.split(" ", 1)[1]
-                )
-                request.user = self.jwt_auth.get_user(validated_token)
+                request.user = self.get_user(self.get_validated_token(raw_token))
             except (AuthenticationFailed, InvalidToken, TokenError):
                 request.user = AnonymousUser()
             except Exception:
                 logger.exception("Unexpected error in JWT middleware")
                 request.user = AnonymousUser()
         return self.get_response(request)
+
+    async def __acall__(self, request):
+        raw_token = self.get_raw_token(request)
+        if raw_token is not None:
+            try:
+                request.user = await self.aget_user(self.get_validated_token(raw_token))
+            except (AuthenticationFailed, InvalidToken, TokenError):
+                request.user = AnonymousUser()
+            except Exception:
+                logger.exception("Unexpected error in JWT middleware")
+                request.user = AnonymousUser()
+        return await self.get_response(request)
+
+    def get_raw_token(self, request):
+        header = request.META.get("HTTP_AUTHORIZATION", "")
+        if header.startswith("Bearer "):
+            return header.split(" ", 1)[1]
+        return None
+
+    def get_validated_token(self, raw_token):
+        """검증된 token을 exp까지 LRU에 두고, 같은 raw token은 다시 검증하지 않는다.
+
+        blacklist를 쓰는 token 종류는 캐시에서 꺼낼 때도 blacklist를 확인한다.
+        token_generation/is_active는 캐시와 상관없이 get_user에서 확인한다.
+        """
+        if not settings.JWT_VERIFIED_TOKEN_CACHE_SIZE:
+            return self.jwt_auth.get_validated_token(raw_token)
+
+        validated_token = verified_token_cache.get(raw_token)
+        if validated_token is None:
+            validated_token = self.jwt_auth.get_validated_token(raw_token)
+            verified_token_cache.set(raw_token, validated_token, validated_token["exp"])
+        elif hasattr(validated_token, "check_blacklist"):
+            validated_token.check_blacklist()
+        return validated_token
+
+    def get_user(self, validated_token):
+        """token의 사용자를 불러오고 is_active, token_generation을 확인한다.
+
+        USER_CACHE_TIMEOUT이 0이면 claim의 pk만 가진 사용자를 돌려주고,
+        행을 불러올 때(load_claim_user) 확인한다.
+        """
+        user_id = self.get_user_id(validated_token)
+        if not settings.USER_CACHE_TIMEOUT:
+            return self.get_claim_user(validated_token, user_id)
+        user = get_cached_user(user_id)
+        self.check_user(validated_token, user)
+        return user
+
+    async def aget_user(self, validated_token):
+        """get_user의 async 버전."""
+        user = await aget_cached_user(self.get_user_id(validated_token))
+        self.check_user(validated_token, user)
+        return user
+
+    def get_claim_user(self, validated_token, user_id):
+        user_model = get_user_model()
+        user = user_model.from_db(
+            DEFAULT_DB_ALIAS, [user_model._meta.pk.attname], [user_id]
+        )
+        # deferred 필드 접근은 instance.refresh_from_db(fields=[...])를 부르므로
+        # 인스턴스 속성으로 가려 행을 불러올 때 인증 상태를 확인한다.
+        user.refresh_from_db = partial(self.load_claim_user, validated_token, user)
+        return user
+
+    def load_claim_user(
+        self, validated_token, user, using=None, fields=None, from_queryset=None
+    ):
+        """claim 사용자의 CACHED_USER_FIELDS(+요청된 필드)를 한 번에 불러오고 확인한다.
+
+        확인에 실패하면 불러온 값을 버리고 AuthenticationFailed를 낸다.
+        """
+        pk_name = user._meta.pk.attname
+        fields = {*CACHED_USER_FIELDS, *(fields or ())} - {pk_name}
+        model_refresh = type(user).refresh_from_db
+        try:
+            model_refresh(user, using, fields, from_queryset)
+        except user.DoesNotExist:
+            self.check_user(validated_token, None)
+        try:
+            self.check_user(validated_token, user)
+        except AuthenticationFailed:
+            for name in fields:
+                user.__dict__.pop(name, None)
+            raise
+        del user.refresh_from_db
+
+    def get_user_id(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+        return get_user_model()._meta.pk.to_python(user_id)
+
+    def check_user(self, validated_token, user):
+        if user is None:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        check_token_generation(validated_token, user.token_generation)
+
+
+def is_claim_user(user):
+    """행을 아직 불러오지 않은 claim 사용자인지 (get_claim_user 참고)."""
+    return "refresh_from_db" in getattr(user, "__dict__", {})
+
+
+def check_claim_user(request):
+    """request.user가 claim 사용자면 행을 불러와 확인하고, 실패하면 익명으로 바꾼다.
+
+    쓰기 전에 is_active/token_generation을 확인하도록 mutation 실행 전에 부른다.
+    """
+    if not is_claim_user(request.user):
+        return
+    try:
+        request.user.refresh_from_db()
+    except AuthenticationFailed:
+        request.user = AnonymousUser()
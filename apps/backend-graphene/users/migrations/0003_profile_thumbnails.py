@@ -0,0 +1,23 @@
+# Generated by Django 6.0.2 on 2026-10-18 05:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0002_token_generation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='profile_thumbnails',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(condition=models.Q(('profile_image__gt', ''), ('profile_thumbnails__isnull', True)), fields=['id'], name='user_pending_thumbnails_idx'),
+        ),
+    ]
@@ -1,3 +1,5 @@
+import hashlib
+import os
 import uuid
 
 from django.contrib.auth.models import AbstractUser
@@ -6,8 +8,18 @@ from django.db import models
 from users.managers import CustomUserManager
 
 
+def content_addressed_name(file, filename):
+    """profile_images/<hash 앞 2자리>/<SHA-256>.<확장자>. 내용이 같으면 이름도 같다."""
+    digest = hashlib.sha256()
+    for chunk in file.chunks():
+        digest.update(chunk)
+    hexdigest = digest.hexdigest()
+    extension = os.path.splitext(filename)[1].lower()
+    return f"profile_images/{hexdigest[:2]}/{hexdigest}{extension}"
+
+
 def profile_image_upload_to(instance, filename):
-    return f"profile_images/{instance.id}/{filename}"
+    return content_addressed_name(instance.profile_image, filename)
 
 
 class CustomUser(AbstractUser):
@@ -17,11 +29,27 @@ class CustomUser(AbstractUser):
         null=True,
         blank=True,
     )
+    # 크기(문자열) -> WebP 썸네일 파일 이름. None이면 아직 만들지 않았다.
+    profile_thumbnails = models.JSONField(null=True, blank=True)
     email_verified = models.BooleanField(default=False)
     username = models.CharField(max_length=150, unique=True, blank=True)
+    # 발급된 JWT의 "gen" claim과 비교한다. 올리면 모든 토큰이 무효화된다.
+    token_generation = models.PositiveIntegerField(default=0)
 
     objects = CustomUserManager()
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # generate_profile_thumbnails가 찾는 썸네일 대기 사용자
+            models.Index(
+                fields=["id"],
+                condition=models.Q(
+                    profile_thumbnails__isnull=True, profile_image__gt=""
+                ),
+                name="user_pending_thumbnails_idx",
+            ),
+        ]
+
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["username"]
 
@@ -3,9 +3,25 @@ from django.contrib.auth.password_validation import validate_password
 from django.contrib.auth.tokens import default_token_generator
 from django.utils.encoding import force_str
 from django.utils.http import urlsafe_base64_decode
+from PIL import Image
 from rest_framework import serializers
-
-from users.tokens import email_verification_token
+from rest_framework_simplejwt import serializers as jwt_serializers
+from rest_framework_simplejwt.settings import api_settings
+
+from users.tokens import (
+    RefreshToken,
+    check_token_generation,
+    email_verification_token,
+)
+from users.uploads import (
+    ALLOWED_TYPES,
+    INVALID_MESSAGE,
+    MAX_SIZE,
+    SIZE_MESSAGE,
+    TYPE_MESSAGE,
+    check_image_header,
+    read_image_header,
+)
 
 User = get_user_model()
 
@@ -163,29 +179,39 @@ class LogoutSerializer(serializers.Serializer):
     refresh = serializers.CharField()
 
 
-class ProfileImageSerializer(serializers.Serializer):
-    image = serializers.ImageField()
+class TokenRefreshSerializer(jwt_serializers.TokenRefreshSerializer):
+    """폐기된 token_generation의 refresh token은 재발급하지 않는다."""
 
-    ALLOWED_TYPES = ("image/jpeg", "image/png")
-    ALLOWED_FORMATS = {"JPEG", "PNG"}
-    MAX_SIZE = 5 * 1024 * 1024  # 5MB
+    token_class = RefreshToken
 
-    def validate_image(self, value):
-        if value.content_type not in self.ALLOWED_TYPES:
-            raise serializers.ValidationError("JPEG 또는 PNG 파일만 허용됩니다.")
-        if value.size > self.MAX_SIZE:
-            raise serializers.ValidationError("파일 크기는 5MB를 초과할 수 없습니다.")
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+        generation = (
+            User.objects.filter(pk=user_id)
+            .values_list("token_generation", flat=True)
+            .first()
+        )
+        if generation is not None:
+            check_token_generation(refresh, generation)
+        return super().validate(attrs)
 
-        from PIL import Image, UnidentifiedImageError
 
-        try:
-            img = Image.open(value)
-            img.verify()
-        except (UnidentifiedImageError, Exception):
-            raise serializers.ValidationError("유효한 이미지 파일이 아닙니다.")
+class ProfileImageSerializer(serializers.Serializer):
+    # ImageField는 Image.verify()로 파일 전체를 읽으므로 헤더만 확인한다.
+    image = serializers.FileField()
+
+    def validate_image(self, value):
+        if value.content_type not in ALLOWED_TYPES:
+            raise serializers.ValidationError(TYPE_MESSAGE)
+        if value.size > MAX_SIZE:
+            raise serializers.ValidationError(SIZE_MESSAGE)
 
-        if img.format not in self.ALLOWED_FORMATS:
-            raise serializers.ValidationError("JPEG 또는 PNG 파일만 허용됩니다.")
+        try:
+            image_format, size = read_image_header(value)
+        except (OSError, Image.DecompressionBombError):
+            raise serializers.ValidationError(INVALID_MESSAGE)
+        check_image_header(image_format, size)
 
         value.seek(0)
         return value
@@ -0,0 +1,131 @@
+import json
+from unittest import mock
+
+import pytest
+from django.urls import reverse
+
+from conftest import make_auth_client
+from users.cache import get_cached_user, local_user_cache
+from users.checks import check_user_cache
+from users.utils import invalidate_all_tokens
+
+GRAPHQL_URL = reverse("graphql")
+ME_QUERY = "query { me { id email firstName } }"
+
+
+def post_me(client):
+    response = client.post(
+        GRAPHQL_URL,
+        json.dumps({"query": ME_QUERY}),
+        content_type="application/json",
+    )
+    return response.json()["data"]["me"]
+
+
+@pytest.fixture
+def enable_user_cache(settings):
+    settings.USER_CACHE_TIMEOUT = 60
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("enable_user_cache")
+class TestUserCache:
+    def test_warm_cache_skips_users_table(
+        self, verified_user, django_assert_num_queries
+    ):
+        get_cached_user(verified_user.pk)
+
+        with django_assert_num_queries(0):
+            user = get_cached_user(verified_user.pk)
+
+        assert user.email == verified_user.email
+        assert user.is_active
+
+    def test_shared_cache_used_when_local_entry_missing(
+        self, verified_user, django_assert_num_queries
+    ):
+        get_cached_user(verified_user.pk)
+        local_user_cache.clear()
+
+        with django_assert_num_queries(0):
+            get_cached_user(verified_user.pk)
+
+    def test_missing_user(self):
+        assert get_cached_user(999999) is None
+
+    def test_save_invalidates(self, verified_user):
+        get_cached_user(verified_user.pk)
+        verified_user.first_name = "새이름"
+        verified_user.save()
+
+        assert get_cached_user(verified_user.pk).first_name == "새이름"
+
+    def test_invalidate_all_tokens_invalidates(self, verified_user):
+        get_cached_user(verified_user.pk)
+        type(verified_user).objects.filter(pk=verified_user.pk).update(is_active=False)
+        invalidate_all_tokens(verified_user)
+
+        assert not get_cached_user(verified_user.pk).is_active
+
+    def test_local_entries_expire(self, verified_user, settings):
+        settings.USER_CACHE_LOCAL_TIMEOUT = 0
+        get_cached_user(verified_user.pk)
+
+        assert local_user_cache.get(verified_user.pk) is None
+
+    def test_local_cache_is_bounded(self, user_factory, settings):
+        settings.USER_CACHE_LOCAL_SIZE = 2
+        users = [user_factory() for _ in range(3)]
+        for user in users:
+            get_cached_user(user.pk)
+
+        assert local_user_cache.get(users[0].pk) is None
+        assert local_user_cache.get(users[2].pk) is not None
+
+    def test_disabled_cache_always_queries(
+        self, verified_user, settings, django_assert_num_queries
+    ):
+        settings.USER_CACHE_TIMEOUT = 0
+        get_cached_user(verified_user.pk)
+
+        with django_assert_num_queries(1):
+            assert get_cached_user(verified_user.pk).email == verified_user.email
+        assert local_user_cache.get(verified_user.pk) is None
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("enable_user_cache")
+class TestMiddlewareUserCache:
+    def test_me_served_from_cache(self, verified_user, django_assert_num_queries):
+        client = make_auth_client(verified_user)
+        post_me(client)
+
+        with django_assert_num_queries(0):
+            me = post_me(client)
+
+        assert me["email"] == verified_user.email
+
+    def test_inactive_user_is_anonymous(self, verified_user):
+        client = make_auth_client(verified_user)
+        verified_user.is_active = False
+        verified_user.save()
+
+        assert post_me(client) is None
+
+
+class TestUserCacheCheck:
+    def test_process_local_cache_fails(self, settings):
+        settings.USER_CACHE_TIMEOUT = 60
+
+        assert [error.id for error in check_user_cache(None)] == ["users.E001"]
+
+    def test_shared_cache_passes(self, settings):
+        settings.USER_CACHE_TIMEOUT = 60
+
+        with mock.patch("users.checks.is_shared_cache", return_value=True):
+            assert check_user_cache(None) == []
+
+    def test_disabled_cache_passes(self, settings):
+        settings.USER_CACHE_TIMEOUT = 0
+
+        assert check_user_cache(None) == []
@@ -0,0 +1,62 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+
+def make_token(user, jti, expires_in, blacklisted=False):
+    token = OutstandingToken.objects.create(
+        user=user,
+        jti=jti,
+        token="token",
+        created_at=timezone.now(),
+        expires_at=timezone.now() + expires_in,
+    )
+    if blacklisted:
+        BlacklistedToken.objects.create(token=token)
+    return token
+
+
+@pytest.mark.django_db
+class TestCompactTokensCommand:
+    def test_deletes_only_expired_tokens_in_batches(self, verified_user):
+        for index in range(5):
+            make_token(
+                verified_user,
+                f"expired-{index}",
+                timedelta(days=-1),
+                blacklisted=index % 2 == 0,
+            )
+        alive = make_token(verified_user, "alive", timedelta(days=1), blacklisted=True)
+        out = StringIO()
+
+        call_command("compact_tokens", "--batch-size", "2", stdout=out)
+
+        assert list(OutstandingToken.objects.all()) == [alive]
+        assert list(BlacklistedToken.objects.values_list("token_id", flat=True)) == [
+            alive.pk
+        ]
+        assert "OutstandingToken 5개, BlacklistedToken 3개 삭제 (3 batch)" in (
+            out.getvalue()
+        )
+
+    def test_max_batches_limits_work(self, verified_user):
+        for index in range(5):
+            make_token(verified_user, f"expired-{index}", timedelta(days=-1))
+
+        call_command(
+            "compact_tokens",
+            "--batch-size",
+            "2",
+            "--max-batches",
+            "1",
+            stdout=StringIO(),
+        )
+
+        assert OutstandingToken.objects.count() == 3
@@ -1,5 +1,8 @@
+from io import StringIO
+
 import pytest
 from django.core import mail
+from django.core.management import call_command
 from django.urls import reverse
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
@@ -57,6 +60,7 @@ class TestResendVerificationEmailView:
             RESEND_URL, {"email": "unverified@example.com"}, format="json"
         )
         assert response.status_code == 200
+        call_command("send_queued_emails", "--once", stdout=StringIO())
         assert len(mail.outbox) == 1
 
     def test_resend_already_verified(self, api_client, user_factory):
@@ -65,6 +69,7 @@ class TestResendVerificationEmailView:
             RESEND_URL, {"email": "verified@example.com"}, format="json"
         )
         assert response.status_code == 200
+        call_command("send_queued_emails", "--once", stdout=StringIO())
         assert len(mail.outbox) == 0
 
     def test_resend_nonexistent_email(self, api_client):
@@ -72,4 +77,5 @@ class TestResendVerificationEmailView:
             RESEND_URL, {"email": "ghost@example.com"}, format="json"
         )
         assert response.status_code == 200  # 보안: 성공 응답
+        call_command("send_queued_emails", "--once", stdout=StringIO())
         assert len(mail.outbox) == 0
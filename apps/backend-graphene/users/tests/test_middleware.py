@@ -1,6 +1,17 @@
+import json
+
 import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.test import AsyncClient, RequestFactory
 from django.urls import reverse
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+
+from organizations.models import Organization
+from users.cache import verified_token_cache
+from users.middleware import JWTAuthenticationMiddleware, check_claim_user
+from users.models import CustomUser
+from users.tokens import RefreshToken
+from users.utils import invalidate_all_tokens
 
 
 @pytest.mark.django_db
@@ -19,3 +30,256 @@ class TestJWTAuthenticationMiddleware:
         api_client.credentials(HTTP_AUTHORIZATION="Bearer invalid-token")
         response = api_client.get(reverse("graphql"), {"query": "{ __typename }"})
         assert response.status_code == 200
+
+
+def authenticate(token):
+    request = RequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+    JWTAuthenticationMiddleware(lambda request: None)(request)
+    return request.user
+
+
+def post_graphql(client, query):
+    return client.post(
+        reverse("graphql"),
+        json.dumps({"query": query}),
+        content_type="application/json",
+    ).json()
+
+
+CREATE_ORGANIZATION = """
+    mutation {
+        createOrganization(input: {name: "Claim Org"}) {
+            organization { id }
+        }
+    }
+"""
+
+
+@pytest.mark.django_db
+class TestClaimUser:
+    """USER_CACHE_TIMEOUT이 0이면 request.user는 token claim으로 만든다."""
+
+    @pytest.fixture(autouse=True)
+    def without_user_cache(self, settings):
+        settings.USER_CACHE_TIMEOUT = 0
+
+    def test_id_only_access_makes_no_queries(
+        self, verified_user, django_assert_num_queries
+    ):
+        token = RefreshToken.for_user(verified_user).access_token
+
+        with django_assert_num_queries(0):
+            user = authenticate(token)
+            assert isinstance(user, CustomUser)
+            assert user.pk == verified_user.pk
+            assert user.is_authenticated
+
+    def test_membership_filter_uses_claim_pk(
+        self, verified_user, django_assert_num_queries
+    ):
+        user = authenticate(RefreshToken.for_user(verified_user).access_token)
+
+        with django_assert_num_queries(1):
+            assert not user.organization_memberships.exists()
+
+    def test_row_is_loaded_with_one_query(
+        self, verified_user, django_assert_num_queries
+    ):
+        user = authenticate(RefreshToken.for_user(verified_user).access_token)
+
+        with django_assert_num_queries(1):
+            assert user.email == verified_user.email
+            assert user.email_verified
+            assert user.first_name == verified_user.first_name
+            assert user.is_active
+
+    def test_deleted_user_fails_on_load(self, verified_user):
+        token = RefreshToken.for_user(verified_user).access_token
+        verified_user.delete()
+        user = authenticate(token)
+
+        with pytest.raises(AuthenticationFailed):
+            user.email
+
+    def test_revoked_generation_fails_on_every_load(self, verified_user):
+        token = RefreshToken.for_user(verified_user).access_token
+        invalidate_all_tokens(verified_user)
+        user = authenticate(token)
+
+        with pytest.raises(AuthenticationFailed):
+            user.email
+        with pytest.raises(AuthenticationFailed):
+            user.email
+
+    def test_check_claim_user_makes_revoked_user_anonymous(self, verified_user):
+        token = RefreshToken.for_user(verified_user).access_token
+        invalidate_all_tokens(verified_user)
+        request = RequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        JWTAuthenticationMiddleware(lambda request: None)(request)
+
+        check_claim_user(request)
+
+        assert not request.user.is_authenticated
+
+    def test_me_query(self, api_client, verified_user):
+        refresh = RefreshToken.for_user(verified_user)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
+
+        data = post_graphql(api_client, "{ me { email } }")
+
+        assert data["data"]["me"]["email"] == verified_user.email
+
+    def test_revoked_token_cannot_read_user_fields(self, api_client, verified_user):
+        refresh = RefreshToken.for_user(verified_user)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
+        invalidate_all_tokens(verified_user)
+
+        data = post_graphql(api_client, "{ me { email } }")
+
+        assert data["data"]["me"] is None
+        assert data["errors"]
+
+    def test_revoked_token_cannot_mutate(self, api_client, verified_user):
+        refresh = RefreshToken.for_user(verified_user)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
+        invalidate_all_tokens(verified_user)
+
+        data = post_graphql(api_client, CREATE_ORGANIZATION)
+
+        assert data["errors"][0]["message"] == "로그인이 필요합니다."
+        assert not Organization.objects.exists()
+
+
+@pytest.mark.django_db
+class TestMiddlewareWithUserCache:
+    @pytest.fixture(autouse=True)
+    def with_user_cache(self, settings):
+        settings.USER_CACHE_TIMEOUT = 60
+
+    def test_cached_user_is_loaded_once(self, verified_user, django_assert_num_queries):
+        token = RefreshToken.for_user(verified_user).access_token
+        authenticate(token)
+
+        with django_assert_num_queries(0):
+            assert authenticate(token).email == verified_user.email
+
+    def test_deleted_user_is_anonymous(self, verified_user):
+        token = RefreshToken.for_user(verified_user).access_token
+        verified_user.delete()
+
+        assert not authenticate(token).is_authenticated
+
+    def test_revoked_generation_is_anonymous(self, verified_user):
+        token = RefreshToken.for_user(verified_user).access_token
+        invalidate_all_tokens(verified_user)
+
+        assert not authenticate(token).is_authenticated
+
+
+@pytest.mark.django_db
+class TestVerifiedTokenCache:
+    def authenticate(self, middleware, token):
+        request = RequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        middleware(request)
+        return request.user
+
+    def count_verifications(self, monkeypatch, middleware):
+        calls = []
+        verify = middleware.jwt_auth.get_validated_token
+
+        def counting(raw_token):
+            calls.append(raw_token)
+            return verify(raw_token)
+
+        monkeypatch.setattr(middleware.jwt_auth, "get_validated_token", counting)
+        return calls
+
+    def test_same_token_is_verified_once(self, monkeypatch, verified_user):
+        middleware = JWTAuthenticationMiddleware(lambda request: None)
+        calls = self.count_verifications(monkeypatch, middleware)
+        token = RefreshToken.for_user(verified_user).access_token
+
+        for _ in range(3):
+            assert self.authenticate(middleware, token).pk == verified_user.pk
+
+        assert len(calls) == 1
+
+    def test_disabled(self, monkeypatch, settings, verified_user):
+        settings.JWT_VERIFIED_TOKEN_CACHE_SIZE = 0
+        middleware = JWTAuthenticationMiddleware(lambda request: None)
+        calls = self.count_verifications(monkeypatch, middleware)
+        token = RefreshToken.for_user(verified_user).access_token
+
+        self.authenticate(middleware, token)
+        self.authenticate(middleware, token)
+
+        assert len(calls) == 2
+
+    def test_cached_token_still_checks_generation(self, verified_user):
+        middleware = JWTAuthenticationMiddleware(lambda request: None)
+        token = RefreshToken.for_user(verified_user).access_token
+        assert self.authenticate(middleware, token).is_authenticated
+
+        invalidate_all_tokens(verified_user)
+
+        with pytest.raises(AuthenticationFailed):
+            self.authenticate(middleware, token).email
+
+    def test_entries_expire_with_token(self, monkeypatch, verified_user):
+        middleware = JWTAuthenticationMiddleware(lambda request: None)
+        token = RefreshToken.for_user(verified_user).access_token
+        self.authenticate(middleware, token)
+
+        monkeypatch.setattr("users.cache.time.time", lambda: token["exp"] + 1)
+
+        assert verified_token_cache.get(str(token)) is None
+
+
+@pytest.mark.django_db
+class TestAsyncJWTAuthenticationMiddleware:
+    def make_middleware(self):
+        async def get_response(request):
+            return request.user
+
+        return JWTAuthenticationMiddleware(get_response)
+
+    def authenticate(self, token):
+        request = RequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        return async_to_sync(self.make_middleware())(request)
+
+    def test_async_get_response_makes_middleware_async(self):
+        assert iscoroutinefunction(self.make_middleware())
+
+    def test_authenticates_user(self, verified_user):
+        user = self.authenticate(RefreshToken.for_user(verified_user).access_token)
+
+        assert user.pk == verified_user.pk
+        assert user.email == verified_user.email
+
+    def test_revoked_generation_is_anonymous(self, verified_user):
+        token = RefreshToken.for_user(verified_user).access_token
+        invalidate_all_tokens(verified_user)
+
+        assert not self.authenticate(token).is_authenticated
+
+    def test_invalid_token_is_anonymous(self):
+        assert not self.authenticate("invalid-token").is_authenticated
+
+    def test_without_user_cache_loads_user(self, settings, verified_user):
+        settings.USER_CACHE_TIMEOUT = 0
+
+        user = self.authenticate(RefreshToken.for_user(verified_user).access_token)
+
+        assert isinstance(user, CustomUser)
+        assert user.email == verified_user.email
+
+    def test_asgi_request(self, verified_user):
+        token = RefreshToken.for_user(verified_user).access_token
+        response = async_to_sync(AsyncClient().post)(
+            reverse("graphql-async"),
+            json.dumps({"query": "{ me { email } }"}),
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.json()["data"]["me"]["email"] == verified_user.email
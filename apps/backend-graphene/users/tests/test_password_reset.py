@@ -1,7 +1,10 @@
+from io import StringIO
+
 import pytest
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
 from django.core import mail
+from django.core.management import call_command
 from django.urls import reverse
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
@@ -20,6 +23,7 @@ class TestPasswordResetRequestView:
             RESET_REQUEST_URL, {"email": verified_user.email}, format="json"
         )
         assert response.status_code == 200
+        call_command("send_queued_emails", "--once", stdout=StringIO())
         assert len(mail.outbox) == 1
 
     def test_reset_request_nonexistent_email(self, api_client):
@@ -27,6 +31,7 @@ class TestPasswordResetRequestView:
             RESET_REQUEST_URL, {"email": "ghost@example.com"}, format="json"
         )
         assert response.status_code == 200  # 보안: 성공 응답
+        call_command("send_queued_emails", "--once", stdout=StringIO())
         assert len(mail.outbox) == 0
 
 
@@ -1,7 +1,9 @@
 import io
 import tempfile
+from io import StringIO
 
 import pytest
+from django.core.management import call_command
 from django.urls import reverse
 from PIL import Image
 
@@ -80,7 +82,9 @@ class TestUserProfileImageView:
         verified_user.refresh_from_db()
         assert not verified_user.profile_image
 
-    def test_replace_deletes_old_file(self, auth_client, verified_user, settings):
+    def test_replace_keeps_old_file_until_collected(
+        self, auth_client, verified_user, settings
+    ):
         import os
 
         media_root = tempfile.mkdtemp()
@@ -91,11 +95,13 @@ class TestUserProfileImageView:
         verified_user.refresh_from_db()
         old_full_path = os.path.join(media_root, verified_user.profile_image.name)
         assert os.path.exists(old_full_path)
-        # Upload second image with different name
+        # Upload second image with different content
         image2 = create_test_image(format="PNG")
         response = auth_client.put(
             PROFILE_IMAGE_URL, {"image": image2}, format="multipart"
         )
         assert response.status_code == 200
-        # Old file should be deleted
+        # Old file is removed by garbage collection
+        assert os.path.exists(old_full_path)
+        call_command("collect_profile_images", "--grace-period=0", stdout=StringIO())
         assert not os.path.exists(old_full_path)
@@ -0,0 +1,175 @@
+import os
+import tempfile
+import time
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from conftest import make_auth_client
+from users.images import collect_profile_images, generate_pending_thumbnails
+from users.tests.test_profile_image import PROFILE_IMAGE_URL, create_test_image
+
+
+@pytest.fixture
+def media_root(settings):
+    settings.MEDIA_ROOT = tempfile.mkdtemp()
+    return settings.MEDIA_ROOT
+
+
+def upload(client, **kwargs):
+    response = client.put(
+        PROFILE_IMAGE_URL, {"image": create_test_image(**kwargs)}, format="multipart"
+    )
+    assert response.status_code == 200
+    return response
+
+
+def file_url(name):
+    return reverse("profile-image-file", kwargs={"name": name})
+
+
+def age(path, seconds):
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.mark.django_db
+class TestContentAddressedStorage:
+    def test_name_is_content_hash(self, auth_client, verified_user, media_root):
+        upload(auth_client)
+
+        verified_user.refresh_from_db()
+        directory, filename = verified_user.profile_image.name.rsplit("/", 1)
+        digest, extension = filename.split(".")
+        assert directory == f"profile_images/{digest[:2]}"
+        assert len(digest) == 64
+        assert extension == "jpg"
+
+    def test_identical_uploads_share_one_file(
+        self, auth_client, verified_user, user_factory, media_root
+    ):
+        other = user_factory(email_verified=True)
+        upload(auth_client)
+        upload(make_auth_client(other))
+
+        verified_user.refresh_from_db()
+        other.refresh_from_db()
+        assert other.profile_image.name == verified_user.profile_image.name
+        path = os.path.dirname(verified_user.profile_image.path)
+        assert len(os.listdir(path)) == 1
+
+    def test_reupload_of_same_image_keeps_thumbnails(
+        self, auth_client, verified_user, media_root
+    ):
+        upload(auth_client)
+        generate_pending_thumbnails(batch_size=10)
+
+        upload(auth_client)
+
+        verified_user.refresh_from_db()
+        assert verified_user.profile_thumbnails
+
+
+@pytest.mark.django_db
+class TestProfileImageFileView:
+    def test_serves_immutable_with_etag(self, auth_client, verified_user, media_root):
+        upload(auth_client)
+        verified_user.refresh_from_db()
+        name = verified_user.profile_image.name
+
+        response = auth_client.get(file_url(name))
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "image/jpeg"
+        assert "immutable" in response["Cache-Control"]
+        assert "max-age=31536000" in response["Cache-Control"]
+        digest = os.path.splitext(os.path.basename(name))[0]
+        assert response["ETag"] == f'"{digest}"'
+
+    def test_if_none_match_returns_304(self, auth_client, verified_user, media_root):
+        upload(auth_client)
+        verified_user.refresh_from_db()
+        url = file_url(verified_user.profile_image.name)
+        etag = auth_client.get(url)["ETag"]
+
+        response = auth_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+    def test_missing_file_returns_404(self, api_client, media_root):
+        response = api_client.get(file_url(f"profile_images/ab/{'ab' * 32}.png"))
+
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestCollectProfileImages:
+    def test_deletes_only_unreferenced_files(
+        self, auth_client, verified_user, media_root
+    ):
+        upload(auth_client)
+        generate_pending_thumbnails(batch_size=10)
+        verified_user.refresh_from_db()
+        old_names = [
+            verified_user.profile_image.name,
+            *verified_user.profile_thumbnails.values(),
+        ]
+        upload(auth_client, format="PNG")
+        verified_user.refresh_from_db()
+
+        deleted = collect_profile_images(grace_period=0)
+
+        assert sorted(deleted) == sorted(old_names)
+        assert os.path.exists(verified_user.profile_image.path)
+
+    def test_shared_file_survives_while_referenced(
+        self, auth_client, verified_user, user_factory, media_root
+    ):
+        other = user_factory(email_verified=True)
+        upload(auth_client)
+        upload(make_auth_client(other))
+        auth_client.delete(PROFILE_IMAGE_URL)
+
+        assert collect_profile_images(grace_period=0) == []
+        other.refresh_from_db()
+        assert os.path.exists(other.profile_image.path)
+
+    def test_keeps_recent_files(self, auth_client, verified_user, media_root):
+        upload(auth_client)
+        verified_user.refresh_from_db()
+        path = verified_user.profile_image.path
+        auth_client.delete(PROFILE_IMAGE_URL)
+
+        assert collect_profile_images(grace_period=3600) == []
+        age(path, 7200)
+        assert len(collect_profile_images(grace_period=3600)) == 1
+        assert not os.path.exists(path)
+
+    def test_dedup_hit_refreshes_grace_period(
+        self, auth_client, verified_user, media_root
+    ):
+        upload(auth_client)
+        verified_user.refresh_from_db()
+        path = verified_user.profile_image.path
+        age(path, 7200)
+
+        auth_client.delete(PROFILE_IMAGE_URL)
+        upload(auth_client)
+        auth_client.delete(PROFILE_IMAGE_URL)
+
+        assert collect_profile_images(grace_period=3600) == []
+
+    def test_command_dry_run(self, auth_client, verified_user, media_root):
+        upload(auth_client)
+        verified_user.refresh_from_db()
+        auth_client.delete(PROFILE_IMAGE_URL)
+        out = StringIO()
+
+        call_command(
+            "collect_profile_images", "--grace-period=0", "--dry-run", stdout=out
+        )
+
+        assert verified_user.profile_image.name in out.getvalue()
+        assert os.path.exists(verified_user.profile_image.path)
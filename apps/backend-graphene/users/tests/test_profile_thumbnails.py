@@ -0,0 +1,176 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from PIL import Image
+
+from conftest import make_auth_client
+from organizations.models import OrganizationMembership, Role
+from organizations.tests.factories import OrganizationFactory
+from users.images import generate_pending_thumbnails, generate_profile_thumbnails
+from users.tests.test_profile_image import PROFILE_IMAGE_URL, create_test_image
+
+GRAPHQL_URL = reverse("graphql")
+
+THUMBNAIL_QUERY = """
+    query {
+        me {
+            profileImage
+            small: profileImageThumbnail(size: 32)
+            medium: profileImageThumbnail(size: 48)
+            large: profileImageThumbnail(size: 1024)
+        }
+    }
+"""
+
+
+@pytest.fixture
+def media_root(settings):
+    settings.MEDIA_ROOT = tempfile.mkdtemp()
+    return settings.MEDIA_ROOT
+
+
+def upload(client, **kwargs):
+    response = client.put(
+        PROFILE_IMAGE_URL, {"image": create_test_image(**kwargs)}, format="multipart"
+    )
+    assert response.status_code == 200
+
+
+def query_me(client):
+    response = client.post(
+        GRAPHQL_URL,
+        data=json.dumps({"query": THUMBNAIL_QUERY}),
+        content_type="application/json",
+    )
+    return response.json()["data"]["me"]
+
+
+@pytest.mark.django_db
+class TestProfileThumbnails:
+    def test_upload_leaves_thumbnails_to_worker(
+        self, auth_client, verified_user, media_root
+    ):
+        upload(auth_client)
+
+        verified_user.refresh_from_db()
+        assert verified_user.profile_thumbnails is None
+        # 썸네일이 생기기 전에는 원본을 돌려준다.
+        me = query_me(auth_client)
+        assert me["small"] == me["profileImage"]
+
+    def test_worker_generates_webp_thumbnails(
+        self, auth_client, verified_user, media_root
+    ):
+        upload(auth_client, size=(300, 200))
+
+        call_command("generate_profile_thumbnails", "--once", stdout=StringIO())
+
+        verified_user.refresh_from_db()
+        assert set(verified_user.profile_thumbnails) == {"32", "64", "256"}
+        for size, name in verified_user.profile_thumbnails.items():
+            with Image.open(os.path.join(media_root, name)) as image:
+                assert image.format == "WEBP"
+                assert image.size == (int(size), int(size))
+
+    def test_type_exposes_size_specific_urls(
+        self, auth_client, verified_user, media_root
+    ):
+        upload(auth_client)
+        generate_pending_thumbnails(batch_size=10)
+
+        me = query_me(auth_client)
+        verified_user.refresh_from_db()
+        thumbnails = verified_user.profile_thumbnails
+        assert me["small"].endswith(thumbnails["32"])
+        assert me["medium"].endswith(thumbnails["64"])
+        assert me["large"].endswith(thumbnails["256"])
+
+    def test_reuses_existing_thumbnails(
+        self, auth_client, user_factory, verified_user, media_root
+    ):
+        upload(auth_client)
+        generate_pending_thumbnails(batch_size=10)
+        other = user_factory(email_verified=True)
+        upload(make_auth_client(other))
+
+        with mock.patch("users.images.make_thumbnail") as make_thumbnail:
+            assert generate_pending_thumbnails(batch_size=10) == (1, 0)
+
+        make_thumbnail.assert_not_called()
+        verified_user.refresh_from_db()
+        other.refresh_from_db()
+        assert other.profile_thumbnails == verified_user.profile_thumbnails
+
+    def test_stale_result_is_not_recorded(self, auth_client, verified_user, media_root):
+        upload(auth_client)
+        stale = type(verified_user).objects.get(pk=verified_user.pk)
+        # 썸네일을 만드는 동안 다른 이미지로 바뀐 경우
+        type(verified_user).objects.filter(pk=verified_user.pk).update(
+            profile_image="profile_images/other.png"
+        )
+
+        assert generate_profile_thumbnails(stale) is False
+
+        verified_user.refresh_from_db()
+        assert verified_user.profile_thumbnails is None
+
+    def test_unreadable_image_falls_back_to_original(
+        self, auth_client, verified_user, media_root
+    ):
+        upload(auth_client)
+        verified_user.refresh_from_db()
+        with open(verified_user.profile_image.path, "wb") as f:
+            f.write(b"not an image")
+
+        assert generate_pending_thumbnails(batch_size=10) == (0, 1)
+
+        verified_user.refresh_from_db()
+        assert verified_user.profile_thumbnails == {}
+        me = query_me(auth_client)
+        assert me["large"] == me["profileImage"]
+
+    def test_users_without_image_are_not_pending(self, verified_user):
+        assert generate_pending_thumbnails(batch_size=10) == (0, 0)
+
+    def test_thumbnails_of_nested_users_add_no_queries(
+        self, auth_client, verified_user, user_factory, django_assert_num_queries
+    ):
+        organization = OrganizationFactory(created_by=verified_user)
+        OrganizationMembership.objects.create(
+            organization=organization, user=verified_user, role=Role.OWNER
+        )
+        for _ in range(10):
+            OrganizationMembership.objects.create(
+                organization=organization,
+                user=user_factory(
+                    profile_image="profile_images/a.png",
+                    profile_thumbnails={"32": "profile_images/a_32.webp"},
+                ),
+                role=Role.MEMBER,
+            )
+        query = """
+            query {
+                myOrganizations {
+                    members { user { email profileImageThumbnail(size: 32) } }
+                }
+            }
+        """
+
+        # organizations, memberships(+user JOIN)
+        with django_assert_num_queries(2):
+            response = auth_client.post(
+                GRAPHQL_URL,
+                data=json.dumps({"query": query}),
+                content_type="application/json",
+            )
+
+        members = response.json()["data"]["myOrganizations"][0]["members"]
+        thumbnails = [member["user"]["profileImageThumbnail"] for member in members]
+        assert len(thumbnails) == 11
+        assert sum(bool(url and url.endswith("a_32.webp")) for url in thumbnails) == 10
@@ -1,6 +1,9 @@
+from io import StringIO
+
 import pytest
 from django.contrib.auth import get_user_model
 from django.core import mail
+from django.core.management import call_command
 from django.urls import reverse
 
 User = get_user_model()
@@ -37,6 +40,9 @@ class TestRegisterView:
             "password_confirm": "StrongPass123!",
         }
         api_client.post(REGISTER_URL, data, format="json")
+        # 요청은 outbox에 쌓기만 하고, worker가 보낸다.
+        assert len(mail.outbox) == 0
+        call_command("send_queued_emails", "--once", stdout=StringIO())
         assert len(mail.outbox) == 1
         assert mail.outbox[0].to == ["verify@example.com"]
 
@@ -0,0 +1,72 @@
+import pytest
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import RefreshToken as BaseRefreshToken
+
+from users.tokens import TOKEN_GENERATION_CLAIM, RefreshToken
+from users.utils import invalidate_all_tokens
+
+REFRESH_URL = reverse("users:token-refresh")
+PROFILE_IMAGE_URL = reverse("users:profile-image")
+
+
+@pytest.mark.django_db
+class TestTokenGeneration:
+    def test_tokens_carry_generation(self, verified_user):
+        refresh = RefreshToken.for_user(verified_user)
+
+        assert refresh[TOKEN_GENERATION_CLAIM] == 0
+        assert refresh.access_token[TOKEN_GENERATION_CLAIM] == 0
+
+    def test_invalidate_is_a_single_update(
+        self, verified_user, django_assert_num_queries
+    ):
+        for _ in range(5):
+            RefreshToken.for_user(verified_user)
+
+        # UPDATE, 새 token_generation 조회
+        with django_assert_num_queries(2):
+            invalidate_all_tokens(verified_user)
+
+        assert verified_user.token_generation == 1
+
+    def test_revoked_access_token_rejected_by_rest_views(
+        self, api_client, verified_user
+    ):
+        refresh = RefreshToken.for_user(verified_user)
+        invalidate_all_tokens(verified_user)
+
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
+        response = api_client.delete(PROFILE_IMAGE_URL)
+
+        assert response.status_code == 401
+
+    def test_revoked_refresh_token_cannot_refresh(self, api_client, verified_user):
+        refresh = RefreshToken.for_user(verified_user)
+        invalidate_all_tokens(verified_user)
+
+        response = api_client.post(
+            REFRESH_URL, {"refresh": str(refresh)}, format="json"
+        )
+
+        assert response.status_code == 401
+
+    def test_new_tokens_after_invalidate_are_valid(self, api_client, verified_user):
+        invalidate_all_tokens(verified_user)
+        refresh = RefreshToken.for_user(verified_user)
+
+        response = api_client.post(
+            REFRESH_URL, {"refresh": str(refresh)}, format="json"
+        )
+
+        assert response.status_code == 200
+
+    def test_token_without_claim_is_generation_zero(self, api_client, verified_user):
+        legacy = BaseRefreshToken.for_user(verified_user)
+
+        response = api_client.post(REFRESH_URL, {"refresh": str(legacy)}, format="json")
+        assert response.status_code == 200
+
+        invalidate_all_tokens(verified_user)
+        legacy = BaseRefreshToken.for_user(verified_user)
+        response = api_client.post(REFRESH_URL, {"refresh": str(legacy)}, format="json")
+        assert response.status_code == 401
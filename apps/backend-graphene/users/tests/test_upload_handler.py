@@ -0,0 +1,148 @@
+import io
+import tempfile
+from unittest import mock
+
+import pytest
+from django.test import RequestFactory
+from PIL import Image
+from rest_framework.exceptions import ValidationError
+
+from users.tests.test_profile_image import PROFILE_IMAGE_URL, create_test_image
+from users.uploads import (
+    DIMENSION_MESSAGE,
+    INVALID_MESSAGE,
+    MAX_SIZE,
+    SIZE_MESSAGE,
+    TYPE_MESSAGE,
+    ProfileImageUploadHandler,
+)
+
+
+def make_handler(content_type="image/jpeg"):
+    handler = ProfileImageUploadHandler(RequestFactory().put("/"))
+    handler.new_file("image", "test.jpg", content_type, None)
+    return handler
+
+
+def image_bytes(format="JPEG", size=(100, 100)):
+    return create_test_image(format=format, size=size).getvalue()
+
+
+def feed(handler, data, chunk_size):
+    for start in range(0, len(data), chunk_size):
+        handler.receive_data_chunk(data[start : start + chunk_size], start)
+    handler.file_complete(len(data))
+
+
+def error_message(excinfo):
+    return str(excinfo.value.detail["image"][0])
+
+
+class TestProfileImageUploadHandler:
+    def test_rejects_large_content_length_before_reading(self):
+        handler = ProfileImageUploadHandler(RequestFactory().put("/"))
+        body = mock.Mock()
+
+        with pytest.raises(ValidationError) as excinfo:
+            handler.handle_raw_input(body, {}, 10 * MAX_SIZE, b"boundary")
+
+        assert error_message(excinfo) == SIZE_MESSAGE
+        body.read.assert_not_called()
+
+    def test_rejects_disallowed_content_type(self):
+        with pytest.raises(ValidationError) as excinfo:
+            make_handler(content_type="image/gif")
+
+        assert error_message(excinfo) == TYPE_MESSAGE
+
+    def test_stops_at_chunk_exceeding_limit(self):
+        handler = make_handler()
+        chunk = image_bytes()
+        handler.receive_data_chunk(chunk, 0)
+        received = len(chunk)
+        filler = b"\0" * (64 * 1024)
+        while received + len(filler) <= MAX_SIZE:
+            handler.receive_data_chunk(filler, received)
+            received += len(filler)
+
+        with pytest.raises(ValidationError) as excinfo:
+            handler.receive_data_chunk(filler, received)
+
+        assert error_message(excinfo) == SIZE_MESSAGE
+
+    def test_rejects_wrong_magic_bytes_on_first_chunk(self):
+        handler = make_handler(content_type="image/png")
+
+        with pytest.raises(ValidationError) as excinfo:
+            handler.receive_data_chunk(b"GIF89a" + b"\0" * 100, 0)
+
+        assert error_message(excinfo) == INVALID_MESSAGE
+
+    def test_header_split_across_chunks(self):
+        handler = make_handler()
+
+        feed(handler, image_bytes(), chunk_size=64)
+
+        assert handler.inspected
+
+    def test_passes_chunks_to_next_handler(self):
+        handler = make_handler()
+        data = image_bytes()
+
+        assert handler.receive_data_chunk(data, 0) == data
+
+    def test_rejects_oversized_dimensions_from_header(self):
+        handler = make_handler(content_type="image/png")
+        data = image_bytes(format="PNG", size=(5000, 1))
+
+        with pytest.raises(ValidationError) as excinfo:
+            handler.receive_data_chunk(data[:1024], 0)
+
+        assert error_message(excinfo) == DIMENSION_MESSAGE
+
+    def test_truncated_image_is_rejected_on_complete(self):
+        handler = make_handler()
+
+        with pytest.raises(ValidationError) as excinfo:
+            feed(handler, image_bytes()[:50], chunk_size=64)
+
+        assert error_message(excinfo) == INVALID_MESSAGE
+
+
+@pytest.mark.django_db
+class TestProfileImageUploadView:
+    @pytest.fixture(autouse=True)
+    def media_root(self, settings):
+        settings.MEDIA_ROOT = tempfile.mkdtemp()
+
+    def test_disguised_file_is_rejected(self, auth_client):
+        fake = io.BytesIO(b"GIF89a" + b"\0" * 100)
+        fake.name = "fake.png"
+
+        response = auth_client.put(
+            PROFILE_IMAGE_URL, {"image": fake}, format="multipart"
+        )
+
+        assert response.status_code == 400
+        assert response.data["image"] == [INVALID_MESSAGE]
+
+    def test_oversized_dimensions_are_rejected(self, auth_client):
+        image = create_test_image(format="PNG", size=(5000, 1))
+
+        response = auth_client.put(
+            PROFILE_IMAGE_URL, {"image": image}, format="multipart"
+        )
+
+        assert response.status_code == 400
+        assert response.data["image"] == [DIMENSION_MESSAGE]
+
+    def test_upload_does_not_decode_whole_image(self, auth_client):
+        with mock.patch.object(Image.Image, "verify") as verify:
+            response = auth_client.put(
+                PROFILE_IMAGE_URL,
+                {"image": create_test_image()},
+                format="multipart",
+            )
+
+        assert response.status_code == 200
+        verify.assert_not_called()
@@ -1,4 +1,6 @@
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import RefreshToken as BaseRefreshToken
 
 
 class EmailVerificationTokenGenerator(PasswordResetTokenGenerator):
@@ -7,3 +9,31 @@ class EmailVerificationTokenGenerator(PasswordResetTokenGenerator):
 
 
 email_verification_token = EmailVerificationTokenGenerator()
+
+
+# 사용자의 token_generation을 담는 JWT claim. 값이 다른 토큰은 폐기된 것으로 본다.
+TOKEN_GENERATION_CLAIM = "gen"
+
+
+class RefreshToken(BaseRefreshToken):
+    """token_generation claim을 담는 refresh token. access token에도 복사된다."""
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token[TOKEN_GENERATION_CLAIM] = user.token_generation
+        return token
+
+
+def get_token_generation(token):
+    # claim이 없는 토큰은 token_generation 도입 전에 발급된 것이다.
+    return token.get(TOKEN_GENERATION_CLAIM, 0)
+
+
+def check_token_generation(token, generation):
+    """token의 "gen" claim이 사용자의 현재 token_generation과 다르면 거부한다."""
+    if get_token_generation(token) != generation:
+        raise AuthenticationFailed(
+            "모든 기기에서 로그아웃되어 더 이상 유효하지 않은 토큰입니다.",
+            code="token_revoked",
+        )
@@ -1,11 +1,19 @@
 import graphene
 from graphene_django import DjangoObjectType
 
+from users.images import thumbnail_url
 from users.models import CustomUser
 
 
 class UserType(DjangoObjectType):
     profile_image = graphene.String()
+    profile_image_thumbnail = graphene.String(
+        size=graphene.Int(required=True),
+        description=(
+            "size(px) 이상인 가장 작은 WebP 썸네일의 URL. "
+            "썸네일이 아직 없으면 원본 이미지 URL."
+        ),
+    )
 
     class Meta:
         model = CustomUser
@@ -20,7 +28,18 @@ class UserType(DjangoObjectType):
             "date_joined",
         ]
 
+    # thumbnail_url이 읽는 컬럼 (config.optimizer)
+    optimizer_columns = {
+        "profile_image_thumbnail": ("profile_image", "profile_thumbnails"),
+    }
+
     def resolve_profile_image(self, info):
         if not self.profile_image:
             return None
         return info.context.build_absolute_uri(self.profile_image.url)
+
+    def resolve_profile_image_thumbnail(self, info, size):
+        url = thumbnail_url(self, size)
+        if url is None:
+            return None
+        return info.context.build_absolute_uri(url)
@@ -0,0 +1,114 @@
+import io
+
+from django.core.files.uploadhandler import FileUploadHandler
+from PIL import Image
+from rest_framework import serializers
+
+ALLOWED_TYPES = ("image/jpeg", "image/png")
+ALLOWED_FORMATS = {"JPEG", "PNG"}
+MAX_SIZE = 5 * 1024 * 1024  # 5MB
+MAX_DIMENSION = 4096  # px
+# 형식별 파일 시작 바이트
+MAGIC_BYTES = {
+    "JPEG": b"\xff\xd8\xff",
+    "PNG": b"\x89PNG\r\n\x1a\n",
+}
+MAGIC_LENGTH = max(len(magic) for magic in MAGIC_BYTES.values())
+
+TYPE_MESSAGE = "JPEG 또는 PNG 파일만 허용됩니다."
+SIZE_MESSAGE = "파일 크기는 5MB를 초과할 수 없습니다."
+INVALID_MESSAGE = "유효한 이미지 파일이 아닙니다."
+DIMENSION_MESSAGE = f"이미지의 가로, 세로는 {MAX_DIMENSION}px 이하여야 합니다."
+
+
+def sniff_format(data):
+    """시작 바이트로 형식을 추정한다. 허용하지 않는 형식이면 None."""
+    for image_format, magic in MAGIC_BYTES.items():
+        if data.startswith(magic):
+            return image_format
+    return None
+
+
+def read_image_header(file):
+    """픽셀은 디코딩하지 않고 헤더만 읽어 (형식, (가로, 세로))를 반환한다.
+
+    헤더가 잘렸거나 이미지가 아니면 OSError.
+    """
+    with Image.open(file) as image:
+        return image.format, image.size
+
+
+def check_image_header(image_format, size):
+    if image_format not in ALLOWED_FORMATS:
+        raise serializers.ValidationError(TYPE_MESSAGE)
+    if max(size) > MAX_DIMENSION:
+        raise serializers.ValidationError(DIMENSION_MESSAGE)
+
+
+def reject(message):
+    raise serializers.ValidationError({"image": [message]})
+
+
+class ProfileImageUploadHandler(FileUploadHandler):
+    """프로필 이미지 업로드를 받는 도중에 검사한다.
+
+    - Content-Length가 한도를 넘으면 본문을 읽기 전에 거부한다.
+    - 받은 바이트가 MAX_SIZE를 넘는 순간 읽기를 멈춘다.
+    - 첫 chunk의 시작 바이트와 이미지 헤더로 형식과 크기를 확인한다.
+    검사를 통과한 chunk는 다음 handler(메모리/임시 파일)로 넘긴다.
+    거부할 때는 ValidationError를 던지므로 남은 본문은 읽지 않는다.
+    """
+
+    # 파일 외 multipart 경계와 헤더에 쓰이는 여유분
+    BODY_OVERHEAD = 64 * 1024
+    # 이미지 헤더를 찾을 때 모아 둘 최대 바이트 수 (JPEG는 EXIF 뒤에 크기가 있다)
+    HEADER_LIMIT = 256 * 1024
+
+    def handle_raw_input(
+        self, input_data, meta, content_length, boundary, encoding=None
+    ):
+        if content_length and content_length > MAX_SIZE + self.BODY_OVERHEAD:
+            reject(SIZE_MESSAGE)
+
+    def new_file(self, field_name, file_name, content_type, *args, **kwargs):
+        super().new_file(field_name, file_name, content_type, *args, **kwargs)
+        if content_type not in ALLOWED_TYPES:
+            reject(TYPE_MESSAGE)
+        self.received = 0
+        self.header = b""
+        self.inspected = False
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.received > MAX_SIZE:
+            reject(SIZE_MESSAGE)
+        if not self.inspected:
+            self.header += raw_data
+            self.inspect(final=len(self.header) >= self.HEADER_LIMIT)
+        return raw_data
+
+    def file_complete(self, file_size):
+        if not self.inspected:
+            self.inspect(final=True)
+        return None
+
+    def inspect(self, final):
+        """지금까지 받은 앞부분으로 형식과 크기를 확인한다.
+
+        헤더가 아직 다 오지 않았으면 final일 때만 거부한다.
+        """
+        if len(self.header) >= MAGIC_LENGTH or final:
+            if sniff_format(self.header) is None:
+                reject(INVALID_MESSAGE)
+        try:
+            image_format, size = read_image_header(io.BytesIO(self.header))
+        except (OSError, Image.DecompressionBombError):
+            if final:
+                reject(INVALID_MESSAGE)
+            return
+        try:
+            check_image_header(image_format, size)
+        except serializers.ValidationError as e:
+            reject(e.detail[0])
+        self.inspected = True
+        self.header = b""
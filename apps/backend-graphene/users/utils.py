@@ -1,13 +1,11 @@
 from django.conf import settings
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import send_mail
+from django.db.models import F
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
-from rest_framework_simplejwt.token_blacklist.models import (
-    BlacklistedToken,
-    OutstandingToken,
-)
 
+from outbox.utils import enqueue_email
+from users.cache import invalidate_user_cache
 from users.tokens import email_verification_token
 
 
@@ -16,7 +14,7 @@ def send_verification_email(user):
     token = email_verification_token.make_token(user)
     base = f"{settings.FRONTEND_URL}{settings.FRONTEND_VERIFY_EMAIL_PATH}"
     verification_url = f"{base}?uid={uid}&token={token}"
-    send_mail(
+    enqueue_email(
         subject="이메일 인증을 완료해주세요",
         message=f"다음 링크를 클릭하여 이메일을 인증해주세요: {verification_url}",
         from_email=None,
@@ -25,16 +23,16 @@ def send_verification_email(user):
 
 
 def invalidate_all_tokens(user):
-    outstanding_tokens = OutstandingToken.objects.filter(user=user)
-    existing = set(
-        BlacklistedToken.objects.filter(token__in=outstanding_tokens).values_list(
-            "token_id", flat=True
-        )
-    )
-    BlacklistedToken.objects.bulk_create(
-        [BlacklistedToken(token=t) for t in outstanding_tokens if t.id not in existing],
-        ignore_conflicts=True,
+    """token_generation을 올려 이 사용자에게 발급된 모든 JWT를 무효화한다.
+
+    발급된 토큰 수와 상관없이 UPDATE 한 번이다. 새 토큰을 발급할 수 있도록
+    user의 token_generation도 갱신한다.
+    """
+    type(user).objects.filter(pk=user.pk).update(
+        token_generation=F("token_generation") + 1
     )
+    user.refresh_from_db(fields=["token_generation"])
+    invalidate_user_cache(user.pk)
 
 
 def send_password_reset_email(user):
@@ -42,7 +40,7 @@ def send_password_reset_email(user):
     token = default_token_generator.make_token(user)
     base = f"{settings.FRONTEND_URL}{settings.FRONTEND_RESET_PASSWORD_PATH}"
     reset_url = f"{base}?uid={uid}&token={token}"
-    send_mail(
+    enqueue_email(
         subject="비밀번호를 초기화해주세요",
         message=f"다음 링크를 클릭하여 비밀번호를 초기화해주세요: {reset_url}",
         from_email=None,
@@ -1,13 +1,20 @@
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.http import FileResponse, Http404
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import etag, require_safe
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.exceptions import TokenError
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, TokenError
 
+from users.images import (
+    profile_image_storage,
+    store_profile_image,
+)
 from users.serializers import (
     DetailResponseSerializer,
     LoginResponseSerializer,
@@ -23,6 +30,8 @@ from users.serializers import (
     TokenResponseSerializer,
     VerifyEmailSerializer,
 )
+from users.tokens import RefreshToken, check_token_generation
+from users.uploads import ProfileImageUploadHandler
 from users.utils import (
     invalidate_all_tokens,
     send_password_reset_email,
@@ -44,8 +53,10 @@ class RegisterView(APIView):
     def post(self, request):
         serializer = RegisterSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        user = serializer.save()
-        send_verification_email(user)
+        # 인증 메일은 outbox에 쌓이므로 사용자 생성과 함께 커밋된다.
+        with transaction.atomic():
+            user = serializer.save()
+            send_verification_email(user)
         return Response(
             {"detail": "회원가입이 완료되었습니다. 이메일을 확인해주세요."},
             status=status.HTTP_201_CREATED,
@@ -135,8 +146,9 @@ class LogoutView(APIView):
         try:
             token = RefreshToken(refresh_token)
             user = User.objects.get(id=token["user_id"])
+            check_token_generation(token, user.token_generation)
             invalidate_all_tokens(user)
-        except TokenError:
+        except (TokenError, AuthenticationFailed):
             return Response(
                 {"detail": "유효하지 않은 토큰입니다."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -222,13 +234,18 @@ class UserProfileImageView(APIView):
         responses={200: ProfileImageUploadResponseSerializer},
     )
     def put(self, request):
+        # request.data를 읽기 전에 등록해야 본문을 받는 도중에 거부할 수 있다.
+        request.upload_handlers.insert(0, ProfileImageUploadHandler(request))
         serializer = ProfileImageSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         user = request.user
-        if user.profile_image:
-            user.profile_image.delete(save=False)
-        user.profile_image = serializer.validated_data["image"]
-        user.save(update_fields=["profile_image"])
+        name = store_profile_image(serializer.validated_data["image"])
+        if user.profile_image.name != name:
+            # 이전 파일은 다른 사용자도 참조할 수 있으므로 collect_profile_images가
+            # 지운다. 썸네일은 generate_profile_thumbnails worker가 만든다.
+            user.profile_image = name
+            user.profile_thumbnails = None
+            user.save(update_fields=["profile_image", "profile_thumbnails"])
         response_serializer = ProfileImageUploadResponseSerializer(
             {
                 "detail": "프로필 이미지가 업로드되었습니다.",
@@ -245,7 +262,30 @@ class UserProfileImageView(APIView):
     def delete(self, request):
         user = request.user
         if user.profile_image:
-            user.profile_image.delete(save=False)
             user.profile_image = None
-            user.save(update_fields=["profile_image"])
+            user.profile_thumbnails = None
+            user.save(update_fields=["profile_image", "profile_thumbnails"])
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+# 내용 주소 파일은 내용이 바뀌지 않으므로 1년 동안 다시 확인하지 않아도 된다.
+PROFILE_IMAGE_MAX_AGE = 365 * 24 * 60 * 60
+
+
+def profile_image_etag(request, name, digest):
+    return digest
+
+
+@require_safe
+@etag(profile_image_etag)
+def profile_image_file(request, name, digest):
+    """내용 주소 프로필 이미지를 immutable 캐시 헤더와 함께 응답한다."""
+    try:
+        file = profile_image_storage().open(name)
+    except FileNotFoundError:
+        raise Http404
+    response = FileResponse(file)
+    patch_cache_control(
+        response, public=True, max_age=PROFILE_IMAGE_MAX_AGE, immutable=True
+    )
+    return response